@@ -6,10 +6,6 @@ import socket
 import threading
 import random
 import traceback
-import math
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import matplotlib
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Iterable
 from datetime import datetime
@@ -25,11 +21,9 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
-CRLF = b"\r\n"
+from uploader_charts import load_pyplot
 
-# ---- 한글 폰트 설정 (Windows 기준: 맑은 고딕) ----
-plt.rcParams["font.family"] = "Malgun Gothic"   # 윈도우 기본 한글폰트
-plt.rcParams["axes.unicode_minus"] = False      # 마이너스 깨짐 방지
+CRLF = b"\r\n"
 
 
 # ------------------ Core HTTP ------------------
@@ -883,6 +877,7 @@ class UploaderGUI(QWidget):
             else:
                 avg_rt[s] = 0.0
 
+        plt = load_pyplot()  # matplotlib 은 여기서 처음 import
         fig, axes = plt.subplots(3, 1, figsize=(10, 10), sharex=True)
 
         # 1. 트래픽
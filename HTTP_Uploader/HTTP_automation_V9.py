@@ -1,18 +1,10 @@
 import sys
 import os
-import gzip
-import shutil
 import time
-import socket
 import threading
-import random
 import traceback
-import math
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import matplotlib
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Iterable
+import multiprocessing
+from typing import Dict, List, Optional
 from datetime import datetime
 from collections import deque
 
@@ -20,538 +12,25 @@ from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QPalette, QColor
 from PySide6.QtWidgets import (
     QApplication, QWidget, QGridLayout, QLabel, QLineEdit, QPushButton,
-    QTextEdit, QFileDialog, QComboBox, QSpinBox, QCheckBox,
+    QFileDialog, QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
     QGroupBox, QRadioButton, QPlainTextEdit, QListWidget, QHBoxLayout,
     QVBoxLayout, QScrollArea, QTableWidget, QTableWidgetItem,
     QMessageBox,
 )
 
-CRLF = b"\r\n"
-
-# ---- 한글 폰트 설정 (Windows 기준: 맑은 고딕) ----
-plt.rcParams["font.family"] = "Malgun Gothic"   # 윈도우 기본 한글폰트
-plt.rcParams["axes.unicode_minus"] = False      # 마이너스 깨짐 방지
-
-
-# ------------------ Core HTTP ------------------
-
-@dataclass
-class ClientOptions:
-    host: str
-    port: int
-    path: str
-    method: str  # POST/PUT/PATCH/DELETE
-    keep_alive: bool
-    use_chunked: bool
-    chunk_size: int
-    chunk_ext: str
-    use_gzip: bool
-    use_multipart: bool
-    extra_headers: Dict[str, str]
-    trailing_headers: Dict[str, str]
-    connect_timeout: float = 5.0
-    read_timeout: float = 5.0
-    fire_and_go: bool = True
-    http_version: str = "HTTP/1.1"
-    body_text: Optional[bytes] = None
-    file_path: Optional[str] = None
-    multipart_field_name: str = "file"
-    multipart_text_fields: Dict[str, str] = field(default_factory=dict)
-    multipart_filename_override: Optional[str] = None
-    add_x_filename_header: bool = True  # non-multipart 파일명 힌트
-    delay_between: float = 0.0          # 전송 간 대기(초)
-
-
-def parse_kv_lines(raw: str) -> Dict[str, str]:
-    d: Dict[str, str] = {}
-    for line in raw.splitlines():
-        line = line.strip()
-        if not line or ":" not in line:
-            continue
-        k, v = line.split(":", 1)
-        d[k.strip()] = v.strip()
-    return d
-
-
-def build_request_line_and_base_headers(opts: ClientOptions, host_header: Optional[str] = None) -> bytearray:
-    first = f"{opts.method} {opts.path} {opts.http_version}".encode("ascii")
-    buf = bytearray(first + CRLF)
-    host_val = host_header if host_header else f"{opts.host}:{opts.port}"
-    buf += f"Host: {host_val}".encode("ascii") + CRLF
-    buf += (b"Connection: keep-alive" if opts.keep_alive else b"Connection: close") + CRLF
-    return buf
-
-
-def add_header_lines(buf: bytearray, headers: Dict[str, str]):
-    for k, v in headers.items():
-        buf += f"{k}: {v}".encode("utf-8") + CRLF
-
-
-def gzip_bytes(data: bytes) -> bytes:
-    return gzip.compress(data)
-
-
-def iter_file_chunks(path: str, chunk_size: int) -> Iterable[bytes]:
-    with open(path, "rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            yield chunk
-
-
-def multipart_iter(
-    filespec: Tuple[str, Optional[str], Iterable[bytes]],
-    boundary: str,
-    text_fields: Dict[str, str],
-    filename_override: Optional[str],
-    field_name: str,
-) -> Iterable[bytes]:
-    # 텍스트 필드
-    for k, v in text_fields.items():
-        yield f"--{boundary}\r\n".encode()
-        yield f'Content-Disposition: form-data; name="{k}"\r\n\r\n'.encode()
-        yield v.encode("utf-8")
-        yield CRLF
-
-    # 파일 파트
-    file_path, mime, stream_iter = filespec
-    filename = filename_override or (os.path.basename(file_path) if file_path else "blob")
-    mime = mime or "application/octet-stream"
-    yield f"--{boundary}\r\n".encode()
-    yield f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'.encode()
-    yield f"Content-Type: {mime}\r\n\r\n".encode()
-    for chunk in stream_iter:
-        yield chunk
-    yield CRLF
-
-    # 종료
-    yield f"--{boundary}--\r\n".encode()
-
-
-def trailer_decl_str(trailers: Dict[str, str]) -> Optional[str]:
-    if not trailers:
-        return None
-    return ", ".join(trailers.keys())
-
-
-class HttpConnection:
-    def __init__(self, opts: ClientOptions):
-        self.opts = opts
-        self.sock: Optional[socket.socket] = None
-        self.last_status: Optional[int] = None
-        self.last_reason: Optional[str] = None
-        self.last_raw_response: Optional[bytes] = None
-
-    def connect(self):
-        # 이미 연결되어 있으면 재사용
-        if self.sock is not None:
-            return
-        self.sock = socket.create_connection((self.opts.host, self.opts.port), timeout=self.opts.connect_timeout)
-        self.sock.settimeout(self.opts.read_timeout)
-        # 전송 성능 향상을 위한 소켓 버퍼 설정 (실패해도 무시)
-        try:
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1_048_576)  # 1MB
-        except Exception:
-            pass
-
-    def close(self):
-        try:
-            if self.sock:
-                self.sock.close()
-        finally:
-            self.sock = None
-
-    def _minimal_read_response(self):
-        """
-        서버에서 오는 HTTP 응답의 맨 앞 부분만 읽어서
-        상태코드와 이유문구를 파싱한다.
-        실패하면 None 반환.
-        """
-        try:
-            if not self.sock:
-                return None
-            self.sock.settimeout(1.0)
-            data = b""
-            # 헤더부(최소 첫 라인 + 몇 줄) 정도만 최대 8KB 읽기
-            while b"\r\n\r\n" not in data and len(data) < 8192:
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    break
-                data += chunk
-
-            if not data:
-                return None
-
-            self.last_raw_response = data
-
-            # 첫 줄 파싱: HTTP/1.1 200 OK
-            first_line, *_ = data.split(b"\r\n", 1)
-            parts = first_line.split()
-            if len(parts) < 2:
-                return None
-
-            # parts[1] 이 상태코드
-            try:
-                status = int(parts[1])
-            except ValueError:
-                return None
-
-            reason = b" ".join(parts[2:]).decode("ascii", "ignore") if len(parts) > 2 else ""
-            self.last_status = status
-            self.last_reason = reason
-            return status, reason
-        except Exception:
-            return None
-
-    def send_request_content_length(self, body_iter: Iterable[bytes], declared_len: int, filename_for_header: Optional[str]):
-        buf = build_request_line_and_base_headers(self.opts)
-        if self.opts.use_gzip:
-            buf += b"Content-Encoding: gzip\r\n"
-        buf += f"Content-Length: {declared_len}".encode("ascii") + CRLF
-        # 비멀티파트 파일 전송 시, 서버가 파일명을 알 수 있도록 헤더 보강
-        if filename_for_header and self.opts.add_x_filename_header and "X-Filename" not in self.opts.extra_headers:
-            buf += f"X-Filename: {filename_for_header}".encode("utf-8") + CRLF
-        if trailer_decl_str(self.opts.trailing_headers):
-            buf += b"X-Warning: Trailer headers require chunked encoding\r\n"
-        add_header_lines(buf, self.opts.extra_headers)
-        buf += CRLF
-        assert self.sock
-        self.sock.sendall(buf)
-        for part in body_iter:
-            self.sock.sendall(part)
-
-        if self.opts.fire_and_go:
-            return self._minimal_read_response()
-        return None
-
-    def send_request_chunked(self, body_iter: Iterable[bytes], filename_for_header: Optional[str]):
-        buf = build_request_line_and_base_headers(self.opts)
-        buf += b"Transfer-Encoding: chunked\r\n"
-        if self.opts.use_gzip:
-            buf += b"Content-Encoding: gzip\r\n"
-        # 파일명 보강
-        if filename_for_header and self.opts.add_x_filename_header and "X-Filename" not in self.opts.extra_headers:
-            buf += f"X-Filename: {filename_for_header}".encode("utf-8") + CRLF
-        tdecl = trailer_decl_str(self.opts.trailing_headers)
-        if tdecl:
-            buf += f"Trailer: {tdecl}".encode("ascii") + CRLF
-        add_header_lines(buf, self.opts.extra_headers)
-        buf += CRLF
-        assert self.sock
-        self.sock.sendall(buf)
-
-        ext = ""
-        ce = self.opts.chunk_ext.strip()
-        if ce:
-            if not ce.startswith(";"):
-                ce = ";" + ce
-            ext = ce
-
-        for part in body_iter:
-            if not part:
-                continue
-            size_hex = f"{len(part):X}".encode("ascii")
-            self.sock.sendall(size_hex + ext.encode("ascii") + CRLF + part + CRLF)
-
-        self.sock.sendall(b"0" + ext.encode("ascii") + CRLF)
-        for k, v in self.opts.trailing_headers.items():
-            self.sock.sendall(f"{k}: {v}".encode("utf-8") + CRLF)
-        self.sock.sendall(CRLF)
-
-        if self.opts.fire_and_go:
-            return self._minimal_read_response()
-        return None
-
-    def perform(self):
-        filename_hint = os.path.basename(self.opts.file_path) if self.opts.file_path else None
-
-        # multipart
-        if self.opts.use_multipart:
-            boundary = f"----PyBlastBoundary{int(time.time()*1000)}"
-            file_iter = iter_file_chunks(self.opts.file_path, self.opts.chunk_size) if self.opts.file_path else [self.opts.body_text or b""]
-            filespec = (self.opts.file_path or "", None, file_iter)
-            body_stream = multipart_iter(
-                filespec, boundary, self.opts.multipart_text_fields,
-                self.opts.multipart_filename_override, self.opts.multipart_field_name
-            )
-            self.opts.extra_headers.setdefault("Content-Type", f"multipart/form-data; boundary={boundary}")
-
-            if self.opts.use_gzip:
-                data = b"".join(body_stream)
-                gz = gzip_bytes(data)
-                if self.opts.use_chunked:
-                    return self.send_request_chunked([gz], filename_hint)
-                else:
-                    return self.send_request_content_length([gz], len(gz), filename_hint)
-            else:
-                if self.opts.use_chunked:
-                    return self.send_request_chunked(body_stream, filename_hint)
-                else:
-                    parts = [p for p in body_stream]
-                    total = sum(len(p) for p in parts)
-                    return self.send_request_content_length(parts, total, filename_hint)
-
-        # non-multipart (raw file)
-        if self.opts.file_path:
-            if self.opts.use_chunked:
-                if self.opts.use_gzip:
-                    with open(self.opts.file_path, "rb") as f:
-                        gz = gzip_bytes(f.read())
-                    return self.send_request_chunked([gz], filename_hint)
-                else:
-                    return self.send_request_chunked(iter_file_chunks(self.opts.file_path, self.opts.chunk_size),
-                                                     filename_hint)
-            else:
-                if self.opts.use_gzip:
-                    with open(self.opts.file_path, "rb") as f:
-                        gz = gzip_bytes(f.read())
-                    return self.send_request_content_length([gz], len(gz), filename_hint)
-
-                else:
-                    fsize = os.path.getsize(self.opts.file_path)
-                    return self.send_request_content_length(iter_file_chunks(self.opts.file_path, 8192), fsize,
-                                                            filename_hint)
-
-        # text body
-        body = self.opts.body_text or b""
-        if self.opts.use_gzip:
-            body = gzip_bytes(body)
-        if self.opts.use_chunked:
-            return self.send_request_chunked([body], None)
-        else:
-            return self.send_request_content_length([body], len(body), None)
-
-
-# ------------------ Worker ------------------
-
-class SenderWorker(threading.Thread):
-    def __init__(
-        self,
-        idx: int,
-        all_items: List,
-        log_cb,
-        status_cb,
-        stats_cb,
-        base_opts: ClientOptions,
-        repeat: int,
-        stop_flag: threading.Event,
-        random_mode: bool,
-        log_every: int,
-    ):
-        super().__init__(daemon=True)
-        self.idx = idx
-        self.all_items = all_items
-        self.log = log_cb
-        self.status_cb = status_cb
-        self.stats_cb = stats_cb
-        self.base_opts = base_opts
-        self.repeat = repeat          # 0이면 무한
-        self.stop_flag = stop_flag
-        self.random_mode = random_mode
-        self.log_every = max(1, log_every)
-        self.sent_count = 0
-
-        # keep-alive 연결 재사용용
-        self.conn: Optional[HttpConnection] = None
-
-    def _get_or_create_connection(self, opts: ClientOptions) -> HttpConnection:
-        """
-        keep-alive 가 켜진 경우에는 기존 연결을 재사용하고,
-        아니면 매 요청마다 새 HttpConnection을 사용한다.
-        """
-        # keep-alive가 아니면 매번 새로 생성
-        if not opts.keep_alive:
-            conn = HttpConnection(opts)
-            conn.connect()
-            return conn
-
-        # keep-alive 인 경우: 기존 연결이 살아있으면 재사용
-        if self.conn is not None and self.conn.sock is not None:
-            self.conn.opts = opts
-            return self.conn
-
-        # 기존 연결이 없으면 새로 만들고 기억
-        self.conn = HttpConnection(opts)
-        self.conn.connect()
-        return self.conn
-
-    def run(self):
-        try:
-            cycle = 0
-            while not self.stop_flag.is_set() and (self.repeat == 0 or cycle < self.repeat):
-                cycle += 1
-                items = list(self.all_items)
-                if self.random_mode:
-                    random.shuffle(items)
-
-                for item in items:
-                    if self.stop_flag.is_set():
-                        break
-
-                    desc = self._desc(item)
-                    self.status_cb(self.idx, desc)
-
-                    # 이 요청에서 보낼(예상) 바이트 수
-                    est_bytes = self._estimate_bytes(item)
-
-                    try:
-                        opts = self._clone_opts_for_item(item)
-
-                        # 연결 재사용 / 생성
-                        conn = self._get_or_create_connection(opts)
-
-                        # 요청 시작 시각
-                        t0 = time.monotonic()
-                        resp = None
-                        elapsed_ms = None
-
-                        try:
-                            resp = conn.perform()
-                            elapsed_ms = (time.monotonic() - t0) * 1000.0
-                        except (TimeoutError, socket.timeout):
-                            self.sent_count += 1
-                            msg = (
-                                f"[TIMEOUT] [스레드 {self.idx}] 전송 실패: Timeout — {desc} "
-                                f"(DUT/서버 응답 없음, 차단 가능성 높음)"
-                            )
-                            self.log(msg)
-
-                            # 그래프/통계용 기록 (status_code = None, elapsed_ms=None)
-                            if self.stats_cb:
-                                self.stats_cb(est_bytes, None, None)
-
-                            # keep-alive 연결이면 재연결 준비
-                            if opts.keep_alive and self.conn is not None:
-                                self.conn.close()
-                                self.conn = None
-                            elif not opts.keep_alive:
-                                conn.close()
-                            continue
-                        except (ConnectionResetError, BrokenPipeError, OSError) as e:
-                            self.sent_count += 1
-                            msg = (
-                                f"[RESET] [스레드 {self.idx}] 전송 실패: Connection error({e}) — {desc} "
-                                f"(전송 중 DUT/서버가 연결을 끊었거나 네트워크 오류)"
-                            )
-                            self.log(msg)
-
-                            if self.stats_cb:
-                                self.stats_cb(est_bytes, None, None)
-
-                            if opts.keep_alive and self.conn is not None:
-                                self.conn.close()
-                                self.conn = None
-                            elif not opts.keep_alive:
-                                conn.close()
-                            continue
-                        # 여기까지 왔으면 소켓 예외는 없음
-                        self.sent_count += 1
-
-                        status_str = "응답 없음"
-                        verdict = "알 수 없음"
-                        tag = "[INFO]"
-                        status_code = None
-
-                        if resp is None:
-                            verdict = "차단 의심(응답 없음/짧은 응답)"
-                            tag = "[BLOCK]"
-                        else:
-                            status, reason = resp
-                            status_code = status
-                            status_str = f"{status} {reason}"
-                            if 200 <= status < 300:
-                                verdict = "성공"
-                                tag = "[SUCCESS]"
-                            elif 400 <= status < 500:
-                                verdict = "차단/클라이언트 오류"
-                                tag = "[BLOCK]"
-                            elif 500 <= status < 600:
-                                verdict = "서버 오류(또는 DUT 차단)"
-                                tag = "[SERVER_ERR]"
-                            else:
-                                verdict = "기타 응답"
-                                tag = "[INFO]"
-
-                        # ---- 그래프/통계용 콜백 호출 ----
-                        if self.stats_cb:
-                            self.stats_cb(est_bytes, status_code, elapsed_ms)
-
-                        # 성공 로그는 log_every 간격으로, 나머지는 항상
-                        if tag != "[SUCCESS]" or (self.sent_count % self.log_every == 0):
-                            msg = (
-                                f"{tag} [스레드 {self.idx}] 전송 결과 "
-                                f"(#{self.sent_count}, 반복={cycle if self.repeat>0 else '∞'}): "
-                                f"{desc} — {verdict} (응답={status_str})"
-                            )
-                            self.log(msg)
-
-                        if self.base_opts.delay_between > 0:
-                            time.sleep(self.base_opts.delay_between)
-
-                        # keep-alive가 꺼져 있는 경우, 이 요청 전용 conn은 여기서 정리
-                        if not opts.keep_alive:
-                            conn.close()
-
-                    except Exception as e:
-                        self.log(f"[ERROR] [스레드 {self.idx}] 전송 중 예외: {e}\n{traceback.format_exc()}")
-
-            # 스레드 작업 종료 표시
-            self.status_cb(self.idx, "-")
-
-            # 스레드 종료 시, 재사용 중이던 연결이 있으면 정리
-            if self.conn is not None:
-                self.conn.close()
-                self.conn = None
-
-        except Exception as e:
-            self.log(f"[FATAL] [스레드 {self.idx}] 치명 오류: {e}\n{traceback.format_exc()}")
-
-    def _clone_opts_for_item(self, item) -> ClientOptions:
-        o = self.base_opts
-        new = ClientOptions(
-            host=o.host, port=o.port, path=o.path, method=o.method, keep_alive=o.keep_alive,
-            use_chunked=o.use_chunked, chunk_size=o.chunk_size, chunk_ext=o.chunk_ext,
-            use_gzip=o.use_gzip, use_multipart=o.use_multipart,
-            extra_headers=dict(o.extra_headers), trailing_headers=dict(o.trailing_headers),
-            connect_timeout=o.connect_timeout, read_timeout=o.read_timeout,
-            fire_and_go=o.fire_and_go, http_version=o.http_version,
-            body_text=o.body_text, file_path=o.file_path,
-            multipart_field_name=o.multipart_field_name,
-            multipart_text_fields=dict(o.multipart_text_fields),
-            multipart_filename_override=o.multipart_filename_override,
-            add_x_filename_header=o.add_x_filename_header,
-            delay_between=o.delay_between,
-        )
-        if isinstance(item, tuple) and item[0] == "__TEXT__":  # 텍스트
-            new.file_path = None
-            new.body_text = item[1].encode("utf-8")
-        else:
-            new.file_path = item if item else None
-        return new
-
-    def _desc(self, item):
-        if isinstance(item, tuple) and item[0] == "__TEXT__":
-            return f"텍스트({len(item[1])}자)"
-        elif item:
-            return os.path.basename(item)
-        return "빈 바디"
-
-    def _estimate_bytes(self, item) -> int:
-        """
-        대략적인 전송 바디 크기 추정.
-        - 텍스트: UTF-8 바이트 길이
-        - 파일: 파일 크기
-        """
-        try:
-            if isinstance(item, tuple) and item[0] == "__TEXT__":
-                return len(item[1].encode("utf-8"))
-            elif isinstance(item, str) and item:
-                return os.path.getsize(item)
-        except Exception:
-            pass
-        return 0
+from uploader_core import (
+    ClientOptions, parse_kv_lines, ASYNC_MAX_CONCURRENCY, MAX_STATUS_ROWS, PROC_MAX_WORKERS,
+    POOL_IDLE_TIMEOUT, merge_handshake_stats, parse_stage_lines, LatencyHistogram,
+    STATS_FIELDS, drain_latency, sum_counters, diff_counters,
+)
+from uploader_profile import RunProfile, ENGINES, launch_senders
+from uploader_series import RunSeries
+from uploader_logview import LogPanel, LOG_VIEW_MAX_LINES
+from uploader_filelog import RotatingLogWriter
+from uploader_corpus import load_corpus_items
 
+# 창을 닫을 때 진행 중 전송이 끝나기를 기다리는 최대 시간(초)
+SHUTDOWN_JOIN_SEC = 5.0
 
 # ------------------ GUI ------------------
 
@@ -566,18 +45,19 @@ class UploaderGUI(QWidget):
         # ★ 로그 기본 경로 설정 (UI에서 사용해야 하므로 가장 먼저)
         self.log_dir = os.path.join(os.getcwd(), "logs")
         os.makedirs(self.log_dir, exist_ok=True)
+        # 프로필의 메모리 바디 소스 (화면 입력란은 없고 불러온 프로필 값을 그대로 유지)
+        self._body_sources: List[Dict] = []
 
         self._apply_dark_theme()
         self._build_ui()
 
         # 로그 버퍼(A) - 화면용
-        self._log_buf = deque()
+        self._log_buf = deque(maxlen=LOG_VIEW_MAX_LINES)
         self._log_lock = threading.Lock()
         self._log_timer = QTimer(self)
         self._log_timer.setInterval(100)  # 100ms마다 플러시
         self._log_timer.timeout.connect(self._flush_log_buffer)
         self._log_timer.start()
-        self.logview.document().setMaximumBlockCount(5000)  # 최근 5,000줄만 유지
 
         # ★ 통계 카운터 초기화
         self.total_sent = 0
@@ -586,40 +66,55 @@ class UploaderGUI(QWidget):
         self.total_timeout = 0
         self.total_reset = 0
         self.total_server_err = 0
+        self.total_bytes = 0
+        # 목표 속도(개방 루프) 표시: 목표 문자열 / 달성 속도 측정 기준점 (시각, 전송 수, 바이트)
+        self._rate_target = ""
+        self._rate_mark = (time.monotonic(), 0, 0)
+        self._rate_achieved = ""
 
         # 스레드 상태 업데이트 제한(B)
         self._last_status: Dict[int, float] = {}
         self._status_min_interval = 0.2  # 초
         self.status_signal.connect(self._update_thread_status)
 
-        self.work_threads: List[SenderWorker] = []
+        self.work_threads: List[threading.Thread] = []  # SenderWorker 또는 AsyncSenderEngine
         self.stop_event = threading.Event()
+        self.event_writer = None  # 이벤트 로그 기록기 (이벤트 로그를 켠 실행에서만)
 
         # 시작/정지 시간
         self.start_time: Optional[datetime] = None
         self.stop_time: Optional[datetime] = None
 
-        # === 전송 기록(그래프용) : 초 단위 버킷 ===
+        # === 전송 기록(그래프용) : 실행 지표 시계열 ===
         self._start_monotonic = 0.0
-        self.bucket_lock = threading.Lock()
-        # key = sec(int), value = 합계
-        self.bucket_bytes = {}  # 초당 전송 바이트 합계
-        self.bucket_success = {}  # 초당 성공 건수
-        self.bucket_block = {}  # 초당 차단/오류 건수
-        self.bucket_lat_sum = {}  # 초당 응답시간 합(ms)
-        self.bucket_lat_cnt = {}  # 초당 응답시간 샘플 수
+        # series / run_lat_hist / phase_marks 를 보호 (집계 타이머, 부하 단계 콜백, 그래프 창이 함께 씀)
+        self.series_lock = threading.Lock()
+        # 초당 트래픽/성공/차단/동시 전송 수/응답시간 백분위 (고정 용량 ring buffer, 1초·10초·1분 해상도)
+        self.series = RunSeries()
+        self.run_lat_hist = LatencyHistogram()  # 실행 전체 응답시간 히스토그램
+        self.phase_marks = []  # 부하 단계 경계: (경과 초, 단계 이름)
+        self._chart_window = None  # 실시간 그래프 창 (처음 열 때 생성)
 
         # 그래프 기능 제어 (On/Off + 샘플링)
         self.graph_enabled = True
-        self.graph_sample_ms = 0
-        self._last_graph_sample_monotonic = 0.0
+        self.graph_sample_ms = 100
+
+        # ---- 파일 로그 (큐 기반 기록 스레드, 크기/날짜 회전, 백그라운드 압축) ----
+        self.file_log = RotatingLogWriter(self.log_dir)
+        self.file_log.start()
+
+        # 통계 집계: 전송기별 누적 카운터를 주기적으로 합산 (요청 경로에는 잠금/Qt 호출 없음)
+        self._stats_prev = dict.fromkeys(STATS_FIELDS, 0)
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setInterval(self.graph_sample_ms)
+        self._stats_timer.timeout.connect(self._collect_stats)
+        self._stats_timer.start()
 
-        # ---- 파일 로그 관련 ----
-        self.file_log_queue = deque()
-        self.file_log_lock = threading.Lock()
-        self.current_log_date: Optional[str] = None
-        self.current_log_path: Optional[str] = None
-        self._start_file_log_thread()
+        # 응답시간 히스토그램 수집 (1초마다 전송기에서 끝난 초를 가져와 합침)
+        self._lat_timer = QTimer(self)
+        self._lat_timer.setInterval(1000)
+        self._lat_timer.timeout.connect(self._collect_latency)
+        self._lat_timer.start()
 
     # 다크 테마
     def _apply_dark_theme(self):
@@ -721,6 +216,30 @@ class UploaderGUI(QWidget):
         g1.addWidget(self.ed_port, 1, 1)
         g1.addWidget(QLabel("전송할 URL 경로"), 2, 0)
         g1.addWidget(self.ed_path, 2, 1)
+        # TLS (HTTPS)
+        self.use_tls = QCheckBox("HTTPS(TLS) 사용")
+        self.tls_verify = QCheckBox("서버 인증서 검증")
+        self.tls_verify.setChecked(True)
+        self.tls_session_reuse = QCheckBox("TLS 세션 재개(재연결 시 핸드셰이크 단축)")
+        self.tls_session_reuse.setChecked(True)
+        self.ed_tls_sni = QLineEdit("")
+        self.ed_tls_sni.setPlaceholderText("비우면 주소 사용")
+        self.ed_tls_ca = QLineEdit("")
+        self.ed_tls_ca.setPlaceholderText("비우면 시스템 기본 CA")
+        self.ed_tls_cert = QLineEdit("")
+        self.ed_tls_cert.setPlaceholderText("클라이언트 인증서(PEM, 선택)")
+        self.ed_tls_key = QLineEdit("")
+        self.ed_tls_key.setPlaceholderText("개인키(PEM, 인증서 파일에 없을 때)")
+        g1.addWidget(self.use_tls, 3, 0)
+        g1.addWidget(self.tls_verify, 3, 1)
+        g1.addWidget(self.tls_session_reuse, 4, 0, 1, 2)
+        g1.addWidget(QLabel("SNI / 인증서 호스트명"), 5, 0)
+        g1.addWidget(self.ed_tls_sni, 5, 1)
+        g1.addWidget(QLabel("CA 번들 파일"), 6, 0)
+        g1.addWidget(self.ed_tls_ca, 6, 1)
+        g1.addWidget(QLabel("클라이언트 인증서 / 키"), 7, 0)
+        g1.addWidget(self.ed_tls_cert, 7, 1)
+        g1.addWidget(self.ed_tls_key, 8, 1)
         srv.setLayout(g1)
 
         # HTTP 옵션
@@ -736,6 +255,19 @@ class UploaderGUI(QWidget):
         self.ed_chunk_size.setValue(65536)
         self.ed_chunk_ext = QLineEdit("")
         self.use_gzip = QCheckBox("본문 압축(Content-Encoding: gzip)")
+        self.ed_gzip_level = QSpinBox()
+        self.ed_gzip_level.setRange(1, 9)
+        self.ed_gzip_level.setValue(9)
+        self.ed_gzip_cache_mb = QSpinBox()
+        self.ed_gzip_cache_mb.setRange(0, 65_536)
+        self.ed_gzip_cache_mb.setValue(256)
+        self.ed_gzip_spill_dir = QLineEdit("")
+        self.ed_gzip_spill_dir.setPlaceholderText("비우면 디스크 보관 안 함")
+        self.ed_mmap_mb = QSpinBox()
+        self.ed_mmap_mb.setRange(0, 1_048_576)
+        self.ed_mmap_mb.setValue(0)
+        self.use_sendfile = QCheckBox("파일 본문 커널 전송(sendfile, Content-Length 전용)")
+        self.use_sendfile.setChecked(True)
         g2.addWidget(QLabel("메서드"), 0, 0)
         g2.addWidget(self.cb_method, 0, 1)
         g2.addWidget(self.keep_alive, 0, 2)
@@ -744,7 +276,16 @@ class UploaderGUI(QWidget):
         g2.addWidget(self.ed_chunk_size, 1, 2)
         g2.addWidget(QLabel("청크 확장자(chunk extensions, 예: foo=1)"), 2, 0)
         g2.addWidget(self.ed_chunk_ext, 2, 1, 1, 2)
-        g2.addWidget(self.use_gzip, 3, 0, 1, 3)
+        g2.addWidget(self.use_gzip, 3, 0)
+        g2.addWidget(QLabel("gzip 압축 레벨(1~9)"), 3, 1)
+        g2.addWidget(self.ed_gzip_level, 3, 2)
+        g2.addWidget(self.use_sendfile, 4, 0, 1, 3)
+        g2.addWidget(QLabel("gzip 캐시 메모리(MB, 0=끄기)"), 5, 0)
+        g2.addWidget(self.ed_gzip_cache_mb, 5, 1)
+        g2.addWidget(QLabel("gzip 캐시 디스크 폴더(선택)"), 6, 0)
+        g2.addWidget(self.ed_gzip_spill_dir, 6, 1, 1, 2)
+        g2.addWidget(QLabel("파일 본문 mmap 공유(MB, 0=끄기)"), 7, 0)
+        g2.addWidget(self.ed_mmap_mb, 7, 1)
         opt.setLayout(g2)
 
         # 바디
@@ -845,6 +386,33 @@ class UploaderGUI(QWidget):
         gspeed.addWidget(QLabel("로그 표시 간격(건마다, 1=매건)"), 2, 0)
         gspeed.addWidget(self.ed_log_every, 2, 1)
 
+        # 부하 단계: 비어 있으면 스레드 수/반복 횟수대로, 있으면 단계가 동시 전송 수와 시간을 정함
+        self.ed_stages = QPlainTextEdit(
+            "# 한 줄에 한 단계 (thread 엔진). 비우면 스레드 수/반복 사용\n"
+            "# ramp 시작 끝 초 / step 시작 끝 증가폭 간격초 / soak 동시전송 초\n"
+        )
+        self.ed_stages.setMaximumHeight(90)
+        gspeed.addWidget(QLabel("부하 단계(ramp/step/soak)"), 6, 0)
+        gspeed.addWidget(self.ed_stages, 6, 1)
+
+        # 목표 속도(개방 루프): 응답이 느려져도 예정된 시각에 계속 보내고, 지연은 예정 시각부터 잰다
+        self.ed_rate_rps = QDoubleSpinBox()
+        self.ed_rate_rps.setRange(0, 1_000_000)
+        self.ed_rate_rps.setDecimals(1)
+        self.ed_rate_rps.setValue(0)
+        self.ed_rate_mbps = QDoubleSpinBox()
+        self.ed_rate_mbps.setRange(0, 100_000)
+        self.ed_rate_mbps.setDecimals(1)
+        self.ed_rate_mbps.setValue(0)
+        self.cb_rate_arrival = QComboBox()
+        self.cb_rate_arrival.addItems(["균등 간격(토큰 버킷)", "포아송(무작위 도착)"])
+        gspeed.addWidget(QLabel("목표 요청 속도(req/s, 0=제한 없음 — 설정 시 요청 간 대기 무시)"), 3, 0)
+        gspeed.addWidget(self.ed_rate_rps, 3, 1)
+        gspeed.addWidget(QLabel("목표 전송 속도(Mbps, 0=제한 없음)"), 4, 0)
+        gspeed.addWidget(self.ed_rate_mbps, 4, 1)
+        gspeed.addWidget(QLabel("요청 도착 간격"), 5, 0)
+        gspeed.addWidget(self.cb_rate_arrival, 5, 1)
+
         speed.setLayout(gspeed)
 
         # ───────── 그래프 설정 ─────────
@@ -855,11 +423,11 @@ class UploaderGUI(QWidget):
         self.cb_enable_graph.setChecked(True)
 
         self.ed_graph_sample_ms = QSpinBox()
-        self.ed_graph_sample_ms.setRange(0, 60_000)
-        self.ed_graph_sample_ms.setValue(100)  # 기본 100ms 샘플링
+        self.ed_graph_sample_ms.setRange(50, 60_000)
+        self.ed_graph_sample_ms.setValue(100)  # 기본 100ms 마다 집계
 
         ggraph.addWidget(self.cb_enable_graph, 0, 0, 1, 3)
-        ggraph.addWidget(QLabel("그래프 샘플링 주기(ms, 0=모든 요청 기록)"), 1, 0)
+        ggraph.addWidget(QLabel("통계 집계 주기(ms)"), 1, 0)
         ggraph.addWidget(self.ed_graph_sample_ms, 1, 1)
 
         graph.setLayout(ggraph)
@@ -873,6 +441,14 @@ class UploaderGUI(QWidget):
         glog.addWidget(QLabel("로그 파일 폴더"), 0, 0)
         glog.addWidget(self.ed_log_dir, 0, 1)
         glog.addWidget(self.btn_log_dir, 0, 2)
+        self.cb_event_log = QCheckBox("구조화 이벤트 로그(.evlog) 기록")
+        self.cb_event_log.setToolTip("요청 결과를 고정 크기 레코드로 로그 폴더에 기록합니다.\n"
+                                     "python -m uploader_events 파일.evlog --to jsonl|csv|text 로 변환")
+        self.cb_text_log = QCheckBox("요청별 텍스트 로그")
+        self.cb_text_log.setChecked(True)
+        self.cb_text_log.setToolTip("끄면 요청별 로그 줄을 만들지 않습니다 (이벤트 로그를 켠 경우에만 적용).")
+        glog.addWidget(self.cb_event_log, 1, 0, 1, 2)
+        glog.addWidget(self.cb_text_log, 1, 2)
         logcfg.setLayout(glog)
 
         # 파일 목록
@@ -903,6 +479,29 @@ class UploaderGUI(QWidget):
         self.ed_threads.setRange(1, 16)
         self.ed_threads.setValue(4)
         self.ed_threads.setToolTip("최소 1, 최대 16 스레드까지 설정할 수 있습니다.")
+        self.lbl_threads = QLabel("동시 전송(스레드, 1~16개)")
+        self.cb_engine = QComboBox()
+        self.cb_engine.addItems(["스레드(SenderWorker)", "asyncio(대량 동시 연결)",
+                                 "멀티프로세스(스레드)", "멀티프로세스(asyncio)"])
+        self.cb_engine.currentIndexChanged.connect(self._on_engine_changed)
+        self.ed_processes = QSpinBox()
+        self.ed_processes.setRange(1, 256)
+        self.ed_processes.setValue(os.cpu_count() or 1)
+        self.ed_processes.setToolTip("멀티프로세스 모드에서 사용할 프로세스 수(기본: CPU 코어 수)")
+        self.ed_pipeline = QSpinBox()
+        self.ed_pipeline.setRange(1, 1024)
+        self.ed_pipeline.setValue(1)
+        self.ed_pipeline.setToolTip("keep-alive 연결 하나에 응답을 기다리지 않고 연달아 보낼 요청 수 (스레드 엔진 전용)")
+        self.ed_pool_size = QSpinBox()
+        self.ed_pool_size.setRange(0, 65_536)
+        self.ed_pool_size.setValue(0)
+        self.ed_pool_size.setToolTip("스레드들이 함께 쓰는 keep-alive 연결 풀의 최대 연결 수 (0이면 스레드마다 연결 하나)")
+        self.ed_pool_min = QSpinBox()
+        self.ed_pool_min.setRange(0, 65_536)
+        self.ed_pool_min.setValue(0)
+        self.ed_pool_idle = QSpinBox()
+        self.ed_pool_idle.setRange(1, 3600)
+        self.ed_pool_idle.setValue(int(POOL_IDLE_TIMEOUT))
         self.ed_repeat = QSpinBox()
         self.ed_repeat.setRange(0, 1_000_000)
         self.ed_repeat.setValue(1)
@@ -911,22 +510,40 @@ class UploaderGUI(QWidget):
         self.btn_start = QPushButton("시작")
         self.btn_stop = QPushButton("정지")
         self.btn_show_charts = QPushButton("그래프 보기")
+        self.btn_save_profile = QPushButton("프로필 저장…")
+        self.btn_load_profile = QPushButton("프로필 불러오기…")
 
         self.btn_start.clicked.connect(self._start_run)
         self.btn_stop.clicked.connect(self._stop_run)
         self.btn_show_charts.clicked.connect(self._show_charts)
+        self.btn_save_profile.clicked.connect(self._save_profile)
+        self.btn_load_profile.clicked.connect(self._load_profile)
 
         self.time_label = QLabel("시작/정지 시각: -")
 
-        g5.addWidget(QLabel("동시 전송(스레드, 1~16개)"), 0, 0)
+        g5.addWidget(self.lbl_threads, 0, 0)
         g5.addWidget(self.ed_threads, 0, 1)
         g5.addWidget(QLabel("반복(회) — 0이면 무한"), 0, 2)
         g5.addWidget(self.ed_repeat, 0, 3)
-        g5.addWidget(self.fire_and_go, 1, 0, 1, 4)
+        g5.addWidget(QLabel("전송 엔진"), 1, 0)
+        g5.addWidget(self.cb_engine, 1, 1)
+        g5.addWidget(QLabel("프로세스 수(멀티프로세스 모드)"), 1, 2)
+        g5.addWidget(self.ed_processes, 1, 3)
+        g5.addWidget(QLabel("파이프라이닝 깊이(1=끄기)"), 2, 0)
+        g5.addWidget(self.ed_pipeline, 2, 1)
+        g5.addWidget(QLabel("연결 풀 최대(0=끄기)"), 2, 2)
+        g5.addWidget(self.ed_pool_size, 2, 3)
+        g5.addWidget(QLabel("연결 풀 최소(미리 연결)"), 3, 0)
+        g5.addWidget(self.ed_pool_min, 3, 1)
+        g5.addWidget(QLabel("유휴 연결 정리(초)"), 3, 2)
+        g5.addWidget(self.ed_pool_idle, 3, 3)
+        g5.addWidget(self.fire_and_go, 4, 0, 1, 4)
         hbtn = QHBoxLayout()
         hbtn.addWidget(self.btn_start)
         hbtn.addWidget(self.btn_stop)
         hbtn.addWidget(self.btn_show_charts)
+        hbtn.addWidget(self.btn_save_profile)
+        hbtn.addWidget(self.btn_load_profile)
 
         g5.addLayout(hbtn, 2, 0, 1, 4)
         g5.addWidget(self.time_label, 3, 0, 1, 4)
@@ -941,9 +558,8 @@ class UploaderGUI(QWidget):
         gth.addWidget(self.thread_table)
         thb.setLayout(gth)
 
-        # 로그
-        self.logview = QTextEdit()
-        self.logview.setReadOnly(True)
+        # 로그 (모델/뷰: 최근 LOG_VIEW_MAX_LINES 줄 보관, 보이는 줄만 그림)
+        self.logview = LogPanel()
 
         # ★ 통계 라벨
         self.lbl_stats = QLabel("총 전송: 0  |  성공: 0  |  차단/오류: 0 (차단율 0.0%)")
@@ -967,72 +583,30 @@ class UploaderGUI(QWidget):
 
         layout.setRowStretch(10, 1)
 
-    def _show_charts(self):
-        with self.bucket_lock:
-            if not self.bucket_bytes:
-                QMessageBox.information(self, "그래프", "수집된 전송 기록이 없습니다.\n시험을 한 번 실행한 뒤 눌러주세요.")
-                return
+    def _on_engine_changed(self, index: int):
+        # asyncio 엔진은 스레드 하나에서 수천 개 연결을 돌릴 수 있으므로 범위를 넓힌다
+        if index == 2:
+            self.ed_threads.setRange(1, PROC_MAX_WORKERS)
+            self.ed_threads.setToolTip("전체 스레드 수 — 프로세스들에 나눠서 배분됩니다.")
+            self.lbl_threads.setText(f"동시 전송(전체 스레드, 1~{PROC_MAX_WORKERS}개)")
+        elif index in (1, 3):
+            self.ed_threads.setRange(1, ASYNC_MAX_CONCURRENCY)
+            self.ed_threads.setToolTip(f"asyncio 엔진: 최대 {ASYNC_MAX_CONCURRENCY}개 동시 연결")
+            self.lbl_threads.setText(f"동시 연결(asyncio, 1~{ASYNC_MAX_CONCURRENCY}개)")
+        else:
+            self.ed_threads.setRange(1, 16)
+            self.ed_threads.setToolTip("최소 1, 최대 16 스레드까지 설정할 수 있습니다.")
+            self.lbl_threads.setText("동시 전송(스레드, 1~16개)")
 
-            # 버킷 복사
-            bytes_b = dict(self.bucket_bytes)
-            succ_b = dict(self.bucket_success)
-            block_b = dict(self.bucket_block)
-            lat_sum_b = dict(self.bucket_lat_sum)
-            lat_cnt_b = dict(self.bucket_lat_cnt)
-
-        max_sec = max(bytes_b.keys() | succ_b.keys() | block_b.keys() | lat_sum_b.keys())
-        nsec = max_sec + 1
-
-        x_sec = list(range(nsec))
-
-        # 1) 초당 트래픽(Mbps)
-        bytes_per_sec = [0] * nsec
-        for s, val in bytes_b.items():
-            if 0 <= s < nsec:
-                bytes_per_sec[s] = val
-        mbps = [(b * 8.0) / 1_000_000 for b in bytes_per_sec]
-
-        # 2) 초당 성공/차단 건수
-        success_per_sec = [0] * nsec
-        block_per_sec = [0] * nsec
-        for s, val in succ_b.items():
-            if 0 <= s < nsec:
-                success_per_sec[s] = val
-        for s, val in block_b.items():
-            if 0 <= s < nsec:
-                block_per_sec[s] = val
-
-        # 3) 초당 평균 응답시간(ms)
-        avg_rt = [0.0] * nsec
-        for s in range(nsec):
-            cnt = lat_cnt_b.get(s, 0)
-            if cnt > 0:
-                avg_rt[s] = lat_sum_b.get(s, 0.0) / cnt
-            else:
-                avg_rt[s] = 0.0
-
-        fig, axes = plt.subplots(3, 1, figsize=(10, 10), sharex=True)
-
-        # 1. 트래픽
-        axes[0].plot(x_sec, mbps)
-        axes[0].set_ylabel("트래픽 (Mbps)")
-        axes[0].set_title("가동 시간에 따른 전송 트래픽")
-
-        # 2. 성공/차단
-        axes[1].plot(x_sec, success_per_sec, label="성공(2xx~3xx)")
-        axes[1].plot(x_sec, block_per_sec, label="차단/오류(응답 없음 포함)")
-        axes[1].set_ylabel("건수")
-        axes[1].set_title("가동 시간에 따른 성공/차단 건수")
-        axes[1].legend()
-
-        # 3. 평균 응답시간
-        axes[2].plot(x_sec, avg_rt)
-        axes[2].set_xlabel("가동 후 시간 (초)")
-        axes[2].set_ylabel("평균 응답 시간 (ms)")
-        axes[2].set_title("가동 시간에 따른 평균 응답 시간")
-
-        plt.tight_layout()
-        plt.show()
+    def _show_charts(self):
+        """실시간 그래프 창 열기 (비모달, 실행 중에도 1초마다 새 점만 덧붙임)"""
+        if self._chart_window is None:
+            from uploader_livechart import LiveChartWindow  # QtCharts 는 여기서 처음 import
+            self._chart_window = LiveChartWindow(lambda: (self.series, self.phase_marks), self.series_lock, self)
+        self._chart_window.show()
+        self._chart_window.raise_()
+        self._chart_window.activateWindow()
+        self._chart_window.refresh()
 
     # ---------- UI helpers ----------
 
@@ -1046,6 +620,11 @@ class UploaderGUI(QWidget):
         folder = QFileDialog.getExistingDirectory(self, "폴더 선택")
         if folder:
             self.ed_folder.setText(folder)
+            corpus = load_corpus_items(folder)
+            if corpus is not None:
+                # 코퍼스 폴더는 목록에 풀지 않고 실행 시 manifest 에서 읽는다 (파일 수가 매우 많을 수 있음)
+                self._log_enqueue(f"[안내] 코퍼스 폴더: {len(corpus)}개 파일 (파일 목록이 비어 있을 때 사용).")
+                return
             added = 0
             for name in os.listdir(folder):
                 p = os.path.join(folder, name)
@@ -1072,72 +651,27 @@ class UploaderGUI(QWidget):
             self.log_dir = folder
             os.makedirs(self.log_dir, exist_ok=True)
             self.ed_log_dir.setText(self.log_dir)
+            self.file_log.set_dir(self.log_dir)
             self._log_enqueue(f"[안내] 로그 저장 폴더 변경: {self.log_dir}")
 
     # ---------- Log (A) 화면 + 파일 ----------
 
     def _log_enqueue(self, s: str):
-        # 화면 로그 큐
+        # 화면 로그 큐 (화면 보관 줄 수를 넘으면 오래된 줄부터 버림)
         with self._log_lock:
-            MAX_BUF = 10000
-            if len(self._log_buf) >= MAX_BUF:
-                self._log_buf.popleft()
             self._log_buf.append(s)
 
-        # 파일 로그 큐에도 기록 (타임스탬프 포함)
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._file_log_enqueue(f"[{timestamp}] {s}")
+        # 파일 로그 큐에도 기록 (타임스탬프는 기록 스레드가 붙임)
+        self.file_log.write(s)
 
     def _flush_log_buffer(self):
-        batch = []
+        """쌓인 줄을 모두 한 번에 로그 모델로 넘긴다 (100ms 주기, GUI 스레드)"""
         with self._log_lock:
-            while self._log_buf and len(batch) < 500:
-                batch.append(self._log_buf.popleft())
-
-        if not batch:
-            return
-
-        last = batch[-1]
-        others = len(batch) - 1
-        if others > 0:
-            summary = f"{last} 외 {others}건"
-        else:
-            summary = last
-
-        # 색상만 태그로 판단
-        if last.startswith("[SUCCESS]"):
-            last_tag = "success"
-        elif last.startswith("[BLOCK]"):
-            last_tag = "block"
-        elif last.startswith("[TIMEOUT]"):
-            last_tag = "timeout"
-        elif last.startswith("[RESET]"):
-            last_tag = "reset"
-        elif last.startswith("[SERVER_ERR]"):
-            last_tag = "server_err"
-        elif last.startswith("[ERROR]") or last.startswith("[FATAL]"):
-            last_tag = "error"
-        else:
-            last_tag = "info"
-
-        default_color = self.logview.palette().color(QPalette.Text)
-
-        if last_tag == "success":
-            color = QColor("#80ff80")
-        elif last_tag in ("block", "server_err"):
-            color = QColor("#ff8080")
-        elif last_tag in ("timeout", "reset"):
-            color = QColor("#ffcc66")
-        elif last_tag == "error":
-            color = QColor("#ff5555")
-        else:
-            color = default_color
-
-        self.logview.setTextColor(color)
-        self.logview.append(summary)
-        self.logview.setTextColor(default_color)
-
-        self._update_stats_label()
+            if not self._log_buf:
+                return
+            batch = list(self._log_buf)
+            self._log_buf.clear()
+        self.logview.append_lines(batch)
 
     def _update_stats_label(self):
         if self.total_sent > 0:
@@ -1152,11 +686,39 @@ class UploaderGUI(QWidget):
             f"타임아웃: {self.total_timeout}  |  "
             f"RST: {self.total_reset}  |  "
             f"5xx: {self.total_server_err}"
+            + (f"  |  응답: {self.run_lat_hist.summary()}" if self.run_lat_hist.total else "")
+            + (f"  |  속도: {self._rate_text()}" if self._rate_target else "")
         )
 
+    def _collect_latency(self):
+        """전송기들이 넘긴 초 단위 히스토그램을 실행 전체 히스토그램과 시계열에 합친다 (GUI 스레드, 1초 주기)"""
+        items = drain_latency(self.work_threads)
+        if not items:
+            return
+        base_sec = int(self._start_monotonic)
+        with self.series_lock:
+            for abs_sec, hist in items:
+                self.run_lat_hist.merge(hist)
+                if self.graph_enabled:
+                    self.series.add_latency(max(0, abs_sec - base_sec), hist)
+        self._update_stats_label()
+
+    def _rate_text(self) -> str:
+        """달성 속도(최근 1초 이상 구간) vs 목표 속도"""
+        now = time.monotonic()
+        t, sent, nbytes = self._rate_mark
+        if now - t >= 1.0:
+            dt = now - t
+            self._rate_achieved = (f"{(self.total_sent - sent) / dt:.1f} req/s, "
+                                   f"{(self.total_bytes - nbytes) * 8 / 1_000_000 / dt:.2f} Mbps")
+            self._rate_mark = (now, self.total_sent, self.total_bytes)
+        return f"달성 {self._rate_achieved or '-'} / 목표 {self._rate_target}"
+
     # ---------- Thread status (B) ----------
 
     def _reset_thread_table(self, threads: int):
+        # asyncio 엔진의 수천 개 연결은 앞쪽 일부만 표시
+        threads = min(threads, MAX_STATUS_ROWS)
         self.thread_table.setRowCount(threads)
         self._last_status.clear()
         for i in range(threads):
@@ -1175,6 +737,153 @@ class UploaderGUI(QWidget):
 
     # ---------- Run ----------
 
+    def _collect_profile(self) -> RunProfile:
+        """화면 입력값 전체를 RunProfile 로 모은다 (실행/프로필 저장 공용)."""
+        if self.rb_multipart.isChecked():
+            body_mode = "multipart"
+        elif self.rb_file.isChecked():
+            body_mode = "file"
+        else:
+            body_mode = "text"
+
+        client = ClientOptions(
+            host=self.ed_host.text().strip(),
+            port=int(self.ed_port.value()),
+            path=self.ed_path.text().strip(),
+            method=self.cb_method.currentText().strip().upper(),
+            keep_alive=self.keep_alive.isChecked(),
+            use_chunked=self.use_chunked.isChecked(),
+            chunk_size=int(self.ed_chunk_size.value()),
+            chunk_ext=self.ed_chunk_ext.text().strip(),
+            use_gzip=self.use_gzip.isChecked(),
+            use_multipart=body_mode == "multipart",
+            extra_headers=parse_kv_lines(self.ed_headers.toPlainText()),
+            trailing_headers=parse_kv_lines(self.ed_trailers.toPlainText()),
+            fire_and_go=self.fire_and_go.isChecked(),
+            delay_between=int(self.ed_delay_ms.value()) / 1000.0,
+            multipart_field_name=self.ed_mpart_field.text().strip() or "file",
+            multipart_text_fields=parse_kv_lines(self.ed_mpart_textfields.toPlainText()),
+            multipart_filename_override=self.ed_mpart_filename_override.text().strip() or None,
+            use_sendfile=self.use_sendfile.isChecked(),
+            gzip_level=int(self.ed_gzip_level.value()),
+            use_tls=self.use_tls.isChecked(),
+            tls_verify=self.tls_verify.isChecked(),
+            tls_server_name=self.ed_tls_sni.text().strip() or None,
+            tls_ca_file=self.ed_tls_ca.text().strip() or None,
+            tls_cert_file=self.ed_tls_cert.text().strip() or None,
+            tls_key_file=self.ed_tls_key.text().strip() or None,
+            tls_session_reuse=self.tls_session_reuse.isChecked(),
+        )
+        return RunProfile(
+            client=client,
+            threads=int(self.ed_threads.value()),
+            repeat=int(self.ed_repeat.value()),  # 0 -> 무한
+            random_mode=(self.cb_pick_mode.currentIndex() == 1),
+            log_every=int(self.ed_log_every.value()),
+            engine=ENGINES[self.cb_engine.currentIndex()],
+            processes=int(self.ed_processes.value()),
+            pipeline_depth=int(self.ed_pipeline.value()),
+            pool_size=int(self.ed_pool_size.value()),
+            pool_min=int(self.ed_pool_min.value()),
+            pool_idle_sec=float(self.ed_pool_idle.value()),
+            rate_rps=float(self.ed_rate_rps.value()),
+            rate_mbps=float(self.ed_rate_mbps.value()),
+            rate_poisson=self.cb_rate_arrival.currentIndex() == 1,
+            stages=parse_stage_lines(self.ed_stages.toPlainText()),
+            gzip_cache_mb=int(self.ed_gzip_cache_mb.value()),
+            gzip_spill_dir=self.ed_gzip_spill_dir.text().strip() or None,
+            mmap_cache_mb=int(self.ed_mmap_mb.value()),
+            event_log=self.log_dir if self.cb_event_log.isChecked() else "",
+            text_log=self.cb_text_log.isChecked(),
+            body_mode=body_mode,
+            body_text=self.txt_body.toPlainText(),
+            body_file=self.ed_file.text().strip() if body_mode != "text" else None,
+            files=[self.file_list.item(i).text() for i in range(self.file_list.count())],
+            folder=self.ed_folder.text().strip(),
+            body_sources=list(self._body_sources),
+        )
+
+    def _apply_profile(self, prof: RunProfile):
+        """불러온 RunProfile 값을 화면에 채운다."""
+        c = prof.client
+        self.ed_host.setText(c.host)
+        self.ed_port.setValue(int(c.port))
+        self.ed_path.setText(c.path)
+        self.use_tls.setChecked(c.use_tls)
+        self.tls_verify.setChecked(c.tls_verify)
+        self.tls_session_reuse.setChecked(c.tls_session_reuse)
+        self.ed_tls_sni.setText(c.tls_server_name or "")
+        self.ed_tls_ca.setText(c.tls_ca_file or "")
+        self.ed_tls_cert.setText(c.tls_cert_file or "")
+        self.ed_tls_key.setText(c.tls_key_file or "")
+        self.cb_method.setCurrentText(c.method)
+        self.keep_alive.setChecked(c.keep_alive)
+        self.use_chunked.setChecked(c.use_chunked)
+        self.ed_chunk_size.setValue(int(c.chunk_size))
+        self.ed_chunk_ext.setText(c.chunk_ext)
+        self.use_gzip.setChecked(c.use_gzip)
+        self.ed_gzip_level.setValue(int(c.gzip_level))
+        self.use_sendfile.setChecked(c.use_sendfile)
+        self.ed_headers.setPlainText("\n".join(f"{k}: {v}" for k, v in c.extra_headers.items()))
+        self.ed_trailers.setPlainText("\n".join(f"{k}: {v}" for k, v in c.trailing_headers.items()))
+        self.fire_and_go.setChecked(c.fire_and_go)
+        self.ed_delay_ms.setValue(int(round(c.delay_between * 1000)))
+        self.ed_mpart_field.setText(c.multipart_field_name)
+        self.ed_mpart_textfields.setPlainText("\n".join(f"{k}: {v}" for k, v in c.multipart_text_fields.items()))
+        self.ed_mpart_filename_override.setText(c.multipart_filename_override or "")
+
+        {"text": self.rb_text, "file": self.rb_file, "multipart": self.rb_multipart}[prof.body_mode].setChecked(True)
+        self.txt_body.setPlainText(prof.body_text)
+        self.ed_file.setText(prof.body_file or "")
+        self.file_list.clear()
+        for p in prof.files:
+            self.file_list.addItem(p)
+        self.ed_folder.setText(prof.folder)
+        self._body_sources = list(prof.body_sources)
+        if self._body_sources:
+            self._log_enqueue(f"[안내] 프로필의 메모리 바디 소스 {len(self._body_sources)}종을 사용합니다 "
+                              "(파일 목록이 비어 있을 때).")
+
+        self.cb_engine.setCurrentIndex(ENGINES.index(prof.engine))
+        self.ed_threads.setValue(prof.threads)
+        self.ed_pipeline.setValue(prof.pipeline_depth)
+        self.ed_pool_size.setValue(prof.pool_size)
+        self.ed_pool_min.setValue(prof.pool_min)
+        self.ed_pool_idle.setValue(int(prof.pool_idle_sec))
+        self.ed_rate_rps.setValue(prof.rate_rps)
+        self.ed_rate_mbps.setValue(prof.rate_mbps)
+        self.cb_rate_arrival.setCurrentIndex(1 if prof.rate_poisson else 0)
+        self.ed_stages.setPlainText("\n".join(s.to_line() for s in prof.stages))
+        self.ed_repeat.setValue(prof.repeat)
+        self.cb_pick_mode.setCurrentIndex(1 if prof.random_mode else 0)
+        self.ed_log_every.setValue(prof.log_every)
+        self.ed_processes.setValue(prof.processes or os.cpu_count() or 1)
+        self.ed_gzip_cache_mb.setValue(prof.gzip_cache_mb)
+        self.ed_gzip_spill_dir.setText(prof.gzip_spill_dir or "")
+        self.ed_mmap_mb.setValue(prof.mmap_cache_mb)
+        self.cb_event_log.setChecked(bool(prof.event_log))
+        self.cb_text_log.setChecked(prof.text_log)
+
+    def _save_profile(self):
+        path, _ = QFileDialog.getSaveFileName(self, "프로필 저장", "", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            self._collect_profile().save(path)
+            self._log_enqueue(f"[안내] 프로필 저장: {path}")
+        except Exception as e:
+            QMessageBox.warning(self, "프로필", f"프로필 저장 실패: {e}")
+
+    def _load_profile(self):
+        path, _ = QFileDialog.getOpenFileName(self, "프로필 불러오기", "", "프로필 (*.json *.toml)")
+        if not path:
+            return
+        try:
+            self._apply_profile(RunProfile.load(path))
+            self._log_enqueue(f"[안내] 프로필 불러옴: {path}")
+        except Exception as e:
+            QMessageBox.warning(self, "프로필", f"프로필 불러오기 실패: {e}")
+
     def _start_run(self):
         try:
             self.stop_event.clear()
@@ -1186,103 +895,34 @@ class UploaderGUI(QWidget):
             self.total_timeout = 0
             self.total_reset = 0
             self.total_server_err = 0
+            self.total_bytes = 0
+            self._rate_mark = (time.monotonic(), 0, 0)
+            self._rate_achieved = ""
+            # 새 실행의 전송기는 카운터가 0부터 시작 (이전 전송기는 더 이상 합산하지 않음)
+            self.work_threads = []
+            self._stats_prev = dict.fromkeys(STATS_FIELDS, 0)
             self._update_stats_label()
 
-            # 그래프용 버킷 초기화 (새 실행마다 리셋)
+            # 그래프용 시계열 초기화 (새 실행마다 리셋)
             self._start_monotonic = time.monotonic()
-            with self.bucket_lock:
-                self.bucket_bytes.clear()
-                self.bucket_success.clear()
-                self.bucket_block.clear()
-                self.bucket_lat_sum.clear()
-                self.bucket_lat_cnt.clear()
+            with self.series_lock:
+                self.series = RunSeries()
+                self.run_lat_hist = LatencyHistogram()
+                self.phase_marks.clear()
 
             # 그래프 On/Off 및 샘플링 주기 설정
             self.graph_enabled = self.cb_enable_graph.isChecked()
             self.graph_sample_ms = int(self.ed_graph_sample_ms.value())
-            self._last_graph_sample_monotonic = 0.0
-
-            host = self.ed_host.text().strip()
-            port = int(self.ed_port.value())
-            path = self.ed_path.text().strip()
-            method = self.cb_method.currentText().strip().upper()
-            keep_alive = self.keep_alive.isChecked()
-            use_chunked = self.use_chunked.isChecked()
-            chunk_size = int(self.ed_chunk_size.value())
-            chunk_ext = self.ed_chunk_ext.text().strip()
-            use_gzip = self.use_gzip.isChecked()
-
-            use_multipart = self.rb_multipart.isChecked()
-            is_file = self.rb_file.isChecked()
-            is_text = self.rb_text.isChecked()
-
-            text_body = self.txt_body.toPlainText()
-            single_file_path = self.ed_file.text().strip() if (is_file or use_multipart) else None
-
-            m_field = self.ed_mpart_field.text().strip() or "file"
-            m_text_fields = parse_kv_lines(self.ed_mpart_textfields.toPlainText())
-            m_fname_override = self.ed_mpart_filename_override.text().strip() or None
-
-            extra_headers = parse_kv_lines(self.ed_headers.toPlainText())
-            trailing_headers = parse_kv_lines(self.ed_trailers.toPlainText())
-
-            threads = int(self.ed_threads.value())
-            repeat = int(self.ed_repeat.value())  # 0 -> 무한
-            fire_and_go = self.fire_and_go.isChecked()
-            delay_ms = int(self.ed_delay_ms.value())
-            delay_between = delay_ms / 1000.0
-            random_mode = (self.cb_pick_mode.currentIndex() == 1)
-            log_every = int(self.ed_log_every.value())
-
-            base = ClientOptions(
-                host=host, port=port, path=path, method=method, keep_alive=keep_alive,
-                use_chunked=use_chunked, chunk_size=chunk_size, chunk_ext=chunk_ext,
-                use_gzip=use_gzip, use_multipart=use_multipart,
-                extra_headers=extra_headers, trailing_headers=trailing_headers,
-                fire_and_go=fire_and_go, delay_between=delay_between
-            )
-
-            if is_text and not use_multipart:
-                base.body_text = text_body.encode("utf-8")
-                base.file_path = None
-            else:
-                base.file_path = single_file_path
-
-            base.multipart_field_name = m_field
-            base.multipart_text_fields = m_text_fields
-            base.multipart_filename_override = m_fname_override
+            self._stats_timer.setInterval(self.graph_sample_ms)
 
-            all_items: List = []
-            # 파일 목록
-            for i in range(self.file_list.count()):
-                p = self.file_list.item(i).text()
-                if os.path.isfile(p):
-                    all_items.append(p)
-
-            # 목록이 비어 있으면 폴더 또는 단일/텍스트/빈 바디
-            folder = self.ed_folder.text().strip()
-            if not all_items and folder and os.path.isdir(folder):
-                for name in os.listdir(folder):
-                    p = os.path.join(folder, name)
-                    if os.path.isfile(p):
-                        all_items.append(p)
-                if all_items:
-                    self._log_enqueue(f"[안내] 폴더에서 {len(all_items)}개 파일을 큐에 등록.")
-
-            if not all_items:
-                if is_text and not use_multipart:
-                    all_items.append(("__TEXT__", text_body))
-                elif single_file_path:
-                    all_items.append(single_file_path)
-                else:
-                    all_items.append(None)
+            profile = self._collect_profile()
+            self._rate_target = profile.rate_target_str() if profile.rate_enabled else ""
+            base = profile.build_base_options()
+            all_items = profile.build_items(self._log_enqueue)
 
             self._log_enqueue(
-                f"[시작] 항목 {len(all_items)}개. 스레드={threads}, 반복={repeat if repeat>0 else '무한'}, "
-                f"메서드={method}, {'chunked' if use_chunked else 'content-length'}, "
-                f"{'gzip' if use_gzip else 'no-gzip'}, keep-alive={keep_alive}, "
-                f"지연={delay_ms}ms, 선택방식={'랜덤' if random_mode else '순차'}, 로그간격={log_every}, "
-                f"그래프={'ON' if self.graph_enabled else 'OFF'}, 샘플링={self.graph_sample_ms}ms"
+                f"[시작] {profile.summary(len(all_items))}, "
+                f"그래프={'ON' if self.graph_enabled else 'OFF'}, 집계 주기={self.graph_sample_ms}ms"
             )
 
             # 시작/정지 시간 UI
@@ -1291,89 +931,86 @@ class UploaderGUI(QWidget):
             self.time_label.setText(f"시작/정지 시각: 시작 {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}")
 
             # 스레드 테이블 초기화
-            self._reset_thread_table(threads)
-
-            # 스레드 가동
-            self.work_threads = []
-            for i in range(threads):
-                thr = SenderWorker(
-                    idx=i + 1,
-                    all_items=all_items,
-                    log_cb=self._log_enqueue,
-                    status_cb=lambda tid, desc: self.status_signal.emit(tid, desc),
-                    stats_cb=lambda b, code, el: self._on_stats(b, code, el),
-                    base_opts=base,
-                    repeat=repeat,
-                    stop_flag=self.stop_event,
-                    random_mode=random_mode,
-                    log_every=log_every,
-                )
-                thr.start()
-                self.work_threads.append(thr)
+            self._reset_thread_table(profile.peak_workers())
+
+            # 전송기 가동 (엔진별: SenderWorker 스레드 / asyncio / 멀티프로세스)
+            # gzip 압축 결과 캐시는 실행 단위로 새로 만들어 모든 스레드가 공유
+            self.work_threads, gzip_cache, self.event_writer = launch_senders(
+                profile, base, all_items,
+                log_cb=self._log_enqueue,
+                status_cb=lambda tid, desc: self.status_signal.emit(tid, desc),
+                stats_cb=None,
+                stats_batch_cb=None,
+                phase_cb=self._on_phase,
+                stop_event=self.stop_event,
+            )
 
             # 감시자
             def watcher():
+                path_counts: Dict[str, int] = {}
                 for t in self.work_threads:
                     t.join()
-                self._log_enqueue("[완료] 모든 스레드 종료.")
+                    for k, v in t.send_path_counts.items():
+                        path_counts[k] = path_counts.get(k, 0) + v
+                summary = ", ".join(f"{k}={v}" for k, v in sorted(path_counts.items())) or "-"
+                self._log_enqueue(f"[완료] 모든 스레드 종료. 전송 경로별 요청 수: {summary}")
+                if base.use_tls:
+                    self._log_enqueue(f"[안내] {merge_handshake_stats(self.work_threads).summary()}")
+                if gzip_cache is not None:
+                    cs = gzip_cache.stats()
+                    self._log_enqueue(
+                        f"[안내] gzip 캐시: 적중 {cs['hits']}건 / 압축 {cs['misses']}건, "
+                        f"메모리 {cs['mem_items']}개({cs['mem_bytes'] / 1024 / 1024:.1f}MB), "
+                        f"디스크 {cs['spill_items']}개({cs['spill_bytes'] / 1024 / 1024:.1f}MB)"
+                    )
 
             threading.Thread(target=watcher, daemon=True).start()
 
         except Exception as e:
             self._log_enqueue(f"[오류] {e}\n{traceback.format_exc()}")
 
-    def _on_stats(self, bytes_sent: int, status_code: Optional[int], elapsed_ms: Optional[float]):
-        # 1) 누적 통계 업데이트
-        self.total_sent += 1
-
-        if status_code is None:
-            self.total_block += 1
-            self.total_timeout += 1
-        else:
-            if 200 <= status_code < 300:
-                self.total_success += 1
-            elif 400 <= status_code < 500:
-                self.total_block += 1
-            elif 500 <= status_code < 600:
-                self.total_server_err += 1
-            else:
-                pass
-
+    def _collect_stats(self):
+        """
+        전송기별 누적 카운터(stats_snapshot)를 합산해 누적 통계/실행 지표 시계열을 갱신한다.
+        GUI 스레드의 타이머에서만 호출되므로 Qt 위젯을 바로 갱신해도 된다.
+        """
+        alive = any(t.is_alive() for t in self.work_threads)
+        # 초 번호는 지연 히스토그램(int(time.monotonic()) 기준)과 같은 방식으로 센다
+        now_sec = int(time.monotonic()) - int(self._start_monotonic)
+        cur = sum_counters(self.work_threads)
+        d = diff_counters(cur, self._stats_prev)
+        if d["sent"]:
+            self._stats_prev = cur
+            self.total_sent = cur["sent"]
+            self.total_bytes = cur["bytes"]
+            self.total_success = cur["s2xx"]
+            self.total_block = cur["no_resp"] + cur["s4xx"]
+            self.total_timeout = cur["no_resp"]
+            self.total_server_err = cur["s5xx"]
+
+            # 그래프 기록: ON일 때만 (구간 값을 집계 시점의 초에 기록)
+            if self.graph_enabled:
+                with self.series_lock:
+                    self.series.add(now_sec, d["bytes"],
+                                    d["s2xx"] + d["s3xx"], d["no_resp"] + d["s4xx"] + d["s5xx"] + d["other"])
+
+        # 늦게 오는 값을 기다린 초는 확정, 실행이 끝나면 남은 히스토그램까지 반영한 뒤 닫음
+        if self.graph_enabled and self.work_threads:
+            if alive:
+                with self.series_lock:
+                    self.series.advance(now_sec)
+            elif not self.series.finished:
+                self._collect_latency()
+                with self.series_lock:
+                    self.series.finish()
         self._update_stats_label()
 
-        # 2) 그래프 기록: ON일 때만
-        if not self.graph_enabled:
-            return
-
-        b = bytes_sent or 0
-        now = time.monotonic()
-        t_rel = now - self._start_monotonic
-        sec = int(t_rel)
-
-        with self.bucket_lock:
-            # 샘플링 주기(ms) > 0 이면 일정 간격으로만 기록
-            if self.graph_sample_ms > 0:
-                interval_sec = self.graph_sample_ms / 1000.0
-                if (now - self._last_graph_sample_monotonic) < interval_sec:
-                    return
-                self._last_graph_sample_monotonic = now
-
-            # 전송 바이트
-            self.bucket_bytes[sec] = self.bucket_bytes.get(sec, 0) + b
-
-            # 성공 / 차단 건수
-            if status_code is None:
-                self.bucket_block[sec] = self.bucket_block.get(sec, 0) + 1
-            else:
-                if 200 <= status_code < 400:
-                    self.bucket_success[sec] = self.bucket_success.get(sec, 0) + 1
-                else:
-                    self.bucket_block[sec] = self.bucket_block.get(sec, 0) + 1
-
-            # 응답 시간 (평균값용)
-            if elapsed_ms is not None:
-                self.bucket_lat_sum[sec] = self.bucket_lat_sum.get(sec, 0.0) + elapsed_ms
-                self.bucket_lat_cnt[sec] = self.bucket_lat_cnt.get(sec, 0) + 1
+    def _on_phase(self, elapsed: float, stage_idx: int, stage, workers: int):
+        """부하 단계 진행(StagedSenderPool): 시계열에 동시 전송 수, 단계 경계를 기록"""
+        with self.series_lock:
+            self.series.set_workers(int(elapsed), workers)
+            if not self.phase_marks or self.phase_marks[-1][2] != stage_idx:
+                self.phase_marks.append((elapsed, stage.label() if stage is not None else "종료", stage_idx))
 
     def _stop_run(self):
         self.stop_event.set()
@@ -1385,80 +1022,18 @@ class UploaderGUI(QWidget):
                 f"정지 {self.stop_time.strftime('%Y-%m-%d %H:%M:%S')}"
             )
 
-    # ----------------------------------------------------------
-    #                파일 로그 전용 쓰레드 (일 단위 회전 + 압축)
-    # ----------------------------------------------------------
-    def _start_file_log_thread(self):
-        def worker():
-            fp = None
-            current_date = None
-            current_path = None
-
-            while True:
-                try:
-                    today = datetime.now().strftime("%Y%m%d")
-                    # 날짜 변경 시: 이전 로그파일 gzip 압축 + 삭제, 새 파일 생성
-                    if current_date != today:
-                        # 이전 파일 처리
-                        if fp is not None and current_path is not None:
-                            try:
-                                fp.flush()
-                                fp.close()
-                            except Exception:
-                                pass
-                            # gzip 압축
-                            try:
-                                gz_path = current_path + ".gz"
-                                with open(current_path, "rb") as f_in, gzip.open(gz_path, "wb") as f_out:
-                                    shutil.copyfileobj(f_in, f_out)
-                                os.remove(current_path)
-                            except Exception as e:
-                                # 최소 디버그
-                                try:
-                                    sys.stderr.write(f"[FILE_LOG_ROTATE_ERROR] {e}\n")
-                                except Exception:
-                                    pass
-
-                        # 새 파일 생성 (연월일시간 포함)
-                        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        os.makedirs(self.log_dir, exist_ok=True)
-                        current_path = os.path.join(self.log_dir, f"log_{ts}.txt")
-                        fp = open(current_path, "a", encoding="utf-8")
-                        current_date = today
-                        # GUI에서 참고할 수 있도록 보관
-                        self.current_log_date = current_date
-                        self.current_log_path = current_path
-                        fp.write(f"[SYSTEM] New log file started at {ts}\n")
-                        fp.flush()
-
-                    # 큐에서 로그 batch 가져오기
-                    batch = []
-                    with self.file_log_lock:
-                        while self.file_log_queue and len(batch) < 500:
-                            batch.append(self.file_log_queue.popleft())
-
-                    if batch and fp:
-                        for line in batch:
-                            fp.write(line + "\n")
-                        fp.flush()
-
-                    time.sleep(0.1)
-
-                except Exception as e:
-                    # 디버깅용 최소 로그
-                    try:
-                        if fp:
-                            fp.write(f"[FILE_LOG_ERROR] {e}\n")
-                            fp.flush()
-                    except Exception:
-                        pass
-                    time.sleep(1)
-
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _file_log_enqueue(self, s: str):
-        with self.file_log_lock:
-            self.file_log_queue.append(s)
+    # ---------- Shutdown ----------
+
+    def closeEvent(self, event):
+        # 진행 중 전송을 멈추고(최대 SHUTDOWN_JOIN_SEC 대기) 남은 이벤트 로그/파일 로그까지 기록하고 닫는다
+        self.stop_event.set()
+        deadline = time.monotonic() + SHUTDOWN_JOIN_SEC
+        for t in self.work_threads:
+            t.join(max(0.0, deadline - time.monotonic()))
+        if self.event_writer is not None:
+            self.event_writer.close()
+        self.file_log.close()
+        super().closeEvent(event)
 
 
 # ---------- Main ----------
@@ -1471,4 +1046,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # 멀티프로세스 모드 (Windows/exe 빌드 대응)
     main()
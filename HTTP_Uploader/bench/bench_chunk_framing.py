@@ -0,0 +1,131 @@
+# chunked 프레이밍 벤치마크: 청크 크기별(1B ~ 1MB) 기존 방식 vs ChunkFramer(sendmsg/버퍼 모으기)
+# - 기존: 청크마다 size+ext+CRLF+payload+CRLF 를 이어 붙여 sendall, 트레일러는 줄마다 sendall
+# - 신규: HttpConnection.send_request_chunked (작은 청크는 모으고, 큰 청크는 sendmsg 로 복사 없이)
+# 사용: HTTP_Uploader 폴더에서  python bench/bench_chunk_framing.py [--seconds 2] [--body-kb 1024]
+import os
+import sys
+import time
+import socket
+import argparse
+import tempfile
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from uploader_core import (  # noqa: E402
+    CRLF, HAS_SENDMSG, ClientOptions, HttpConnection, TemplateCache, build_chunked_head, chunk_ext_bytes,
+)
+
+CHUNK_SIZES = [1, 16, 256, 4096, 65536, 1024 * 1024]
+
+
+def _sink_main(port_q):
+    # 받은 바이트를 버리기만 하는 서버 (응답 없음 → 클라이언트는 fire_and_go=False)
+    ls = socket.socket()
+    ls.bind(("127.0.0.1", 0))
+    ls.listen(8)
+    port_q.put(ls.getsockname()[1])
+    while True:
+        c, _ = ls.accept()
+        buf = bytearray(1 << 20)
+        while c.recv_into(buf):
+            pass
+        c.close()
+
+
+class _CountingSock:
+    """sendall / sendmsg 호출 수를 세는 소켓 래퍼"""
+
+    def __init__(self, sock):
+        self._sock = sock
+        self.calls = 0
+
+    def sendall(self, data):
+        self.calls += 1
+        return self._sock.sendall(data)
+
+    def sendmsg(self, bufs):
+        self.calls += 1
+        return self._sock.sendmsg(bufs)
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+class LegacyConnection(HttpConnection):
+    """ChunkFramer 도입 전의 chunked 전송 방식"""
+
+    def send_request_chunked(self, body_iter, filename_for_header):
+        self.sock.sendall(build_chunked_head(self.opts, filename_for_header))
+        ext = chunk_ext_bytes(self.opts)
+        self.last_send_path = "chunked"
+        for part in body_iter:
+            if not part:
+                continue
+            size_hex = f"{len(part):X}".encode("ascii")
+            self.sock.sendall(size_hex + ext + CRLF + part + CRLF)
+        self.sock.sendall(b"0" + ext + CRLF)
+        for k, v in self.opts.trailing_headers.items():
+            self.sock.sendall(f"{k}: {v}".encode("utf-8") + CRLF)
+        self.sock.sendall(CRLF)
+        return None
+
+
+def run_case(conn_cls, port: int, path: str, chunk_size: int, seconds: float):
+    opts = ClientOptions(
+        host="127.0.0.1", port=port, path="/upload", method="POST", keep_alive=True,
+        use_chunked=True, chunk_size=chunk_size, chunk_ext="", use_gzip=False, use_multipart=False,
+        extra_headers={}, trailing_headers={"X-Checksum": "abc", "X-Scan-Id": "1", "X-End": "1"},
+        fire_and_go=False, read_timeout=30.0,
+    )
+    tpl = TemplateCache(opts).get(path)
+    conn = conn_cls(tpl.opts)
+    conn.connect()
+    counter = _CountingSock(conn.sock)
+    conn.sock = counter
+    n = 0
+    t0 = time.perf_counter()
+    while True:
+        conn.perform(tpl)
+        n += 1
+        elapsed = time.perf_counter() - t0
+        if elapsed >= seconds:
+            break
+    conn.sock = counter._sock
+    conn.close()
+    return n, elapsed, counter.calls / n
+
+
+def main():
+    ap = argparse.ArgumentParser(description="chunked 프레이밍 청크 크기 스윕")
+    ap.add_argument("--seconds", type=float, default=2.0, help="케이스별 최소 측정 시간(초)")
+    ap.add_argument("--body-kb", type=int, default=1024, help="전송 파일 크기(KB)")
+    ap.add_argument("--sizes", default=",".join(map(str, CHUNK_SIZES)), help="청크 크기 목록(쉼표 구분)")
+    args = ap.parse_args()
+
+    fd, path = tempfile.mkstemp(prefix="bench_chunk_")
+    with os.fdopen(fd, "wb") as f:
+        f.write(os.urandom(args.body_kb * 1024))
+
+    port_q = multiprocessing.Queue()
+    srv = multiprocessing.Process(target=_sink_main, args=(port_q,), daemon=True)
+    srv.start()
+    try:
+        port = port_q.get(timeout=10)
+        print(f"바디 {args.body_kb} KB, sendmsg={'사용' if HAS_SENDMSG else '없음(합쳐서 sendall)'}")
+        print(f"{'청크':>9} | {'기존 MB/s':>10} {'send/요청':>10} | {'신규 MB/s':>10} {'send/요청':>10} | 변화")
+        for cs in (int(x) for x in args.sizes.split(",")):
+            res = []
+            for cls in (LegacyConnection, HttpConnection):
+                n, elapsed, calls = run_case(cls, port, path, cs, args.seconds)
+                res.append((n * args.body_kb / 1024 / elapsed, calls))
+            (old_mbps, old_calls), (new_mbps, new_calls) = res
+            print(f"{cs:>9} | {old_mbps:10.1f} {old_calls:10.0f} | {new_mbps:10.1f} {new_calls:10.0f} | "
+                  f"{(new_mbps / old_mbps - 1) * 100:+.0f}%")
+    finally:
+        srv.terminate()
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# 요청 헤더 템플릿(RequestTemplate) 효과 측정
+# 1) 마이크로: 요청마다 옵션 복제 + 헤더 직렬화 vs 템플릿 재사용 (요청당 ns)
+# 2) 종단간: 로컬 keep-alive 서버(별도 프로세스)로 작은 텍스트 바디를 보내 RPS 비교
+# 사용: HTTP_Uploader 폴더에서  python bench/bench_header_template.py [--seconds 3] [--workers 1]
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+import multiprocessing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from uploader_core import (  # noqa: E402
+    ClientOptions, SenderWorker, TemplateCache,
+    clone_opts_for_item, build_content_length_head, item_desc,
+)
+
+_RESP = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+
+
+def _serve_conn(c: socket.socket):
+    # Content-Length 요청만 처리하는 최소 keep-alive 서버
+    buf = b""
+    try:
+        while True:
+            while b"\r\n\r\n" not in buf:
+                data = c.recv(65536)
+                if not data:
+                    return
+                buf += data
+            head, buf = buf.split(b"\r\n\r\n", 1)
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                k, _, v = line.partition(b":")
+                if k.strip().lower() == b"content-length":
+                    length = int(v)
+            while len(buf) < length:
+                data = c.recv(65536)
+                if not data:
+                    return
+                buf += data
+            buf = buf[length:]
+            c.sendall(_RESP)
+    except OSError:
+        pass
+    finally:
+        c.close()
+
+
+def _server_main(port_q):
+    ls = socket.socket()
+    ls.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    ls.bind(("127.0.0.1", 0))
+    ls.listen(128)
+    port_q.put(ls.getsockname()[1])
+    while True:
+        c, _ = ls.accept()
+        c.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        threading.Thread(target=_serve_conn, args=(c,), daemon=True).start()
+
+
+def make_opts(port: int) -> ClientOptions:
+    return ClientOptions(
+        host="127.0.0.1", port=port, path="/upload", method="POST", keep_alive=True,
+        use_chunked=False, chunk_size=65536, chunk_ext="", use_gzip=False, use_multipart=False,
+        extra_headers={"User-Agent": "bench", "X-Test-Id": "header-template", "Content-Type": "text/plain"},
+        trailing_headers={},
+    )
+
+
+def bench_micro(n: int):
+    base = make_opts(80)
+    item = ("__TEXT__", "ping")
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        opts = clone_opts_for_item(base, item)
+        item_desc(item)
+        build_content_length_head(opts, 4, None)
+    old_ns = (time.perf_counter() - t0) / n * 1e9
+
+    cache = TemplateCache(base)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        cache.get(item).content_length_head(4)
+    new_ns = (time.perf_counter() - t0) / n * 1e9
+
+    print(f"[마이크로] 요청마다 생성: {old_ns:8.0f} ns/요청")
+    print(f"[마이크로] 템플릿 재사용: {new_ns:8.0f} ns/요청  (x{old_ns / new_ns:.1f})")
+
+
+def run_rps(port: int, seconds: float, workers: int, use_template: bool) -> float:
+    stop = threading.Event()
+    count = [0]
+    lock = threading.Lock()
+
+    def stats_cb(_bytes, _status, _elapsed):
+        with lock:
+            count[0] += 1
+
+    items = [("__TEXT__", "ping")]
+    senders = []
+    for i in range(workers):
+        w = SenderWorker(i + 1, items, lambda s: None, lambda idx, d: None, stats_cb,
+                         make_opts(port), 0, stop, False, 1_000_000)
+        if not use_template:
+            w.templates.max_entries = 0   # 캐시하지 않음 → 요청마다 새로 직렬화 (이전 동작)
+        senders.append(w)
+    for w in senders:
+        w.start()
+    time.sleep(seconds)
+    stop.set()
+    for w in senders:
+        w.join()
+    return count[0] / seconds
+
+
+def main():
+    ap = argparse.ArgumentParser(description="요청 헤더 템플릿 벤치마크")
+    ap.add_argument("--seconds", type=float, default=3.0, help="종단간 측정 시간(초), 모드별")
+    ap.add_argument("--workers", type=int, default=1, help="SenderWorker 스레드 수")
+    ap.add_argument("--micro-n", type=int, default=200_000, help="마이크로 벤치 반복 횟수")
+    args = ap.parse_args()
+
+    bench_micro(args.micro_n)
+
+    port_q = multiprocessing.Queue()
+    srv = multiprocessing.Process(target=_server_main, args=(port_q,), daemon=True)
+    srv.start()
+    try:
+        port = port_q.get(timeout=10)
+        old = run_rps(port, args.seconds, args.workers, use_template=False)
+        new = run_rps(port, args.seconds, args.workers, use_template=True)
+        print(f"[종단간] 요청마다 생성: {old:10.0f} req/s")
+        print(f"[종단간] 템플릿 재사용: {new:10.0f} req/s  ({(new / old - 1) * 100:+.1f}%)")
+    finally:
+        srv.terminate()
+
+
+if __name__ == "__main__":
+    main()
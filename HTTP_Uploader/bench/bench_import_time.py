@@ -0,0 +1,75 @@
+# import 시간 측정: 각 모듈을 새 인터프리터에서 import 하는 데 걸리는 시간(중앙값)
+# - 코어/CLI 모듈이 PySide6 / matplotlib 를 끌어오지 않는지도 함께 확인한다.
+# 사용: HTTP_Uploader 폴더에서  python bench/bench_import_time.py [--runs 7] [--max-ms 300]
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import importlib.util
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# GUI 없이 쓰는 모듈 (무거운 의존성 금지)
+CORE_MODULES = ["uploader_core", "uploader_profile", "uploader_cli", "uploader_charts",
+                "uploader_series", "uploader_events", "uploader_filelog", "uploader_corpus"]
+GUI_MODULES = ["HTTP_automation_V9"]
+HEAVY = ("PySide6", "matplotlib")
+
+_CHECK = (
+    "import sys, {mod}\n"
+    "bad = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(','.join(bad))\n"
+)
+
+
+def time_cmd(code: str, runs: int) -> float:
+    """python -c code 를 runs 번 실행한 벽시계 시간 중앙값(ms)"""
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def heavy_loaded(mod: str):
+    out = subprocess.run([sys.executable, "-c", _CHECK.format(mod=mod, heavy=HEAVY)],
+                         cwd=HERE, check=True, capture_output=True, text=True).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="uploader 모듈 import 시간 측정")
+    ap.add_argument("--runs", type=int, default=7, help="모듈당 실행 횟수 (기본 7)")
+    ap.add_argument("--max-ms", type=float, default=None,
+                    help="코어 모듈 import 시간(인터프리터 기동 제외) 상한, 초과 시 실패")
+    args = ap.parse_args()
+
+    mods = list(CORE_MODULES)
+    if importlib.util.find_spec("PySide6") is not None:
+        mods += GUI_MODULES
+
+    base = time_cmd("pass", args.runs)
+    print(f"인터프리터 기동: {base:8.1f} ms")
+    failed = False
+    for mod in mods:
+        total = time_cmd(f"import {mod}", args.runs)
+        net = total - base
+        line = f"{mod:<22} {net:8.1f} ms (전체 {total:.1f} ms)"
+        if mod in CORE_MODULES:
+            bad = heavy_loaded(mod)
+            if bad:
+                line += f"  [위반] {', '.join(bad)} 로드됨"
+                failed = True
+            if args.max_ms is not None and net > args.max_ms:
+                line += f"  [초과] > {args.max_ms:.0f} ms"
+                failed = True
+        print(line)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# 그래프(matplotlib) 지연 로딩
+# - matplotlib 은 import + 폰트 설정에 수 초가 걸리므로 '그래프 보기'를 처음 누를 때만 불러온다.
+_plt = None
+
+
+def load_pyplot():
+    """matplotlib.pyplot 을 처음 호출 시에만 import 하고 한글 폰트 설정을 적용해 반환"""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+
+        # ---- 한글 폰트 설정 (Windows 기준: 맑은 고딕) ----
+        plt.rcParams["font.family"] = "Malgun Gothic"   # 윈도우 기본 한글폰트
+        plt.rcParams["axes.unicode_minus"] = False      # 마이너스 깨짐 방지
+        _plt = plt
+    return _plt
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# 헤드리스 실행기: GUI(PySide6/matplotlib) 없이 실행 프로필로 전송을 돌린다.
+# 사용: (HTTP_Uploader 폴더에서) python -m uploader_cli profile.json [--interval 5] [--duration 600]
+import sys
+import time
+import argparse
+import threading
+import multiprocessing
+from datetime import datetime
+from typing import Dict, Optional
+
+from uploader_core import (
+    STATS_FIELDS, LatencyHistogram, merge_handshake_stats, drain_latency, sum_counters, diff_counters,
+)
+from uploader_profile import RunProfile, ENGINES, launch_senders
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="HTTP 업로더 헤드리스 실행기 (GUI 없이 실행 프로필로 전송)")
+    p.add_argument("profile", help="실행 프로필 파일 (.json / .toml, GUI 의 '프로필 저장' 결과)")
+    p.add_argument("--interval", type=float, default=5.0, help="요약 출력 주기(초) (기본: 5)")
+    p.add_argument("--duration", type=float, default=0.0,
+                   help="최대 실행 시간(초). 0이면 프로필의 반복 횟수가 끝날 때까지 (기본: 0)")
+    p.add_argument("--quiet", action="store_true", help="요청별 로그는 출력하지 않고 요약만 출력")
+    # 자주 바꾸는 값은 프로필을 고치지 않고 덮어쓸 수 있게
+    p.add_argument("--host", help="프로필의 client.host 덮어쓰기")
+    p.add_argument("--port", type=int, help="프로필의 client.port 덮어쓰기")
+    p.add_argument("--threads", type=int, help="프로필의 threads 덮어쓰기")
+    p.add_argument("--repeat", type=int, help="프로필의 repeat 덮어쓰기 (0=무한)")
+    p.add_argument("--engine", choices=ENGINES, help="프로필의 engine 덮어쓰기")
+    p.add_argument("--pipeline", type=int, help="프로필의 pipeline_depth 덮어쓰기 (1=끄기)")
+    p.add_argument("--pool", type=int, help="프로필의 pool_size 덮어쓰기 (0=끄기)")
+    p.add_argument("--rps", type=float, help="프로필의 rate_rps(목표 req/s) 덮어쓰기 (0=제한 없음)")
+    p.add_argument("--mbps", type=float, help="프로필의 rate_mbps(목표 Mbps) 덮어쓰기 (0=제한 없음)")
+    p.add_argument("--random-mb", type=float,
+                   help="디스크 파일 대신 이 크기(MB)의 난수 본문을 메모리에서 만들어 전송 (프로필의 body_sources 덮어쓰기)")
+    p.add_argument("--events", help="프로필의 event_log 덮어쓰기 (이벤트 로그 파일 또는 폴더)")
+    p.add_argument("--no-text-log", action="store_true",
+                   help="요청별 텍스트 로그 끄기 (이벤트 로그는 python -m uploader_events 로 변환)")
+    return p.parse_args(argv)
+
+
+def _ts() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def format_summary(elapsed: float, window: Dict[str, float], window_sec: float, totals: Dict[str, float],
+                   target: str = "", workers: Optional[int] = None,
+                   lat: Optional[LatencyHistogram] = None) -> str:
+    """
+    구간(window) 처리량 + 누적(totals) 성공/차단 현황 한 줄 요약.
+    target: 목표 속도 표시(개방 루프), workers: 현재 동시 전송 수(부하 단계 실행 시),
+    lat: 구간 응답시간 히스토그램 (있으면 평균 대신 p50/p99/max)
+    """
+    rps = window["sent"] / window_sec if window_sec > 0 else 0.0
+    mbps = window["bytes"] * 8.0 / 1_000_000 / window_sec if window_sec > 0 else 0.0
+    if lat is not None and lat.total:
+        lat_str = (f"응답 p50 {lat.percentile(50):7.1f} / p99 {lat.percentile(99):7.1f}"
+                   f" / max {lat.max_us / 1000:7.1f}ms")
+    else:
+        avg_ms = window["lat_sum"] / window["lat_cnt"] if window["lat_cnt"] else 0.0
+        lat_str = f"평균 응답 {avg_ms:7.1f}ms"
+
+    sent = totals["sent"]
+    block = totals["no_resp"] + totals["s4xx"]
+    block_rate = block * 100.0 / sent if sent else 0.0
+    return (
+        f"[요약] {elapsed:7.1f}s | {rps:8.1f} req/s | {mbps:8.2f} Mbps"
+        + (f" (목표 {target})" if target else "")
+        + (f" | 동시 {workers:4d}" if workers is not None else "")
+        + f" | {lat_str} | "
+        f"총 전송 {sent} | 성공 {totals['s2xx']} | 차단/오류 {block} (차단율 {block_rate:.1f}%) | "
+        f"타임아웃 {totals['no_resp']} | 5xx {totals['s5xx']}"
+    )
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        profile = RunProfile.load(args.profile)
+    except Exception as e:
+        print(f"[오류] 프로필을 읽을 수 없습니다: {e}", file=sys.stderr, flush=True)
+        return 2
+
+    if args.host:
+        profile.client.host = args.host
+    if args.port:
+        profile.client.port = args.port
+    if args.threads:
+        profile.threads = args.threads
+    if args.repeat is not None:
+        profile.repeat = args.repeat
+    if args.engine:
+        profile.engine = args.engine
+    if args.pipeline:
+        profile.pipeline_depth = args.pipeline
+    if args.pool is not None:
+        profile.pool_size = args.pool
+    if args.rps is not None:
+        profile.rate_rps = args.rps
+    if args.mbps is not None:
+        profile.rate_mbps = args.mbps
+    if args.random_mb:
+        profile.files = []
+        profile.body_sources = [{"kind": "random", "size_mb": args.random_mb}]
+    if args.events is not None:
+        profile.event_log = args.events
+    if args.no_text_log:
+        profile.text_log = False
+    target = profile.rate_target_str() if profile.rate_enabled else ""
+
+    print_lock = threading.Lock()
+
+    def log_cb(s: str):
+        if args.quiet and not s.startswith(("[안내]", "[ERROR]", "[FATAL]")):
+            return
+        with print_lock:
+            print(f"[{_ts()}] {s}", flush=True)
+
+    totals = dict.fromkeys(STATS_FIELDS, 0)
+    stop_event = threading.Event()
+
+    base = profile.build_base_options()
+    all_items = profile.build_items(log_cb)
+    log_cb(f"[안내] [시작] 대상 {profile.client.host}:{profile.client.port}{profile.client.path} — "
+           f"{profile.summary(len(all_items))}")
+
+    # 부하 단계 실행 시 현재 동시 전송 수 (요약 줄에 표시)
+    phase = {"workers": None}
+
+    def phase_cb(elapsed: float, stage_idx: int, stage, workers: int):
+        phase["workers"] = workers
+
+    senders, gzip_cache, events = launch_senders(
+        profile, base, all_items,
+        log_cb=log_cb,
+        status_cb=lambda idx, desc: None,
+        stats_cb=None,
+        stats_batch_cb=None,
+        stop_event=stop_event,
+        phase_cb=phase_cb,
+    )
+
+    start = time.monotonic()
+    last = start
+    interval = max(0.2, args.interval)
+
+    # 응답시간: 전송기가 넘긴 초 단위 히스토그램을 구간/전체로 합침
+    run_lat = LatencyHistogram()
+
+    def report(now: float):
+        nonlocal last, totals
+        # 전송기별 누적 카운터 합 → 직전 보고와의 차이가 구간 값
+        cur = sum_counters(senders)
+        window, totals = diff_counters(cur, totals), cur
+        window_lat = LatencyHistogram()
+        for _, hist in drain_latency(senders):
+            window_lat.merge(hist)
+        run_lat.merge(window_lat)
+        line = format_summary(now - start, window, now - last, totals, target, phase["workers"], window_lat)
+        with print_lock:
+            print(f"[{_ts()}] {line}", flush=True)
+        last = now
+
+    try:
+        while any(t.is_alive() for t in senders):
+            time.sleep(0.2)
+            now = time.monotonic()
+            if args.duration and now - start >= args.duration and not stop_event.is_set():
+                stop_event.set()
+                log_cb(f"[안내] [정지] 실행 시간 {args.duration:.0f}초 도달. 진행 중 요청이 끝나면 종료합니다.")
+            if now - last >= interval:
+                report(now)
+    except KeyboardInterrupt:
+        stop_event.set()
+        log_cb("[안내] [정지] 중지 요청됨(Ctrl+C). 진행 중 요청이 끝나면 종료합니다.")
+        for t in senders:
+            t.join()
+
+    report(time.monotonic())
+    if events is not None:
+        events.close()
+    path_counts: Dict[str, int] = {}
+    for t in senders:
+        for k, v in t.send_path_counts.items():
+            path_counts[k] = path_counts.get(k, 0) + v
+    log_cb("[안내] [완료] 전송 경로별 요청 수: "
+           + (", ".join(f"{k}={v}" for k, v in sorted(path_counts.items())) or "-"))
+    log_cb(f"[안내] 응답 시간 (전체 {run_lat.total}건): {run_lat.summary()}")
+    if profile.client.use_tls:
+        log_cb(f"[안내] {merge_handshake_stats(senders).summary()}")
+    if gzip_cache is not None:
+        cs = gzip_cache.stats()
+        log_cb(f"[안내] gzip 캐시: 적중 {cs['hits']}건 / 압축 {cs['misses']}건")
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
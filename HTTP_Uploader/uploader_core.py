@@ -0,0 +1,3252 @@
+# HTTP 업로더 전송 엔진 (GUI 의존성 없음)
+# - HTTP_automation_V9.py(GUI), uploader_cli.py(헤드리스) 가 공통으로 사용한다.
+import os
+import asyncio
+import errno
+import gzip
+import hashlib
+import shutil
+import time
+import socket
+import ssl
+import threading
+import random
+import traceback
+import multiprocessing
+import queue
+import select
+import signal
+import selectors
+import mmap
+import tempfile
+import zlib
+import json
+import struct
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Iterable
+from array import array
+from collections import OrderedDict, deque
+
+try:
+    import uvloop  # 선택: 설치되어 있으면 asyncio 엔진에서 사용
+except ImportError:
+    uvloop = None
+
+CRLF = b"\r\n"
+
+# asyncio 엔진 동시 연결 상한 / 스레드 상태 테이블에 표시할 최대 행 수
+ASYNC_MAX_CONCURRENCY = 10_000
+MAX_STATUS_ROWS = 64
+# 멀티프로세스 모드: 자식 → 부모 집계 전달 주기(초) / 한 번에 넘기는 로그 최대 줄 수
+PROC_FLUSH_INTERVAL = 1.0
+PROC_MAX_LOGS_PER_FLUSH = 1000
+PROC_MAX_WORKERS = 1024
+
+# sendfile 미지원 환경에서 파일 본문을 읽어 보낼 때의 블록 크기
+FILE_READ_CHUNK = 64 * 1024
+# 이 errno 로 sendfile 이 실패하면(전송 전) 일반 read/sendall 루프로 대체
+_SENDFILE_FALLBACK_ERRNOS = {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP}
+# gzip + Content-Length 전송 시 압축 결과를 메모리에 두는 한도 (넘으면 임시파일로 전환)
+GZIP_SPOOL_MAX = 8 * 1024 * 1024
+# 이 크기 이하의 메모리 바디는 헤더와 합쳐 한 번에 보낸다 (Nagle 지연/시스템 콜 절약)
+SMALL_BODY_COALESCE = 16 * 1024
+# chunked 프레이밍: 이보다 작은 청크는 쓰기 버퍼에 복사해 모으고, 모인 양이 CHUNK_COALESCE_BYTES 를 넘으면 보낸다
+CHUNK_INLINE_MAX = 16 * 1024
+CHUNK_COALESCE_BYTES = 64 * 1024
+# sendmsg(벡터 쓰기) 지원 여부 (Windows 에는 없음)
+HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+# 응답 읽기: recv 한 번의 대기 시간(초) / 헤더부 최대 크기 / 판정·로그용으로 보관하는 바디 앞부분 크기
+RESPONSE_READ_TIMEOUT = 1.0
+RESPONSE_MAX_HEAD = 64 * 1024
+RESPONSE_BODY_KEEP = 4 * 1024
+# 연결 풀: 유휴 연결 정리 시간(초) / 동시에 새로 맺는 연결 수 상한 / 연속 연결 실패 시 대기(초, 지수 증가 + 지터)
+POOL_IDLE_TIMEOUT = 30.0
+POOL_MAX_CONNECTING = 8
+POOL_BACKOFF_BASE = 0.05
+POOL_BACKOFF_MAX = 2.0
+
+
+# ------------------ Core HTTP ------------------
+
+@dataclass
+class ClientOptions:
+    host: str
+    port: int
+    path: str
+    method: str  # POST/PUT/PATCH/DELETE
+    keep_alive: bool
+    use_chunked: bool
+    chunk_size: int
+    chunk_ext: str
+    use_gzip: bool
+    use_multipart: bool
+    extra_headers: Dict[str, str]
+    trailing_headers: Dict[str, str]
+    connect_timeout: float = 5.0
+    read_timeout: float = 5.0
+    fire_and_go: bool = True
+    http_version: str = "HTTP/1.1"
+    body_text: Optional[bytes] = None
+    file_path: Optional[str] = None
+    multipart_field_name: str = "file"
+    multipart_text_fields: Dict[str, str] = field(default_factory=dict)
+    multipart_filename_override: Optional[str] = None
+    add_x_filename_header: bool = True  # non-multipart 파일명 힌트
+    delay_between: float = 0.0          # 전송 간 대기(초)
+    use_sendfile: bool = True           # Content-Length 파일 전송 시 커널 sendfile 사용
+    gzip_level: int = 9                 # gzip 압축 레벨(1~9)
+    use_tls: bool = False               # HTTPS (TLS) 로 전송
+    tls_verify: bool = True             # 서버 인증서/호스트명 검증
+    tls_server_name: Optional[str] = None   # SNI / 인증서 확인에 쓸 이름 (없으면 host)
+    tls_ca_file: Optional[str] = None       # 신뢰할 CA 번들 (없으면 시스템 기본)
+    tls_cert_file: Optional[str] = None     # 클라이언트 인증서 (PEM, 키 포함 가능)
+    tls_key_file: Optional[str] = None      # 클라이언트 개인키 (인증서 파일에 없을 때)
+    tls_session_reuse: bool = True      # 재연결 시 TLS 세션 재개(세션 티켓 / 세션 ID)
+    body_source: Optional["BodySource"] = None  # 메모리 바디 소스 (있으면 body_text/file_path 대신)
+
+
+def parse_kv_lines(raw: str) -> Dict[str, str]:
+    d: Dict[str, str] = {}
+    for line in raw.splitlines():
+        line = line.strip()
+        if not line or ":" not in line:
+            continue
+        k, v = line.split(":", 1)
+        d[k.strip()] = v.strip()
+    return d
+
+
+def build_request_line_and_base_headers(opts: ClientOptions, host_header: Optional[str] = None) -> bytearray:
+    first = f"{opts.method} {opts.path} {opts.http_version}".encode("ascii")
+    buf = bytearray(first + CRLF)
+    host_val = host_header if host_header else f"{opts.host}:{opts.port}"
+    buf += f"Host: {host_val}".encode("ascii") + CRLF
+    buf += (b"Connection: keep-alive" if opts.keep_alive else b"Connection: close") + CRLF
+    return buf
+
+
+def add_header_lines(buf: bytearray, headers: Dict[str, str]):
+    for k, v in headers.items():
+        buf += f"{k}: {v}".encode("utf-8") + CRLF
+
+
+def gzip_bytes(data: bytes, level: int = 9) -> bytes:
+    return gzip.compress(data, compresslevel=level)
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 9, out_size: int = 65536) -> Iterable[bytes]:
+    """
+    입력 청크를 zlib.compressobj 로 조금씩 압축해 gzip 스트림으로 내보낸다.
+    출력은 out_size 바이트 단위로 잘라 내보내므로
+    메모리 사용량은 청크 크기 수준으로 유지되고 첫 바이트도 바로 나간다.
+    """
+    out_size = max(1, out_size)
+    comp = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더/트레일러 포함
+    pending = bytearray()
+    for chunk in chunks:
+        pending += comp.compress(chunk)
+        while len(pending) >= out_size:
+            yield bytes(pending[:out_size])
+            del pending[:out_size]
+    pending += comp.flush()
+    while pending:
+        yield bytes(pending[:out_size])
+        del pending[:out_size]
+
+
+def gzip_spool(chunks: Iterable[bytes], level: int = 9):
+    """
+    Content-Length 전송처럼 압축 후 길이가 먼저 필요할 때 사용.
+    gzip_stream 결과를 SpooledTemporaryFile 에 쌓아 (파일객체, 길이)를 반환한다.
+    GZIP_SPOOL_MAX 를 넘으면 디스크 임시파일로 넘어가므로 RAM 은 한도 이상 쓰지 않는다.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=GZIP_SPOOL_MAX)
+    total = 0
+    for part in gzip_stream(chunks, level, FILE_READ_CHUNK):
+        spool.write(part)
+        total += len(part)
+    spool.seek(0)
+    return spool, total
+
+
+def iter_file_chunks(path: str, chunk_size: int) -> Iterable[bytes]:
+    with open(path, "rb") as f:
+        yield from iter_fileobj_chunks(f, chunk_size)
+
+
+def iter_fileobj_chunks(f, chunk_size: int) -> Iterable[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def iter_view_chunks(view: memoryview, chunk_size: int) -> Iterable[memoryview]:
+    step = max(1, chunk_size)
+    for i in range(0, len(view), step):
+        yield view[i:i + step]
+
+
+def multipart_iter(
+    filespec: Tuple[str, Optional[str], Iterable[bytes]],
+    boundary: str,
+    text_fields: Dict[str, str],
+    filename_override: Optional[str],
+    field_name: str,
+) -> Iterable[bytes]:
+    # 텍스트 필드
+    for k, v in text_fields.items():
+        yield f"--{boundary}\r\n".encode()
+        yield f'Content-Disposition: form-data; name="{k}"\r\n\r\n'.encode()
+        yield v.encode("utf-8")
+        yield CRLF
+
+    # 파일 파트
+    file_path, mime, stream_iter = filespec
+    filename = filename_override or (os.path.basename(file_path) if file_path else "blob")
+    mime = mime or "application/octet-stream"
+    yield f"--{boundary}\r\n".encode()
+    yield f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'.encode()
+    yield f"Content-Type: {mime}\r\n\r\n".encode()
+    for chunk in stream_iter:
+        yield chunk
+    yield CRLF
+
+    # 종료
+    yield f"--{boundary}--\r\n".encode()
+
+
+class CachedGzip:
+    """
+    GzipCache 항목: 메모리(data) 또는 디스크 스필 파일(spill_path) 중 하나에 압축 결과를 가진다.
+    캐시에 담지 못한 큰 결과는 이번 요청에만 쓰는 임시 스풀(spool)로 넘긴다 (전송 후 닫음).
+    """
+    __slots__ = ("size", "data", "spill_path", "spool")
+
+    def __init__(self, size: int, data: Optional[bytes] = None, spill_path: Optional[str] = None, spool=None):
+        self.size = size
+        self.data = data
+        self.spill_path = spill_path
+        self.spool = spool
+
+
+class GzipCache:
+    """
+    모든 SenderWorker 가 공유하는 gzip 압축 결과 캐시 (스레드 안전, 용량 제한 LRU).
+    - 키: (절대경로, mtime_ns, 크기, 압축 레벨) → 파일이 바뀌면 자동으로 새로 압축
+    - 메모리 한도(max_mem_bytes)를 넘으면 오래 안 쓴 항목부터 밀어낸다.
+    - spill_dir 를 주면 밀려난 항목/메모리에 안 들어가는 큰 항목은 디스크에 보관한다.
+    - 같은 키를 여러 스레드가 동시에 요청하면 한 스레드만 압축하고 나머지는 기다린다.
+    - 어디에도 담을 수 없던 키는 기억해 두고, 다음부터는 압축 없이 바로 None (호출 측 스트리밍 압축).
+    """
+
+    def __init__(self, max_mem_bytes: int, spill_dir: Optional[str] = None, max_spill_bytes: int = 0):
+        self.max_mem_bytes = max(0, max_mem_bytes)
+        self.spill_dir = spill_dir
+        self.max_spill_bytes = max_spill_bytes  # 0이면 디스크 용량 제한 없음
+        self._lock = threading.Lock()
+        self._mem: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._mem_bytes = 0
+        self._spill: "OrderedDict[tuple, Tuple[str, int]]" = OrderedDict()
+        self._spill_bytes = 0
+        self._inflight: Dict[tuple, threading.Event] = {}
+        self._uncacheable: set = set()
+        self.hits = 0
+        self.misses = 0
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(path: str, level: int) -> tuple:
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, level)
+
+    def get(self, path: str, level: int) -> Optional[CachedGzip]:
+        """
+        캐시된 압축 결과를 반환한다. 없으면 압축해서 넣은 뒤 반환.
+        메모리/디스크 어디에도 담을 수 없는 크기면 처음 한 번은 압축한 임시 스풀을 돌려주고,
+        그 뒤로는 None (호출 측에서 스트리밍 압축).
+        """
+        key = self.make_key(path, level)
+        while True:
+            with self._lock:
+                entry = self._lookup_locked(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry
+                if key in self._uncacheable:
+                    self.misses += 1
+                    return None
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    self.misses += 1
+                    self._inflight[key] = threading.Event()
+                    break
+            # 다른 스레드가 압축 중 → 끝날 때까지 대기 후 다시 조회
+            waiter.wait()
+
+        try:
+            return self._compress_and_store(key, path, level)
+        finally:
+            with self._lock:
+                ev = self._inflight.pop(key, None)
+            if ev is not None:
+                ev.set()
+
+    def _lookup_locked(self, key: tuple) -> Optional[CachedGzip]:
+        data = self._mem.get(key)
+        if data is not None:
+            self._mem.move_to_end(key)
+            return CachedGzip(len(data), data=data)
+        spilled = self._spill.get(key)
+        if spilled is not None:
+            self._spill.move_to_end(key)
+            return CachedGzip(spilled[1], spill_path=spilled[0])
+        return None
+
+    def _compress_and_store(self, key: tuple, path: str, level: int) -> CachedGzip:
+        spool, gz_len = gzip_spool(iter_file_chunks(path, FILE_READ_CHUNK), level)
+        if gz_len > self.max_mem_bytes and not self.spill_dir:
+            # 담을 곳이 없음 → 이미 압축한 스풀은 이번 요청에 그대로 쓰고, 다음부터는 바로 스트리밍
+            with self._lock:
+                self._uncacheable.add(key)
+            return CachedGzip(gz_len, spool=spool)
+        with spool:
+            if gz_len <= self.max_mem_bytes:
+                data = spool.read()
+                with self._lock:
+                    self._mem[key] = data
+                    self._mem_bytes += gz_len
+                    evicted = self._evict_mem_locked()
+                self._spill_evicted(evicted)
+                return CachedGzip(gz_len, data=data)
+            spill_path = self._spill_path(key)
+            with open(spill_path, "wb") as f:
+                shutil.copyfileobj(spool, f)
+            self._add_spill(key, spill_path, gz_len)
+            return CachedGzip(gz_len, spill_path=spill_path)
+
+    def _evict_mem_locked(self) -> List[Tuple[tuple, bytes]]:
+        evicted = []
+        while self._mem_bytes > self.max_mem_bytes and self._mem:
+            k, v = self._mem.popitem(last=False)
+            self._mem_bytes -= len(v)
+            evicted.append((k, v))
+        return evicted
+
+    def _spill_evicted(self, evicted: List[Tuple[tuple, bytes]]):
+        # 디스크 쓰기는 락 밖에서 수행
+        if not self.spill_dir:
+            return
+        for k, v in evicted:
+            try:
+                spill_path = self._spill_path(k)
+                with open(spill_path, "wb") as f:
+                    f.write(v)
+                self._add_spill(k, spill_path, len(v))
+            except OSError:
+                pass
+
+    def _add_spill(self, key: tuple, spill_path: str, size: int):
+        removed = []
+        with self._lock:
+            old = self._spill.pop(key, None)
+            if old is not None:
+                self._spill_bytes -= old[1]
+            self._spill[key] = (spill_path, size)
+            self._spill_bytes += size
+            while self.max_spill_bytes and self._spill_bytes > self.max_spill_bytes and len(self._spill) > 1:
+                _, (p, sz) = self._spill.popitem(last=False)
+                self._spill_bytes -= sz
+                removed.append(p)
+        for p in removed:
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+    def _spill_path(self, key: tuple) -> str:
+        name = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.spill_dir, f"{name}.gz")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits, "misses": self.misses,
+                "mem_items": len(self._mem), "mem_bytes": self._mem_bytes,
+                "spill_items": len(self._spill), "spill_bytes": self._spill_bytes,
+            }
+
+
+class MmapBodyCache:
+    """
+    반복 전송되는 파일을 읽기 전용 mmap 으로 한 번만 매핑해 모든 워커가 공유한다 (스레드 안전, 용량 제한 LRU).
+    - 전송 시에는 memoryview 조각만 넘기므로 요청마다 파일을 다시 열거나 bytes 를 만들지 않는다.
+    - 키는 GzipCache 와 같음 → 파일이 바뀌면 새로 매핑. 밀려난 매핑은 쓰던 전송이 끝나 참조가 없어지면 해제된다.
+    - 멀티프로세스 모드에서는 프로세스마다 매핑하지만 같은 페이지 캐시를 공유한다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        self._views: "OrderedDict[tuple, memoryview]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str) -> Optional[memoryview]:
+        """파일 전체의 읽기 전용 memoryview. 빈 파일/한도 초과/매핑 실패면 None (호출 측에서 일반 읽기)."""
+        key = GzipCache.make_key(path, 0)
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                self.hits += 1
+                return view
+            self.misses += 1
+        size = key[2]
+        if size == 0 or size > self.max_bytes:
+            return None
+        try:
+            with open(path, "rb") as f:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            if key not in self._views:
+                self._views[key] = view
+                self._bytes += len(view)
+                while self._bytes > self.max_bytes and len(self._views) > 1:
+                    _, old = self._views.popitem(last=False)
+                    self._bytes -= len(old)
+        return view
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "items": len(self._views), "bytes": self._bytes}
+
+
+def trailer_decl_str(trailers: Dict[str, str]) -> Optional[str]:
+    if not trailers:
+        return None
+    return ", ".join(trailers.keys())
+
+
+def chunk_ext_bytes(opts: ClientOptions) -> bytes:
+    ce = opts.chunk_ext.strip()
+    if ce and not ce.startswith(";"):
+        ce = ";" + ce
+    return ce.encode("ascii")
+
+
+def content_length_head_parts(opts: ClientOptions, filename_for_header: Optional[str]) -> Tuple[bytes, bytes]:
+    """Content-Length 요청 헤더를 길이 값 앞/뒤 두 조각으로 직렬화 (길이만 바꿔 끼워 재사용)"""
+    buf = build_request_line_and_base_headers(opts)
+    if opts.use_gzip:
+        buf += b"Content-Encoding: gzip\r\n"
+    buf += b"Content-Length: "
+    prefix = bytes(buf)
+    buf = bytearray(CRLF)
+    # 비멀티파트 파일 전송 시, 서버가 파일명을 알 수 있도록 헤더 보강
+    if filename_for_header and opts.add_x_filename_header and "X-Filename" not in opts.extra_headers:
+        buf += f"X-Filename: {filename_for_header}".encode("utf-8") + CRLF
+    if trailer_decl_str(opts.trailing_headers):
+        buf += b"X-Warning: Trailer headers require chunked encoding\r\n"
+    add_header_lines(buf, opts.extra_headers)
+    buf += CRLF
+    return prefix, bytes(buf)
+
+
+def build_content_length_head(opts: ClientOptions, declared_len: int, filename_for_header: Optional[str]) -> bytes:
+    prefix, suffix = content_length_head_parts(opts, filename_for_header)
+    return b"%s%d%s" % (prefix, declared_len, suffix)
+
+
+def build_chunked_head(opts: ClientOptions, filename_for_header: Optional[str]) -> bytearray:
+    buf = build_request_line_and_base_headers(opts)
+    buf += b"Transfer-Encoding: chunked\r\n"
+    if opts.use_gzip:
+        buf += b"Content-Encoding: gzip\r\n"
+    # 파일명 보강
+    if filename_for_header and opts.add_x_filename_header and "X-Filename" not in opts.extra_headers:
+        buf += f"X-Filename: {filename_for_header}".encode("utf-8") + CRLF
+    tdecl = trailer_decl_str(opts.trailing_headers)
+    if tdecl:
+        buf += f"Trailer: {tdecl}".encode("ascii") + CRLF
+    add_header_lines(buf, opts.extra_headers)
+    buf += CRLF
+    return buf
+
+
+def build_last_chunk(opts: ClientOptions) -> bytes:
+    """마지막 0 청크 + 트레일러 헤더 + 종료 CRLF"""
+    buf = bytearray(b"0" + chunk_ext_bytes(opts) + CRLF)
+    add_header_lines(buf, opts.trailing_headers)
+    buf += CRLF
+    return bytes(buf)
+
+
+class ChunkFramer:
+    """
+    chunked 바디 프레이밍 (스레드/asyncio 엔진 공용).
+    - 큰 청크: [모아둔 버퍼, 크기줄, 페이로드, CRLF] 를 버퍼 목록으로 넘김 → sendmsg 한 번, 페이로드 복사 없음
+    - 작은 청크: 쓰기 버퍼에 모았다가 CHUNK_COALESCE_BYTES 마다 한 번에
+    - 요청 헤더는 첫 청크와, 마지막 0 청크 + 트레일러는 남은 버퍼와 함께 나간다.
+    """
+    __slots__ = ("ext", "pending")
+
+    def __init__(self, head: bytes, ext: bytes):
+        self.ext = ext
+        self.pending = bytearray(head)
+
+    def frame(self, part) -> Optional[List]:
+        """part 를 프레이밍하고, 지금 보내야 할 버퍼 목록을 반환 (계속 모으는 중이면 None)"""
+        n = len(part)
+        if not n:
+            return None
+        if n < CHUNK_INLINE_MAX:
+            self.pending += b"%X%s\r\n" % (n, self.ext)
+            self.pending += part
+            self.pending += CRLF
+            if len(self.pending) < CHUNK_COALESCE_BYTES:
+                return None
+            return self._take([])
+        return self._take([b"%X%s\r\n" % (n, self.ext), part, CRLF])
+
+    def finish(self, last_chunk: bytes) -> List:
+        self.pending += last_chunk
+        return self._take([])
+
+    def _take(self, bufs: List) -> List:
+        if self.pending:
+            bufs.insert(0, self.pending)
+            self.pending = bytearray()
+        return bufs
+
+
+def sendmsg_all(sock: socket.socket, bufs: List):
+    """버퍼 목록을 sendmsg 로 모두 보낸다 (부분 전송이면 남은 부분부터 이어서)."""
+    views = [memoryview(b).cast("B") for b in bufs if len(b)]
+    while views:
+        sent = sock.sendmsg(views)
+        while sent:
+            n = views[0].nbytes
+            if sent < n:
+                views[0] = views[0][sent:]
+                break
+            sent -= n
+            views.pop(0)
+
+
+def parse_status_line(data: bytes) -> Optional[Tuple[int, str]]:
+    # 첫 줄 파싱: HTTP/1.1 200 OK
+    first_line, *_ = data.split(b"\r\n", 1)
+    parts = first_line.split()
+    if len(parts) < 2:
+        return None
+
+    # parts[1] 이 상태코드
+    try:
+        status = int(parts[1])
+    except ValueError:
+        return None
+
+    reason = b" ".join(parts[2:]).decode("ascii", "ignore") if len(parts) > 2 else ""
+    return status, reason
+
+
+class ResponseError(Exception):
+    """응답 형식 오류 (연결을 더 쓸 수 없음)"""
+
+
+class HttpResponse:
+    """
+    파싱된 HTTP 응답 하나.
+    - headers / trailers: 이름은 소문자, 같은 이름이 여러 번 오면 ", " 로 합침
+    - body_len: 실제 받은 바디 크기, body_prefix: 앞 RESPONSE_BODY_KEEP 바이트만 보관 (나머지는 버림)
+    - will_close: 이 응답 뒤로 연결을 재사용할 수 없음 (Connection: close, HTTP/1.0, 끝이 연결 종료인 바디)
+    """
+    __slots__ = ("version", "status", "reason", "headers", "trailers", "body_len", "body_prefix", "will_close",
+                 "complete")
+
+    def __init__(self, version: str, status: int, reason: str, headers: Dict[str, str]):
+        self.version = version
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.trailers: Dict[str, str] = {}
+        self.body_len = 0
+        self.body_prefix = b""
+        conn_tokens = {t.strip().lower() for t in headers.get("connection", "").split(",")}
+        if version == "HTTP/1.0":
+            self.will_close = "keep-alive" not in conn_tokens
+        else:
+            self.will_close = "close" in conn_tokens
+        self.complete = False
+
+    def status_tuple(self) -> Tuple[int, str]:
+        return self.status, self.reason
+
+
+def _parse_header_lines(lines: List[bytes], into: Dict[str, str]):
+    for line in lines:
+        if not line:
+            continue
+        k, sep, v = line.partition(b":")
+        if not sep:
+            raise ResponseError(f"잘못된 헤더 줄: {line[:80]!r}")
+        name = k.strip().decode("latin-1").lower()
+        value = v.strip().decode("latin-1")
+        into[name] = f"{into[name]}, {value}" if name in into else value
+
+
+class ResponseParser:
+    """
+    점진적(incremental) HTTP/1.x 응답 파서. 연결마다 하나씩 두고 받은 바이트를 feed 한다.
+    - 바디: Content-Length / chunked(+트레일러) / 연결 종료까지 모두 처리하고 끝까지 소비(버림)한다.
+    - 1xx 중간 응답은 건너뛴다. 204/304 는 바디 없음.
+    - 다음 응답의 바이트가 함께 와도 버퍼에 남겨 두므로 keep-alive / 파이프라이닝에 안전하다.
+    """
+    _HEAD, _LENGTH, _CHUNK_SIZE, _CHUNK_DATA, _CHUNK_END, _TRAILERS, _UNTIL_CLOSE = range(7)
+
+    def __init__(self, keep_body: int = RESPONSE_BODY_KEEP):
+        self.keep_body = keep_body
+        self._buf = bytearray()
+        self._state = self._HEAD
+        self._remaining = 0
+        self._prefix = bytearray()
+        self.current: Optional[HttpResponse] = None   # 헤더까지 받았고 바디를 읽는 중인 응답
+        self._done: "deque[HttpResponse]" = deque()
+
+    def feed(self, data: bytes):
+        self._buf += data
+        self._run()
+
+    def feed_eof(self):
+        """연결이 닫혔을 때 호출. 연결 종료로 끝나는 바디면 완료 처리, 그 외 읽던 응답은 불완전으로 남는다."""
+        if self._state == self._UNTIL_CLOSE and self.current is not None:
+            self._finish()
+
+    def next_response(self) -> Optional[HttpResponse]:
+        return self._done.popleft() if self._done else None
+
+    def _run(self):
+        buf = self._buf
+        while True:
+            st = self._state
+            if st == self._HEAD:
+                end = buf.find(b"\r\n\r\n")
+                if end < 0:
+                    if len(buf) > RESPONSE_MAX_HEAD:
+                        raise ResponseError("응답 헤더가 너무 큽니다")
+                    return
+                head = bytes(buf[:end])
+                del buf[:end + 4]
+                self._start(head)
+            elif st == self._LENGTH:
+                if not buf:
+                    return
+                self._consume(min(self._remaining, len(buf)))
+                if self._remaining == 0:
+                    self._finish()
+            elif st == self._CHUNK_SIZE:
+                end = buf.find(CRLF)
+                if end < 0:
+                    return
+                line = bytes(buf[:end]).split(b";", 1)[0].strip()
+                del buf[:end + 2]
+                try:
+                    size = int(line, 16)
+                except ValueError:
+                    raise ResponseError(f"잘못된 청크 크기: {line[:20]!r}")
+                if size == 0:
+                    self._state = self._TRAILERS
+                else:
+                    self._remaining = size
+                    self._state = self._CHUNK_DATA
+            elif st == self._CHUNK_DATA:
+                if not buf:
+                    return
+                self._consume(min(self._remaining, len(buf)))
+                if self._remaining == 0:
+                    self._state = self._CHUNK_END
+            elif st == self._CHUNK_END:
+                if len(buf) < 2:
+                    return
+                if buf[:2] != CRLF:
+                    raise ResponseError("청크 뒤 CRLF 누락")
+                del buf[:2]
+                self._state = self._CHUNK_SIZE
+            elif st == self._TRAILERS:
+                if buf[:2] == CRLF:
+                    del buf[:2]
+                    self._finish()
+                    continue
+                end = buf.find(b"\r\n\r\n")
+                if end < 0:
+                    return
+                _parse_header_lines(bytes(buf[:end]).split(CRLF), self.current.trailers)
+                del buf[:end + 4]
+                self._finish()
+            else:  # _UNTIL_CLOSE
+                if not buf:
+                    return
+                self._consume(len(buf))
+
+    def _start(self, head: bytes):
+        lines = head.split(CRLF)
+        parts = lines[0].split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/"):
+            raise ResponseError(f"잘못된 상태 줄: {lines[0][:80]!r}")
+        try:
+            status = int(parts[1])
+        except ValueError:
+            raise ResponseError(f"잘못된 상태 코드: {parts[1][:20]!r}")
+        headers: Dict[str, str] = {}
+        _parse_header_lines(lines[1:], headers)
+        resp = HttpResponse(parts[0].decode("ascii", "ignore"), status,
+                            parts[2].decode("latin-1") if len(parts) > 2 else "", headers)
+
+        if 100 <= status < 200 and status != 101:
+            return  # 100 Continue 등 중간 응답은 버리고 다음 헤더를 기다림
+        self.current = resp
+        self._prefix = bytearray()
+        te = headers.get("transfer-encoding", "").lower()
+        if status in (204, 304) or status == 101:
+            resp.will_close = resp.will_close or status == 101  # 프로토콜 전환 후에는 HTTP 로 못 씀
+            self._finish()
+        elif te and te.rsplit(",", 1)[-1].strip() == "chunked":
+            self._state = self._CHUNK_SIZE
+        elif "content-length" in headers:
+            try:
+                self._remaining = int(headers["content-length"].split(",")[0])
+            except ValueError:
+                raise ResponseError(f"잘못된 Content-Length: {headers['content-length'][:20]!r}")
+            self._state = self._LENGTH
+            if self._remaining == 0:
+                self._finish()
+        else:
+            resp.will_close = True
+            self._state = self._UNTIL_CLOSE
+
+    def _consume(self, n: int):
+        room = self.keep_body - len(self._prefix)
+        if room > 0:
+            self._prefix += self._buf[:min(room, n)]
+        del self._buf[:n]
+        self.current.body_len += n
+        self._remaining -= n
+
+    def _finish(self):
+        resp = self.current
+        resp.body_prefix = bytes(self._prefix)
+        resp.complete = True
+        self._done.append(resp)
+        self.current = None
+        self._state = self._HEAD
+
+
+# ------------------ Body sources ------------------
+# 디스크 파일 없이 메모리에서 만드는 전송 항목 (all_items 에 파일 경로 대신 넣는다).
+# 길이는 미리 정해져 있어 Content-Length 를 바로 쓰고, 요청마다 open() 이 본문 조각을 새로 내준다.
+# 항목 키(템플릿 캐시/이벤트 로그)로 쓰이므로 객체 자체로 해시된다.
+
+# RandomBody 가 만들어 두고 반복해 보내는 난수 블록 크기
+BODY_SOURCE_BLOCK = 1024 * 1024
+# gzip 헤더 (mtime 0, OS 미상) — RandomBody 가 압축 조각을 이어 붙여 gzip 스트림을 만들 때 사용
+_GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+
+
+class BodySource:
+    """메모리 바디 소스 기본형: size() 는 정확한 바이트 수, open(chunk_size) 는 이번 요청의 본문 조각들"""
+    __slots__ = ("name", "filename")
+
+    def __init__(self, name: str, filename: Optional[str] = None):
+        self.name = name            # 로그/상태 표시용
+        self.filename = filename    # X-Filename / multipart 파일명 (없으면 보내지 않음 / "blob")
+
+    def size(self) -> int:
+        raise NotImplementedError
+
+    def open(self, chunk_size: int) -> Iterable:
+        raise NotImplementedError
+
+    def gzipped(self, level: int) -> Optional[bytes]:
+        """이번 요청 본문의 gzip 결과를 미리 만들어 둔 소스면 그 바이트, 아니면 None"""
+        return None
+
+    def open_gzipped(self, level: int, chunk_size: int) -> Optional[Tuple[int, Iterable]]:
+        """이번 요청 본문의 gzip (길이, 조각들). 캐시가 없는 소스면 None (호출 측에서 압축)"""
+        gz = self.gzipped(level)
+        if gz is None:
+            return None
+        return len(gz), ([gz] if len(gz) <= chunk_size else iter_view_chunks(memoryview(gz), chunk_size))
+
+
+class BytesBody(BodySource):
+    """미리 인코딩해 둔 바이트 (텍스트 본문 등). gzip 결과도 레벨별로 한 번만 만든다."""
+    __slots__ = ("data", "_gz")
+
+    def __init__(self, data: bytes, name: Optional[str] = None, filename: Optional[str] = None):
+        super().__init__(name or f"바이트({len(data)}B)", filename)
+        self.data = bytes(data)
+        self._gz: Dict[int, bytes] = {}
+
+    def size(self) -> int:
+        return len(self.data)
+
+    def open(self, chunk_size: int) -> Iterable:
+        if len(self.data) <= chunk_size:
+            return [self.data]
+        return iter_view_chunks(memoryview(self.data), chunk_size)
+
+    def gzipped(self, level: int) -> bytes:
+        gz = self._gz.get(level)
+        if gz is None:
+            gz = self._gz[level] = gzip_bytes(self.data, level)
+        return gz
+
+
+class RandomBody(BodySource):
+    """
+    seed 로 정해지는 난수 본문 length 바이트 (수 GB 도 가능).
+    BODY_SOURCE_BLOCK 크기 블록 하나를 처음 쓸 때 만들고, 그 블록의 memoryview 를 이어 붙여 보낸다.
+    gzip 도 블록 단위로 한 번만 압축한다: 블록을 Z_FULL_FLUSH 로 끊어 압축한 조각은 앞 내용을 참조하지 않으므로
+    같은 조각을 반복해 이어 붙이고 헤더/CRC 트레일러만 붙이면 전체 본문의 gzip 스트림이 된다.
+    (멀티프로세스 모드로 넘길 때는 블록/압축 결과를 빼고 설정값만 넘김)
+    """
+    __slots__ = ("length", "seed", "_block", "_crc", "_gz")
+
+    def __init__(self, length: int, seed: int = 0, name: Optional[str] = None, filename: Optional[str] = None):
+        super().__init__(name or f"난수({length}B, seed={seed})", filename)
+        self.length = max(0, int(length))
+        self.seed = seed
+        self._block: Optional[bytes] = None
+        self._crc: Optional[int] = None
+        self._gz: Dict[int, Tuple[bytes, bytes]] = {}
+
+    def __getstate__(self):
+        return self.name, self.filename, self.length, self.seed
+
+    def __setstate__(self, state):
+        self.name, self.filename, self.length, self.seed = state
+        self._block = None
+        self._crc = None
+        self._gz = {}
+
+    def size(self) -> int:
+        return self.length
+
+    def _get_block(self) -> bytes:
+        block = self._block
+        if block is None:
+            block = self._block = random.Random(self.seed).randbytes(min(self.length, BODY_SOURCE_BLOCK))
+        return block
+
+    def open(self, chunk_size: int) -> Iterable[memoryview]:
+        return self._iter(memoryview(self._get_block()), max(1, chunk_size))
+
+    def open_gzipped(self, level: int, chunk_size: int) -> Tuple[int, Iterable]:
+        block = self._get_block()
+        full, tail = divmod(self.length, len(block)) if block else (0, 0)
+        segs = self._gz.get(level)
+        if segs is None:
+            co = zlib.compressobj(level, zlib.DEFLATED, -15)
+            seg = co.compress(block) + co.flush(zlib.Z_FULL_FLUSH)
+            co = zlib.compressobj(level, zlib.DEFLATED, -15)
+            segs = self._gz[level] = (seg, co.compress(block[:tail]) + co.flush())
+        if self._crc is None:
+            crc = 0
+            for _ in range(full):
+                crc = zlib.crc32(block, crc)
+            self._crc = zlib.crc32(block[:tail], crc)
+        seg, last = segs
+        trailer = struct.pack("<II", self._crc, self.length & 0xFFFFFFFF)
+        length = len(_GZIP_HEADER) + full * len(seg) + len(last) + len(trailer)
+        return length, self._iter_gzipped(seg, full, last, trailer, max(1, chunk_size))
+
+    @staticmethod
+    def _iter_gzipped(seg: bytes, full: int, last: bytes, trailer: bytes, chunk_size: int) -> Iterable:
+        yield _GZIP_HEADER
+        view = memoryview(seg)
+        for _ in range(full):
+            yield from iter_view_chunks(view, chunk_size)
+        yield last
+        yield trailer
+
+    def _iter(self, block: memoryview, chunk_size: int) -> Iterable[memoryview]:
+        remaining = self.length
+        pos = 0
+        while remaining > 0:
+            n = min(chunk_size, remaining, len(block) - pos)
+            yield block[pos:pos + n]
+            remaining -= n
+            pos = (pos + n) % len(block)
+
+
+class BodyPlan:
+    """
+    한 요청의 바디를 어떻게 보낼지 정리한 결과 (스레드/asyncio 엔진 공용).
+    - chunked: True 면 parts 를 청크로 프레이밍
+    - file_path: Content-Length 전송에서 sendfile 로 보낼 수 있는 파일 (이때 parts 는 None)
+    - spool: 전송 후 닫아야 하는 임시 스풀
+    - blocking: parts 를 꺼낼 때 디스크 읽기/압축이 일어남 (asyncio 엔진은 실행기 스레드에서 꺼냄)
+    """
+    __slots__ = ("chunked", "parts", "length", "filename_hint", "file_path", "spool", "blocking")
+
+    def __init__(self, chunked: bool, parts=None, length: int = 0, filename_hint: Optional[str] = None,
+                 file_path: Optional[str] = None, spool=None, blocking: bool = False):
+        self.chunked = chunked
+        self.parts = parts
+        self.length = length
+        self.filename_hint = filename_hint
+        self.file_path = file_path
+        self.spool = spool
+        self.blocking = blocking
+
+    def close(self):
+        if self.spool is not None:
+            try:
+                self.spool.close()
+            except Exception:
+                pass
+            self.spool = None
+
+
+def multipart_boundary() -> str:
+    return f"----PyBlastBoundary{int(time.time()*1000)}"
+
+
+def build_body_plan(opts: ClientOptions, gzip_cache: Optional[GzipCache] = None,
+                    boundary: Optional[str] = None, mmap_cache: Optional[MmapBodyCache] = None) -> BodyPlan:
+    """
+    boundary: RequestTemplate 이 고정해 둔 multipart 경계 (없으면 요청마다 새로 만든다)
+    mmap_cache: 주면 파일 본문을 mmap 조각(memoryview)으로 보낸다
+    """
+    source = opts.body_source
+    if source is not None:
+        filename_hint = source.filename
+    else:
+        filename_hint = os.path.basename(opts.file_path) if opts.file_path else None
+
+    def file_chunks(chunk_size: int) -> Tuple[Iterable, bool]:
+        """(조각들, 디스크에서 읽는지)"""
+        view = mmap_cache.get(opts.file_path) if mmap_cache is not None else None
+        if view is not None:
+            return iter_view_chunks(view, chunk_size), False
+        return iter_file_chunks(opts.file_path, chunk_size), True
+
+    # multipart
+    if opts.use_multipart:
+        boundary = boundary or multipart_boundary()
+        from_disk = False
+        if source is not None:
+            file_iter = source.open(opts.chunk_size)
+        elif opts.file_path:
+            file_iter, from_disk = file_chunks(opts.chunk_size)
+        else:
+            file_iter = [opts.body_text or b""]
+        filespec = ((source.filename or "") if source is not None else (opts.file_path or ""), None, file_iter)
+        body_stream = multipart_iter(
+            filespec, boundary, opts.multipart_text_fields,
+            opts.multipart_filename_override, opts.multipart_field_name
+        )
+        opts.extra_headers.setdefault("Content-Type", f"multipart/form-data; boundary={boundary}")
+
+        if opts.use_gzip:
+            return _gzip_stream_plan(opts, body_stream, filename_hint)
+        if opts.use_chunked:
+            return BodyPlan(True, body_stream, filename_hint=filename_hint, blocking=from_disk)
+        parts = [p for p in body_stream]
+        return BodyPlan(False, parts, sum(len(p) for p in parts), filename_hint)
+
+    # non-multipart (memory source)
+    if source is not None:
+        if opts.use_gzip:
+            # 소스가 캐시한 압축 결과를 그대로 (디스크 스풀 없음)
+            gz = source.open_gzipped(opts.gzip_level, opts.chunk_size if opts.use_chunked else FILE_READ_CHUNK)
+            if gz is None:
+                if opts.use_chunked:
+                    return _gzip_stream_plan(opts, source.open(FILE_READ_CHUNK), filename_hint)
+                body = gzip_bytes(b"".join(source.open(FILE_READ_CHUNK)), opts.gzip_level)
+                gz = len(body), [body]
+            return BodyPlan(opts.use_chunked, gz[1], gz[0], filename_hint)
+        if opts.use_chunked:
+            return BodyPlan(True, source.open(opts.chunk_size), filename_hint=filename_hint)
+        return BodyPlan(False, source.open(FILE_READ_CHUNK), source.size(), filename_hint)
+
+    # non-multipart (raw file)
+    if opts.file_path:
+        if opts.use_gzip:
+            if gzip_cache is not None:
+                cached = gzip_cache.get(opts.file_path, opts.gzip_level)
+                if cached is not None:
+                    return _gzip_cached_plan(opts, cached, filename_hint)
+            return _gzip_stream_plan(opts, file_chunks(FILE_READ_CHUNK)[0], filename_hint)
+        if opts.use_chunked:
+            parts, from_disk = file_chunks(opts.chunk_size)
+            return BodyPlan(True, parts, filename_hint=filename_hint, blocking=from_disk)
+        if mmap_cache is not None and not can_sendfile(opts):
+            # sendfile 을 쓰지 않을 때만 매핑 전체를 한 번에 (sendfile 쪽이 복사가 더 적음)
+            view = mmap_cache.get(opts.file_path)
+            if view is not None:
+                return BodyPlan(False, [view], len(view), filename_hint)
+        return BodyPlan(False, None, os.path.getsize(opts.file_path), filename_hint, file_path=opts.file_path)
+
+    # text body
+    body = opts.body_text or b""
+    if opts.use_gzip:
+        body = gzip_bytes(body, opts.gzip_level)
+    if opts.use_chunked:
+        return BodyPlan(True, [body])
+    return BodyPlan(False, [body], len(body))
+
+
+def _gzip_cached_plan(opts: ClientOptions, cached: CachedGzip, filename_hint: Optional[str]) -> BodyPlan:
+    """GzipCache 에 있는 압축 결과를 다시 압축하지 않고 그대로 보낸다."""
+    if cached.spool is not None:
+        chunk = opts.chunk_size if opts.use_chunked else FILE_READ_CHUNK
+        return BodyPlan(opts.use_chunked, iter_fileobj_chunks(cached.spool, chunk), cached.size,
+                        filename_hint, spool=cached.spool, blocking=True)
+    if cached.data is not None:
+        if opts.use_chunked:
+            view = memoryview(cached.data)
+            step = max(1, opts.chunk_size)
+            return BodyPlan(True, (view[i:i + step] for i in range(0, cached.size, step)),
+                            filename_hint=filename_hint)
+        return BodyPlan(False, [cached.data], cached.size, filename_hint)
+
+    if opts.use_chunked:
+        return BodyPlan(True, iter_file_chunks(cached.spill_path, opts.chunk_size), filename_hint=filename_hint,
+                        blocking=True)
+    return BodyPlan(False, None, cached.size, filename_hint, file_path=cached.spill_path)
+
+
+def _gzip_stream_plan(opts: ClientOptions, raw_iter: Iterable[bytes], filename_hint: Optional[str]) -> BodyPlan:
+    """
+    원본 청크를 스트리밍 gzip 으로 압축하며 전송한다.
+    - chunked: 압축 결과를 chunk_size 단위 청크로 바로 흘려보냄
+    - Content-Length: 길이를 알아야 하므로 임시 스풀에 압축 후 전송
+    """
+    if opts.use_chunked:
+        return BodyPlan(True, gzip_stream(raw_iter, opts.gzip_level, opts.chunk_size), filename_hint=filename_hint,
+                        blocking=True)
+    spool, gz_len = gzip_spool(raw_iter, opts.gzip_level)
+    return BodyPlan(False, iter_fileobj_chunks(spool, FILE_READ_CHUNK), gz_len, filename_hint, spool=spool,
+                    blocking=True)
+
+
+def classify_response(resp: Optional[Tuple[int, str]]) -> Tuple[Optional[int], str, str, str]:
+    """
+    응답(status, reason)을 판정하여 (status_code, 응답 문자열, 판정, 로그 태그) 반환.
+    """
+    if resp is None:
+        return None, "응답 없음", "차단 의심(응답 없음/짧은 응답)", "[BLOCK]"
+
+    status, reason = resp
+    status_str = f"{status} {reason}"
+    if 200 <= status < 300:
+        return status, status_str, "성공", "[SUCCESS]"
+    elif 400 <= status < 500:
+        return status, status_str, "차단/클라이언트 오류", "[BLOCK]"
+    elif 500 <= status < 600:
+        return status, status_str, "서버 오류(또는 DUT 차단)", "[SERVER_ERR]"
+    return status, status_str, "기타 응답", "[INFO]"
+
+
+def clone_opts_for_item(o: ClientOptions, item) -> ClientOptions:
+    new = ClientOptions(
+        host=o.host, port=o.port, path=o.path, method=o.method, keep_alive=o.keep_alive,
+        use_chunked=o.use_chunked, chunk_size=o.chunk_size, chunk_ext=o.chunk_ext,
+        use_gzip=o.use_gzip, use_multipart=o.use_multipart,
+        extra_headers=dict(o.extra_headers), trailing_headers=dict(o.trailing_headers),
+        connect_timeout=o.connect_timeout, read_timeout=o.read_timeout,
+        fire_and_go=o.fire_and_go, http_version=o.http_version,
+        body_text=o.body_text, file_path=o.file_path,
+        multipart_field_name=o.multipart_field_name,
+        multipart_text_fields=dict(o.multipart_text_fields),
+        multipart_filename_override=o.multipart_filename_override,
+        add_x_filename_header=o.add_x_filename_header,
+        delay_between=o.delay_between, use_sendfile=o.use_sendfile,
+        gzip_level=o.gzip_level,
+        use_tls=o.use_tls, tls_verify=o.tls_verify, tls_server_name=o.tls_server_name,
+        tls_ca_file=o.tls_ca_file, tls_cert_file=o.tls_cert_file, tls_key_file=o.tls_key_file,
+        tls_session_reuse=o.tls_session_reuse,
+    )
+    if isinstance(item, BodySource):  # 메모리 바디
+        new.file_path = None
+        new.body_text = None
+        new.body_source = item
+    elif isinstance(item, tuple) and item[0] == "__TEXT__":  # 텍스트
+        new.file_path = None
+        new.body_text = item[1].encode("utf-8")
+    else:
+        new.file_path = item if item else None
+    return new
+
+
+def item_desc(item) -> str:
+    if isinstance(item, BodySource):
+        return item.name
+    if isinstance(item, tuple) and item[0] == "__TEXT__":
+        return f"텍스트({len(item[1])}자)"
+    elif item:
+        return os.path.basename(item)
+    return "빈 바디"
+
+
+def estimate_item_bytes(item) -> int:
+    """
+    대략적인 전송 바디 크기 추정.
+    - 메모리 바디: 정확한 길이
+    - 텍스트: UTF-8 바이트 길이
+    - 파일: 파일 크기
+    """
+    try:
+        if isinstance(item, BodySource):
+            return item.size()
+        if isinstance(item, tuple) and item[0] == "__TEXT__":
+            return len(item[1].encode("utf-8"))
+        elif isinstance(item, str) and item:
+            return os.path.getsize(item)
+    except Exception:
+        pass
+    return 0
+
+
+def can_sendfile(opts: ClientOptions) -> bool:
+    """커널 sendfile 로 파일 본문을 보낼 수 있는지 (TLS 는 암호화해야 하므로 불가)"""
+    return opts.use_sendfile and not opts.use_tls and hasattr(os, "sendfile")
+
+
+# ------------------ TLS ------------------
+
+def tls_key(opts: ClientOptions) -> tuple:
+    """SSLContext 를 나눠 쓸 수 있는 TLS 설정 묶음 (TLS 를 안 쓰면 빈 튜플)"""
+    if not opts.use_tls:
+        return ()
+    return (opts.tls_verify, opts.tls_ca_file, opts.tls_cert_file, opts.tls_key_file)
+
+
+def tls_server_name(opts: ClientOptions) -> str:
+    return opts.tls_server_name or opts.host
+
+
+def build_ssl_context(opts: ClientOptions) -> ssl.SSLContext:
+    ctx = ssl.create_default_context(cafile=opts.tls_ca_file or None)
+    if not opts.tls_verify:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    if opts.tls_cert_file:
+        ctx.load_cert_chain(opts.tls_cert_file, opts.tls_key_file or None)
+    ctx.set_alpn_protocols(["http/1.1"])
+    return ctx
+
+
+class TlsSessionCache:
+    """
+    프로세스 안의 모든 연결이 함께 쓰는 TLS 준비물 (스레드 안전).
+    - SSLContext: 설정(tls_key)별로 한 번만 만든다 (CA 번들 로드 비용)
+    - TLS 세션: 서버(host, port, SNI)별 마지막 세션 → 새 연결이 세션 티켓 / 세션 ID 로 재개해
+      전체 핸드셰이크(인증서 검증, 키 교환)를 건너뛴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._contexts: Dict[tuple, ssl.SSLContext] = {}
+        self._sessions: Dict[tuple, ssl.SSLSession] = {}
+
+    def context(self, opts: ClientOptions) -> ssl.SSLContext:
+        key = tls_key(opts)
+        with self._lock:
+            ctx = self._contexts.get(key)
+        if ctx is None:
+            ctx = build_ssl_context(opts)
+            with self._lock:
+                ctx = self._contexts.setdefault(key, ctx)
+        return ctx
+
+    @staticmethod
+    def _session_key(opts: ClientOptions) -> tuple:
+        return (opts.host, opts.port, tls_server_name(opts)) + tls_key(opts)
+
+    def session(self, opts: ClientOptions) -> Optional[ssl.SSLSession]:
+        if not opts.tls_session_reuse:
+            return None
+        with self._lock:
+            return self._sessions.get(self._session_key(opts))
+
+    def store(self, opts: ClientOptions, session: Optional[ssl.SSLSession]):
+        if session is None or not opts.tls_session_reuse:
+            return
+        with self._lock:
+            self._sessions[self._session_key(opts)] = session
+
+    def clear(self):
+        with self._lock:
+            self._contexts.clear()
+            self._sessions.clear()
+
+
+# HttpConnection 이 따로 지정받지 않으면 쓰는 프로세스 공용 캐시
+TLS_SESSIONS = TlsSessionCache()
+
+
+class HandshakeStats:
+    """
+    TLS 핸드셰이크 집계 (요청 지연과 별도로 보고).
+    워커 하나가 쓰므로 잠금 없음 — 실행이 끝나면 merge 로 합친다.
+    """
+    __slots__ = ("full", "resumed", "full_ms", "resumed_ms", "max_ms")
+
+    def __init__(self):
+        self.full = 0
+        self.resumed = 0
+        self.full_ms = 0.0
+        self.resumed_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float, resumed: bool):
+        if resumed:
+            self.resumed += 1
+            self.resumed_ms += ms
+        else:
+            self.full += 1
+            self.full_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def merge(self, other: "HandshakeStats"):
+        self.full += other.full
+        self.resumed += other.resumed
+        self.full_ms += other.full_ms
+        self.resumed_ms += other.resumed_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    @property
+    def count(self) -> int:
+        return self.full + self.resumed
+
+    def summary(self) -> str:
+        full_avg = self.full_ms / self.full if self.full else 0.0
+        res_avg = self.resumed_ms / self.resumed if self.resumed else 0.0
+        rate = self.resumed * 100.0 / self.count if self.count else 0.0
+        return (f"TLS 핸드셰이크 {self.count}회 (세션 재개 {self.resumed}회, {rate:.1f}%) | "
+                f"전체 평균 {full_avg:.1f}ms / 재개 평균 {res_avg:.1f}ms / 최대 {self.max_ms:.1f}ms")
+
+
+def merge_handshake_stats(senders) -> HandshakeStats:
+    """전송기 목록의 tls_stats 를 합친다."""
+    total = HandshakeStats()
+    for t in senders:
+        total.merge(t.tls_stats)
+    return total
+
+
+# ------------------ Request templates ------------------
+
+# 워커별로 캐시하는 요청 템플릿 최대 개수 (넘으면 이후 항목은 요청마다 새로 만든다)
+TEMPLATE_CACHE_MAX = 4096
+
+
+class RequestTemplate:
+    """
+    (기본 옵션, 전송 항목)별로 한 번만 만들어 반복 주기마다 재사용하는 요청 준비물.
+    - 항목별 ClientOptions 복제본과 표시용 설명
+    - 직렬화된 요청 헤더: Content-Length 는 길이 값만 끼워 넣고, chunked 헤더는 그대로 재사용
+    - 청크 확장 / 마지막 청크(트레일러 포함) 바이트, multipart 경계 문자열
+    """
+    __slots__ = ("opts", "desc", "boundary", "filename_hint", "chunked_head", "chunk_ext", "last_chunk",
+                 "_cl_prefix", "_cl_suffix")
+
+    def __init__(self, base: ClientOptions, item):
+        opts = clone_opts_for_item(base, item)
+        self.opts = opts
+        self.desc = item_desc(item)
+        self.boundary = None
+        if opts.use_multipart:
+            self.boundary = multipart_boundary()
+            opts.extra_headers.setdefault("Content-Type", f"multipart/form-data; boundary={self.boundary}")
+        if opts.body_source is not None:
+            self.filename_hint = opts.body_source.filename
+        else:
+            self.filename_hint = os.path.basename(opts.file_path) if opts.file_path else None
+        self._cl_prefix, self._cl_suffix = content_length_head_parts(opts, self.filename_hint)
+        self.chunked_head = bytes(build_chunked_head(opts, self.filename_hint))
+        self.chunk_ext = chunk_ext_bytes(opts)
+        self.last_chunk = build_last_chunk(opts)
+
+    def content_length_head(self, declared_len: int) -> bytes:
+        return b"%s%d%s" % (self._cl_prefix, declared_len, self._cl_suffix)
+
+
+class TemplateCache:
+    """워커(스레드/이벤트 루프) 하나가 쓰는 항목 → RequestTemplate 캐시. 잠금 없음."""
+
+    def __init__(self, base: ClientOptions, max_entries: int = TEMPLATE_CACHE_MAX):
+        self.base = base
+        self.max_entries = max_entries
+        self._by_item: Dict = {}
+
+    def get(self, item) -> RequestTemplate:
+        tpl = self._by_item.get(item)
+        if tpl is None:
+            tpl = RequestTemplate(self.base, item)
+            if len(self._by_item) < self.max_entries:
+                self._by_item[item] = tpl
+        return tpl
+
+
+class HttpConnection:
+    def __init__(self, opts: ClientOptions, gzip_cache: Optional[GzipCache] = None,
+                 mmap_cache: Optional[MmapBodyCache] = None, tls_sessions: Optional[TlsSessionCache] = None):
+        self.opts = opts
+        self.gzip_cache = gzip_cache
+        self.mmap_cache = mmap_cache
+        self.tls_sessions = tls_sessions or TLS_SESSIONS
+        self.sock: Optional[socket.socket] = None
+        self.last_status: Optional[int] = None
+        self.last_reason: Optional[str] = None
+        # 마지막으로 읽은 응답 (헤더/트레일러/바디 앞부분 — 판정 로직용)
+        self.last_response: Optional[HttpResponse] = None
+        self._parser = ResponseParser()
+        # 마지막 요청의 바디 전송 경로: "sendfile" / "loop" / "chunked"
+        self.last_send_path: Optional[str] = None
+        # 현재 요청의 미리 직렬화된 헤더 (없으면 요청마다 새로 만든다)
+        self.template: Optional[RequestTemplate] = None
+        # 연결 풀에 마지막으로 반납된 시각 (monotonic)
+        self.last_used = 0.0
+        # 아직 집계하지 않은 TLS 핸드셰이크 (소요 ms, 세션 재개 여부) — take_handshake 로 가져간다
+        self.tls_handshake: Optional[Tuple[float, bool]] = None
+        self._tls_session_saved = False
+        # 마지막 connect 의 (시작, 끝) monotonic 시각 (TCP 연결 + TLS 핸드셰이크) — take_connect_span 으로 가져간다
+        self.connect_span: Optional[Tuple[float, float]] = None
+
+    def connect(self):
+        # 이미 연결되어 있으면 재사용
+        if self.sock is not None:
+            return
+        started = time.monotonic()
+        sock = socket.create_connection((self.opts.host, self.opts.port), timeout=self.opts.connect_timeout)
+        # 전송 성능 향상을 위한 소켓 버퍼 설정 (실패해도 무시)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1_048_576)  # 1MB
+        except Exception:
+            pass
+        if self.opts.use_tls:
+            sock = self._tls_handshake(sock)
+        sock.settimeout(self.opts.read_timeout)
+        self.sock = sock
+        self.connect_span = (started, time.monotonic())
+
+    def _tls_handshake(self, sock: socket.socket) -> ssl.SSLSocket:
+        """TCP 연결 위에서 TLS 핸드셰이크 (저장된 세션이 있으면 재개 시도). 소요 시간은 tls_handshake 에."""
+        opts = self.opts
+        cache = self.tls_sessions
+        t0 = time.monotonic()
+        try:
+            ssock = cache.context(opts).wrap_socket(
+                sock, server_hostname=tls_server_name(opts), session=cache.session(opts))
+        except BaseException:
+            sock.close()
+            raise
+        self.tls_handshake = ((time.monotonic() - t0) * 1000.0, ssock.session_reused)
+        self._tls_session_saved = False
+        if ssock.version() != "TLSv1.3":
+            # TLS 1.2 이하는 핸드셰이크 직후 세션 사용 가능 (1.3 은 첫 응답과 함께 오는 티켓을 기다림)
+            self._save_tls_session(ssock)
+        return ssock
+
+    def _save_tls_session(self, ssock):
+        if not self._tls_session_saved and isinstance(ssock, ssl.SSLSocket) and ssock.session is not None:
+            self.tls_sessions.store(self.opts, ssock.session)
+            self._tls_session_saved = True
+
+    def take_handshake(self) -> Optional[Tuple[float, bool]]:
+        """마지막 connect 의 TLS 핸드셰이크 (소요 ms, 세션 재개 여부) 를 한 번만 돌려준다."""
+        hs, self.tls_handshake = self.tls_handshake, None
+        return hs
+
+    def take_connect_span(self) -> Optional[Tuple[float, float]]:
+        """마지막 connect 의 (시작, 끝) monotonic 시각을 한 번만 돌려준다."""
+        span, self.connect_span = self.connect_span, None
+        return span
+
+    def idle_data_is_tls_control(self) -> bool:
+        """
+        유휴 TLS 연결에 읽을 거리가 있을 때, 그것이 세션 티켓 같은 TLS 제어 레코드뿐인지 확인한다.
+        (TLS 1.3 서버는 핸드셰이크 뒤에 티켓을 보내므로 응답을 읽기 전의 예열 연결은 항상 읽기 가능)
+        """
+        sock = self.sock
+        if not isinstance(sock, ssl.SSLSocket):
+            return False
+        sock.setblocking(False)
+        try:
+            sock.recv(1)
+            return False          # 응답 데이터가 남았거나 상대가 닫음(b"")
+        except ssl.SSLWantReadError:
+            self._save_tls_session(sock)
+            return True
+        except OSError:
+            return False
+        finally:
+            sock.settimeout(self.opts.read_timeout)
+
+    def close(self):
+        try:
+            if self.sock:
+                self.sock.close()
+        finally:
+            self.sock = None
+            self._parser = ResponseParser()
+
+    def read_response(self) -> Optional[Tuple[int, str]]:
+        """
+        서버 응답 하나를 바디까지 끝까지 읽고 (status, reason) 을 반환한다.
+        바디는 앞부분만 last_response 에 보관하고 버리므로 keep-alive 연결을 그대로 다시 쓸 수 있다.
+        응답 뒤로 연결을 재사용할 수 없으면(서버 close, 바디 도중 타임아웃, 형식 오류) 연결을 닫는다.
+        헤더를 받기 전에 실패하면 None.
+        """
+        self.last_response = None
+        if not self.sock:
+            return None
+        parser = self._parser
+        resp = parser.next_response()
+        try:
+            self.sock.settimeout(RESPONSE_READ_TIMEOUT)
+            while resp is None:
+                data = self.sock.recv(65536)
+                if not data:
+                    parser.feed_eof()
+                    resp = parser.next_response()
+                    break
+                parser.feed(data)
+                resp = parser.next_response()
+        except (OSError, ResponseError):
+            resp = None
+        finally:
+            if self.sock is not None:
+                self.sock.settimeout(self.opts.read_timeout)
+                if self.opts.use_tls:
+                    self._save_tls_session(self.sock)
+
+        if resp is None:
+            # 헤더까지만 받았으면 상태는 알려주되 연결은 버린다
+            resp = parser.current
+            self.close()
+        elif resp.will_close:
+            self.close()
+        if resp is None:
+            return None
+        self.last_response = resp
+        self.last_status, self.last_reason = resp.status, resp.reason
+        return resp.status_tuple()
+
+    def _content_length_head(self, declared_len: int, filename_for_header: Optional[str]) -> bytes:
+        if self.template is not None:
+            return self.template.content_length_head(declared_len)
+        return build_content_length_head(self.opts, declared_len, filename_for_header)
+
+    def send_request_content_length(self, body_iter: Iterable[bytes], declared_len: int, filename_for_header: Optional[str]):
+        buf = self._content_length_head(declared_len, filename_for_header)
+        assert self.sock
+        if isinstance(body_iter, list) and declared_len <= SMALL_BODY_COALESCE:
+            # 작은 바디: 헤더와 한 덩어리로 전송
+            self.sock.sendall(b"".join([buf, *body_iter]))
+        else:
+            self.sock.sendall(buf)
+            for part in body_iter:
+                self.sock.sendall(part)
+        self.last_send_path = "loop"
+
+    def send_request_content_length_file(self, path: str, fsize: int, filename_for_header: Optional[str]):
+        """
+        파일 본문을 Content-Length 로 전송한다.
+        가능하면 os.sendfile 로 커널에서 바로 보내고(유저 공간 복사 없음),
+        지원되지 않으면 기존 read/sendall 루프로 대체한다.
+        """
+        buf = self._content_length_head(fsize, filename_for_header)
+        assert self.sock
+        self.sock.sendall(buf)
+
+        sent_by_kernel = False
+        if can_sendfile(self.opts) and fsize > 0:
+            with open(path, "rb") as f:
+                sent_by_kernel = self._sendfile_all(f, fsize)
+
+        if sent_by_kernel:
+            self.last_send_path = "sendfile"
+        else:
+            for part in iter_file_chunks(path, FILE_READ_CHUNK):
+                self.sock.sendall(part)
+            self.last_send_path = "loop"
+
+    def _sendfile_all(self, f, count: int) -> bool:
+        """
+        os.sendfile 로 파일의 앞 count 바이트를 소켓에 쓴다.
+        소켓에 타임아웃이 걸려 있으면(non-blocking) 쓰기 가능해질 때까지 기다린다.
+        한 바이트도 보내기 전에 sendfile 자체가 지원되지 않으면 False 를 반환한다.
+        """
+        assert self.sock
+        sockno = self.sock.fileno()
+        fileno = f.fileno()
+        timeout = self.sock.gettimeout()
+        offset = 0
+        with selectors.DefaultSelector() as sel:
+            sel.register(sockno, selectors.EVENT_WRITE)
+            while offset < count:
+                try:
+                    sent = os.sendfile(sockno, fileno, offset, count - offset)
+                except BlockingIOError:
+                    if not sel.select(timeout):
+                        raise socket.timeout("timed out")
+                    continue
+                except OSError as e:
+                    if offset == 0 and e.errno in _SENDFILE_FALLBACK_ERRNOS:
+                        return False
+                    raise
+                if sent == 0:
+                    break  # 파일이 중간에 줄어든 경우(EOF)
+                offset += sent
+        return True
+
+    def send_request_chunked(self, body_iter: Iterable[bytes], filename_for_header: Optional[str]):
+        tpl = self.template
+        if tpl is not None:
+            framer = ChunkFramer(tpl.chunked_head, tpl.chunk_ext)
+            last_chunk = tpl.last_chunk
+        else:
+            framer = ChunkFramer(build_chunked_head(self.opts, filename_for_header), chunk_ext_bytes(self.opts))
+            last_chunk = build_last_chunk(self.opts)
+        assert self.sock
+
+        self.last_send_path = "chunked"
+        for part in body_iter:
+            bufs = framer.frame(part)
+            if bufs:
+                self._send_buffers(bufs)
+        # 마지막 0 청크 + 트레일러는 한 번에
+        self._send_buffers(framer.finish(last_chunk))
+
+    def _send_buffers(self, bufs: List):
+        assert self.sock
+        if HAS_SENDMSG and not self.opts.use_tls:  # SSLSocket 은 sendmsg 미지원
+            sendmsg_all(self.sock, bufs)
+        else:
+            self.sock.sendall(b"".join(bufs))
+
+    def perform(self, template: Optional[RequestTemplate] = None):
+        """
+        요청 하나를 보내고 (fire_and_go 면) 응답까지 읽는다.
+        template 을 주면 그 옵션과 직렬화된 헤더로 보낸다 (keep-alive 연결 재사용 시).
+        """
+        self.send(template)
+        if self.opts.fire_and_go:
+            return self.read_response()
+        return None
+
+    def send(self, template: Optional[RequestTemplate] = None):
+        """요청 하나를 보내기만 한다. 응답은 read_response 로 따로 읽는다 (파이프라이닝)."""
+        self.last_send_path = None
+        self.template = template
+        if template is not None:
+            self.opts = template.opts
+        plan = build_body_plan(self.opts, self.gzip_cache, template.boundary if template is not None else None,
+                               self.mmap_cache)
+        try:
+            if plan.chunked:
+                self.send_request_chunked(plan.parts, plan.filename_hint)
+            elif plan.file_path is not None:
+                self.send_request_content_length_file(plan.file_path, plan.length, plan.filename_hint)
+            else:
+                self.send_request_content_length(plan.parts, plan.length, plan.filename_hint)
+        finally:
+            plan.close()
+
+
+class ConnectionPool:
+    """
+    모든 SenderWorker 가 함께 쓰는 keep-alive 연결 풀 (스레드 안전).
+    - 키: pool_key(opts) = (host, port, TLS 설정) 별로 유휴 연결을 보관, 키마다 연결 수 max_size 이하
+    - checkout: 유휴 연결 중 가장 최근 것부터 헬스 체크(유휴 시간, 상대가 닫았는지) 후 빌려주고,
+      없으면 새로 연결한다. 한도에 걸리면 connect_timeout 동안 반납을 기다린다.
+    - checkin: 재사용 가능한 연결만 되돌리고, idle_timeout 이 지난 유휴 연결은 min_size 개까지만 남긴다.
+    - 새 연결은 동시에 max_connecting 개까지만, 연속 실패 시 지터를 준 지수 대기 →
+      DUT 리셋 뒤 모든 스레드가 한꺼번에 재연결하지 않는다.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        min_size: int = 0,
+        idle_timeout: float = POOL_IDLE_TIMEOUT,
+        max_connecting: int = POOL_MAX_CONNECTING,
+        gzip_cache: Optional[GzipCache] = None,
+        mmap_cache: Optional[MmapBodyCache] = None,
+    ):
+        self.max_size = max(1, max_size)
+        self.min_size = max(0, min(min_size, self.max_size))
+        self.idle_timeout = idle_timeout
+        self.gzip_cache = gzip_cache
+        self.mmap_cache = mmap_cache
+        self._cond = threading.Condition()
+        self._connect_sem = threading.BoundedSemaphore(max(1, max_connecting))
+        self._idle: Dict[tuple, List[HttpConnection]] = {}   # 끝이 가장 최근 반납
+        self._count: Dict[tuple, int] = {}                   # 키별 (빌려준 + 유휴) 연결 수
+        self._fail_streak: Dict[tuple, int] = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    @staticmethod
+    def pool_key(opts: ClientOptions) -> tuple:
+        if opts.use_tls:
+            return (opts.host, opts.port, tls_server_name(opts)) + tls_key(opts)
+        return (opts.host, opts.port)
+
+    def checkout(self, opts: ClientOptions) -> HttpConnection:
+        key = self.pool_key(opts)
+        deadline = time.monotonic() + opts.connect_timeout
+        with self._cond:
+            while True:
+                idle = self._idle.get(key)
+                while idle:
+                    conn = idle.pop()
+                    if self._healthy(conn):
+                        self.reused += 1
+                        conn.opts = opts
+                        return conn
+                    self._discard_locked(key, conn)
+                if self._count.get(key, 0) < self.max_size:
+                    self._count[key] = self._count.get(key, 0) + 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise socket.timeout(f"연결 풀 한도({self.max_size}) 초과: 반납 대기 시간 초과")
+                self._cond.wait(remaining)
+
+        try:
+            return self._connect(key, opts)
+        except BaseException:
+            with self._cond:
+                self._count[key] -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, conn: HttpConnection):
+        """요청이 끝난 연결을 돌려준다. 이미 닫혔으면(서버 close 등) 자리만 비운다."""
+        key = self.pool_key(conn.opts)
+        with self._cond:
+            if conn.sock is None:
+                self._count[key] -= 1
+                self.discarded += 1
+            else:
+                conn.last_used = time.monotonic()
+                self._idle.setdefault(key, []).append(conn)
+                self._prune_locked(key)
+            self._cond.notify()
+
+    def discard(self, conn: HttpConnection):
+        """오류가 난 연결을 닫고 풀에서 뺀다."""
+        conn.close()
+        with self._cond:
+            self._count[self.pool_key(conn.opts)] -= 1
+            self.discarded += 1
+            self._cond.notify()
+
+    def prewarm(self, opts: ClientOptions) -> int:
+        """min_size 개까지 미리 연결해 둔다. 반환: 새로 맺은 연결 수"""
+        conns = []
+        try:
+            with self._cond:
+                need = self.min_size - len(self._idle.get(self.pool_key(opts), []))
+            for _ in range(max(0, need)):
+                conns.append(self.checkout(opts))
+        finally:
+            for conn in conns:
+                self.checkin(conn)
+        return len(conns)
+
+    def close_all(self):
+        with self._cond:
+            for key, idle in self._idle.items():
+                for conn in idle:
+                    conn.close()
+                    self._count[key] -= 1
+                idle.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            idle = sum(len(v) for v in self._idle.values())
+            return {"created": self.created, "reused": self.reused, "discarded": self.discarded,
+                    "idle": idle, "in_use": sum(self._count.values()) - idle}
+
+    def _connect(self, key: tuple, opts: ClientOptions) -> HttpConnection:
+        with self._connect_sem:
+            streak = self._fail_streak.get(key, 0)
+            if streak:
+                time.sleep(random.uniform(0, min(POOL_BACKOFF_MAX, POOL_BACKOFF_BASE * (2 ** streak))))
+            conn = HttpConnection(opts, self.gzip_cache, self.mmap_cache)
+            try:
+                conn.connect()
+            except OSError:
+                with self._cond:
+                    self._fail_streak[key] = min(streak + 1, 16)
+                raise
+        with self._cond:
+            self._fail_streak[key] = 0
+            self.created += 1
+        return conn
+
+    def _healthy(self, conn: HttpConnection) -> bool:
+        # 유휴 시간 초과 / 소켓이 읽기 가능(상대가 닫았거나 읽지 않은 데이터가 남음) → 재사용 불가
+        if conn.sock is None or time.monotonic() - conn.last_used > self.idle_timeout:
+            return False
+        try:
+            readable, _, _ = select.select([conn.sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable or conn.idle_data_is_tls_control()
+
+    def _discard_locked(self, key: tuple, conn: HttpConnection):
+        conn.close()
+        self._count[key] -= 1
+        self.discarded += 1
+
+    def _prune_locked(self, key: tuple):
+        idle = self._idle[key]
+        now = time.monotonic()
+        while len(idle) > self.min_size and now - idle[0].last_used > self.idle_timeout:
+            self._discard_locked(key, idle.pop(0))
+
+
+# ------------------ Stats counters ------------------
+
+# 통계 항목 (StatsCounters.snapshot / 멀티프로세스 tick 의 dict 키)
+STATS_FIELDS = ("sent", "bytes", "no_resp", "s2xx", "s3xx", "s4xx", "s5xx", "other", "lat_sum", "lat_cnt")
+
+
+class StatsCounters:
+    """
+    전송기 하나의 누적 통계 카운터 (array 기반).
+    기록은 그 전송기 스레드만 하므로 잠금이 없고, 읽는 쪽(GUI 타이머 등)은
+    snapshot() 으로 한 번에 복사해 합산한다. 누적값이라 읽는 주기와 상관없이 합계가 정확하다.
+    """
+    __slots__ = ("_c",)
+
+    def __init__(self):
+        self._c = array("d", bytes(8 * len(STATS_FIELDS)))
+
+    def add(self, bytes_sent: int, status_code: Optional[int], elapsed_ms: Optional[float]):
+        c = self._c
+        c[0] += 1
+        c[1] += bytes_sent or 0
+        if status_code is None:
+            c[2] += 1
+        elif 200 <= status_code < 300:
+            c[3] += 1
+        elif 300 <= status_code < 400:
+            c[4] += 1
+        elif 400 <= status_code < 500:
+            c[5] += 1
+        elif 500 <= status_code < 600:
+            c[6] += 1
+        else:
+            c[7] += 1
+        if elapsed_ms is not None:
+            c[8] += elapsed_ms
+            c[9] += 1
+
+    def add_batch(self, batch: Dict[str, float]):
+        """다른 카운터의 snapshot(또는 구간 차이) dict 를 더한다"""
+        c = self._c
+        for i, k in enumerate(STATS_FIELDS):
+            c[i] += batch.get(k, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        vals = self._c.tolist()  # 한 번에 복사 (GIL 아래 원자적)
+        snap = {k: int(v) for k, v in zip(STATS_FIELDS, vals)}
+        snap["lat_sum"] = vals[8]
+        return snap
+
+
+def sum_counters(senders) -> Dict[str, float]:
+    """전송기 목록의 누적 통계(stats_snapshot)를 합친다."""
+    total = dict.fromkeys(STATS_FIELDS, 0)
+    for t in senders:
+        for k, v in t.stats_snapshot().items():
+            total[k] += v
+    return total
+
+
+def diff_counters(cur: Dict[str, float], prev: Dict[str, float]) -> Dict[str, float]:
+    """두 누적 통계 사이의 구간 값"""
+    return {k: cur[k] - prev.get(k, 0) for k in STATS_FIELDS}
+
+
+# ------------------ Latency histogram ------------------
+
+# HDR 식 로그-선형 구간: 2^LAT_HIST_SUB_BITS 개까지는 1μs 단위, 그 위로는 2배 구간마다 절반 개수의 같은 폭 구간
+# → 2배 구간마다 64개, 상대 오차 약 1/64 (1.6%), 구간 수 고정 (LAT_HIST_MAX_US 에서 잘라냄)
+LAT_HIST_SUB_BITS = 7
+LAT_HIST_MAX_US = 3_600_000_000     # 1시간
+LAT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+_LAT_SUB = 1 << LAT_HIST_SUB_BITS
+_LAT_HALF = _LAT_SUB >> 1
+
+
+def _lat_index(us: int) -> int:
+    if us < _LAT_SUB:
+        return us
+    shift = us.bit_length() - LAT_HIST_SUB_BITS
+    return _LAT_SUB + (shift - 1) * _LAT_HALF + ((us >> shift) - _LAT_HALF)
+
+
+def _lat_upper_us(idx: int) -> int:
+    """구간 idx 에 들어가는 가장 큰 값(μs)"""
+    if idx < _LAT_SUB:
+        return idx
+    shift, k = divmod(idx - _LAT_SUB, _LAT_HALF)
+    shift += 1
+    return ((k + _LAT_HALF + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    합칠 수 있는 고정 크기 지연 히스토그램 (HDR 식 로그 구간, μs 단위 기록 / ms 단위 조회).
+    counts 는 {구간 번호: 건수} 로 값이 있는 구간만 가진다 (1초 분량은 보통 수십 개).
+    """
+    __slots__ = ("counts", "total", "max_us")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.max_us = 0
+
+    def record(self, ms: float):
+        us = min(max(0, int(ms * 1000.0)), LAT_HIST_MAX_US)
+        idx = _lat_index(us)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.total += 1
+        if us > self.max_us:
+            self.max_us = us
+
+    def merge(self, other: "LatencyHistogram"):
+        counts = self.counts
+        for idx, n in other.counts.items():
+            counts[idx] = counts.get(idx, 0) + n
+        self.total += other.total
+        if other.max_us > self.max_us:
+            self.max_us = other.max_us
+
+    def percentile(self, p: float) -> float:
+        """p 백분위 지연(ms). 해당 구간의 상한값 (최댓값을 넘지 않음)"""
+        if not self.total:
+            return 0.0
+        rank = max(1, int(-(-self.total * p // 100)))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(_lat_upper_us(idx), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def percentiles(self) -> Dict[str, float]:
+        """{"p50", "p90", "p99", "p99.9", "max"} (ms)"""
+        out = {f"p{p:g}": self.percentile(p) for p in LAT_PERCENTILES}
+        out["max"] = self.max_us / 1000.0
+        return out
+
+    def summary(self) -> str:
+        if not self.total:
+            return "-"
+        return " / ".join(f"{k} {v:.1f}" for k, v in self.percentiles().items()) + " ms"
+
+
+class LatencyRecorder:
+    """
+    워커 하나(스레드 하나)의 초 단위 지연 히스토그램.
+    기록은 잠금 없이 현재 초의 히스토그램에 하고, 초가 바뀌면 끝난 (초, 히스토그램) 을 큐로 넘긴다.
+    수집하는 쪽(다른 스레드)은 drain() 으로 끝난 초들을 가져가 초별/실행 전체 히스토그램에 합친다.
+    초 = int(time.monotonic()) (프로세스가 달라도 같은 시계)
+    """
+    __slots__ = ("_sec", "_cur", "_done")
+
+    def __init__(self):
+        self._sec = 0
+        self._cur = LatencyHistogram()
+        self._done: deque = deque()
+
+    def record(self, ms: float):
+        sec = int(time.monotonic())
+        if sec != self._sec:
+            self.flush()
+            self._sec = sec
+        self._cur.record(ms)
+
+    def flush(self):
+        """현재 초 히스토그램도 넘긴다 (기록하는 스레드에서만 호출: 워커 종료 시)"""
+        if self._cur.total:
+            self._done.append((self._sec, self._cur))
+            self._cur = LatencyHistogram()
+
+    def drain(self) -> List[Tuple[int, LatencyHistogram]]:
+        out = []
+        done = self._done
+        while done:
+            out.append(done.popleft())
+        return out
+
+
+def drain_latency(senders) -> List[Tuple[int, LatencyHistogram]]:
+    """전송기 목록에서 끝난 초의 지연 히스토그램을 모두 가져온다."""
+    out: List[Tuple[int, LatencyHistogram]] = []
+    for t in senders:
+        out.extend(t.drain_latency())
+    return out
+
+
+# ------------------ Rate control ------------------
+
+class RateScheduler:
+    """
+    개방 루프(open-loop) 전송용 공유 스케줄러 (스레드 안전).
+    목표 req/s 또는 Mbps 에 맞춰 요청마다 '예정 송신 시각'을 나눠준다. 둘 다 주면 더 느린 쪽을 따른다.
+    - 균등: 간격 = 1/rps 또는 바이트 수 × 8 / 비트율 (버스트 1 짜리 토큰 버킷과 같음)
+    - poisson: 평균이 같은 지수 분포 간격 (무작위 도착)
+    DUT 가 느려져도 예정 시각은 뒤로 밀리지 않으므로, 예정 시각부터 잰 지연에 밀린 시간이 그대로 드러난다
+    (coordinated omission 방지). 워커 수가 모자라면 달성 속도가 목표보다 낮게 나온다.
+    """
+
+    def __init__(self, rps: float = 0.0, mbps: float = 0.0, poisson: bool = False):
+        self.rps = max(0.0, rps)
+        self.bps = max(0.0, mbps) * 1_000_000
+        self.poisson = poisson
+        self._lock = threading.Lock()
+        self._next: Optional[float] = None
+        self._rng = random.Random()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rps > 0 or self.bps > 0
+
+    def next_slot(self, nbytes: int) -> float:
+        """다음 요청의 예정 송신 시각 (time.monotonic 기준)"""
+        with self._lock:
+            if self._next is None:
+                self._next = time.monotonic()
+            slot = self._next
+            self._next += self._gap(nbytes)
+            return slot
+
+    def lag(self) -> float:
+        """예정보다 밀린 시간(초). 워커가 목표 속도를 못 따라가면 계속 커진다."""
+        with self._lock:
+            return max(0.0, time.monotonic() - self._next) if self._next is not None else 0.0
+
+    def _gap(self, nbytes: int) -> float:
+        gap = 1.0 / self.rps if self.rps > 0 else 0.0
+        if self.bps > 0:
+            gap = max(gap, nbytes * 8 / self.bps)
+        if self.poisson and gap > 0:
+            gap = self._rng.expovariate(1.0 / gap)
+        return gap
+
+
+def wait_until(deadline: float, stop_flag: threading.Event) -> bool:
+    """deadline(monotonic)까지 기다린다. 도중에 정지 요청이 오면 False."""
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        return not stop_flag.wait(delay)
+    return not stop_flag.is_set()
+
+
+# ------------------ Event log ------------------
+# 요청 결과 하나 = 고정 크기 레코드 하나. 파일 = 매직 + 길이 접두 프레임들:
+#   [u32 길이][u8 종류][내용]  종류 0 = 메타(JSON, 맨 앞 한 번), 1 = 레코드 묶음
+# 읽기/변환은 uploader_events.py
+
+EVENT_LOG_MAGIC = b"HUEVLOG1"
+EVENT_FRAME = struct.Struct("<IB")
+EVENT_FRAME_META = 0
+EVENT_FRAME_BATCH = 1
+# 스레드(연결) 번호, 완료 시각(monotonic ns), 바이트, 상태 코드(0=응답 없음), 지연(μs), 판정, 항목 번호
+EVENT_RECORD = struct.Struct("<HqqhIBI")
+EVENT_TAGS = ("[INFO]", "[SUCCESS]", "[BLOCK]", "[SERVER_ERR]", "[TIMEOUT]", "[RESET]")
+_EVENT_TAG_CODE = {tag: i for i, tag in enumerate(EVENT_TAGS)}
+EVENT_NO_LATENCY = 0xFFFFFFFF
+EVENT_NO_ITEM = 0xFFFFFFFF
+# 전송기별 버퍼가 이만큼 차면 묶어서 기록 스레드로 넘김
+EVENT_BATCH_RECORDS = 2048
+# 기록 스레드가 쌓인 묶음을 파일에 쓰는 주기(초)
+EVENT_FLUSH_INTERVAL = 0.5
+
+
+def event_item_ids(items: Iterable) -> Dict:
+    """항목 → 항목 번호(전체 목록에서 처음 나온 위치)"""
+    ids: Dict = {}
+    for i, item in enumerate(items):
+        ids.setdefault(item, i)
+    return ids
+
+
+class EventBuffer:
+    """
+    전송기 하나의 이벤트 버퍼 (기록은 그 전송기 스레드만 하므로 잠금 없음).
+    EVENT_BATCH_RECORDS 개가 차면 묶음(bytes)을 sink 로 넘긴다. 전송기 종료 시 flush().
+    """
+    __slots__ = ("sink", "item_ids", "thread_offset", "_buf", "_n")
+
+    def __init__(self, sink, item_ids: Dict, thread_offset: int = 0):
+        self.sink = sink
+        self.item_ids = item_ids
+        self.thread_offset = thread_offset
+        self._buf = bytearray(EVENT_RECORD.size * EVENT_BATCH_RECORDS)
+        self._n = 0
+
+    def add(self, thread_id: int, item, nbytes: int, status_code: Optional[int],
+            elapsed_ms: Optional[float], tag: str):
+        EVENT_RECORD.pack_into(
+            self._buf, self._n * EVENT_RECORD.size,
+            self.thread_offset + thread_id, time.monotonic_ns(), nbytes or 0, status_code or 0,
+            EVENT_NO_LATENCY if elapsed_ms is None else min(int(elapsed_ms * 1000.0), EVENT_NO_LATENCY - 1),
+            _EVENT_TAG_CODE.get(tag, 0), self.item_ids.get(item, EVENT_NO_ITEM),
+        )
+        self._n += 1
+        if self._n >= EVENT_BATCH_RECORDS:
+            self.flush()
+
+    def flush(self):
+        if self._n:
+            self.sink(bytes(self._buf[:self._n * EVENT_RECORD.size]))
+            self._n = 0
+
+
+class EventLogWriter(threading.Thread):
+    """
+    구조화 이벤트 로그 기록 스레드.
+    전송기들은 buffer() 로 받은 EventBuffer 에 기록하고, 묶음은 submit() 으로 큐에 쌓인다.
+    watch(senders) 로 시작하면 전송기가 모두 끝난 뒤 남은 묶음까지 쓰고 파일을 닫는다.
+    daemon 스레드이므로 프로그램 종료 전에 close() 를 불러 마지막 묶음까지 기록해야 한다.
+    """
+
+    def __init__(self, path: str, items: List, meta: Optional[Dict] = None):
+        super().__init__(daemon=True)
+        self.path = path
+        self.item_ids = event_item_ids(items)
+        self.records = 0
+        self._pending: deque = deque()
+        self._senders: List[threading.Thread] = []
+        self._closing = threading.Event()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._fp = open(path, "wb")
+        header = dict(meta or {}, version=1, wall_ns=time.time_ns(), mono_ns=time.monotonic_ns(),
+                      items=[item_desc(item) for item in items])
+        self._fp.write(EVENT_LOG_MAGIC)
+        self._write_frame(EVENT_FRAME_META, json.dumps(header, ensure_ascii=False).encode("utf-8"))
+
+    def buffer(self, thread_offset: int = 0) -> EventBuffer:
+        return EventBuffer(self.submit, self.item_ids, thread_offset)
+
+    def submit(self, batch: bytes):
+        self._pending.append(batch)
+
+    def watch(self, senders: List[threading.Thread]):
+        self._senders = list(senders)
+        self.start()
+
+    def close(self, timeout: float = 5.0):
+        """전송기가 남아 있어도 지금까지 받은 묶음을 쓰고 파일을 닫는다 (그 뒤 묶음은 버림)"""
+        self._closing.set()
+        if self.is_alive():
+            self.join(timeout)
+
+    def _write_frame(self, kind: int, payload: bytes):
+        self._fp.write(EVENT_FRAME.pack(len(payload), kind))
+        self._fp.write(payload)
+
+    def _drain(self):
+        pending = self._pending
+        while pending:
+            batch = pending.popleft()
+            self._write_frame(EVENT_FRAME_BATCH, batch)
+            self.records += len(batch) // EVENT_RECORD.size
+        self._fp.flush()
+
+    def run(self):
+        try:
+            while any(t.is_alive() for t in self._senders) and not self._closing.wait(EVENT_FLUSH_INTERVAL):
+                self._drain()
+            self._drain()
+        finally:
+            self._fp.close()
+
+
+# ------------------ Worker ------------------
+
+class SenderWorker(threading.Thread):
+    def __init__(
+        self,
+        idx: int,
+        all_items: List,
+        log_cb,
+        status_cb,
+        stats_cb,
+        base_opts: ClientOptions,
+        repeat: int,
+        stop_flag: threading.Event,
+        random_mode: bool,
+        log_every: int,
+        gzip_cache: Optional[GzipCache] = None,
+        mmap_cache: Optional[MmapBodyCache] = None,
+        pipeline_depth: int = 1,
+        pool: Optional[ConnectionPool] = None,
+        scheduler: Optional[RateScheduler] = None,
+        events=None,
+        text_log: bool = True,
+    ):
+        super().__init__(daemon=True)
+        self.idx = idx
+        self.all_items = all_items
+        self.log = log_cb
+        self.status_cb = status_cb
+        self.stats_cb = stats_cb
+        self.base_opts = base_opts
+        self.repeat = repeat          # 0이면 무한
+        self.stop_flag = stop_flag
+        self.random_mode = random_mode
+        self.log_every = max(1, log_every)
+        self.gzip_cache = gzip_cache  # 모든 워커가 공유하는 gzip 압축 결과 캐시
+        self.mmap_cache = mmap_cache  # 모든 워커가 공유하는 파일 본문 mmap
+        # 한 연결에 응답을 기다리지 않고 연달아 보낼 요청 수 (1이면 파이프라이닝 안 함, keep-alive 필요)
+        use_pipeline = base_opts.keep_alive and base_opts.fire_and_go
+        self.pipeline_depth = max(1, pipeline_depth) if use_pipeline else 1
+        self.sent_count = 0
+        # 바디 전송 경로별 요청 수 (sendfile / loop / chunked)
+        self.send_path_counts: Dict[str, int] = {}
+        # 항목별 요청 헤더 템플릿 (반복 주기마다 재사용)
+        self.templates = TemplateCache(base_opts)
+        # 목표 속도 스케줄러 (모든 워커 공유, 있으면 delay_between 대신 예정 시각에 맞춰 보냄)
+        self.scheduler = scheduler if scheduler is not None and scheduler.enabled else None
+        # TLS 핸드셰이크 시간 (요청 지연에는 포함하지 않음)
+        self.tls_stats = HandshakeStats()
+        # 누적 통계 / 초 단위 지연 히스토그램 (수집 쪽이 stats_snapshot / drain_latency 로 가져감)
+        self.counters = StatsCounters()
+        self.latency = LatencyRecorder()
+        # 구조화 이벤트 로그 (events = EventBuffer 를 만드는 함수, 예: EventLogWriter.buffer)
+        # text_log=False 면 요청별 텍스트 로그는 만들지 않음 (이벤트 로그에서 변환해 볼 수 있음)
+        self.events: Optional[EventBuffer] = events() if events is not None else None
+        self.text_log = text_log
+
+        # keep-alive 연결 재사용용 (pool 이 있으면 요청마다 풀에서 빌리고 돌려준다)
+        self.conn: Optional[HttpConnection] = None
+        self.pool = pool
+
+    def _get_or_create_connection(self, opts: ClientOptions) -> HttpConnection:
+        """
+        keep-alive 가 켜진 경우에는 기존 연결을 재사용하고,
+        아니면 매 요청마다 새 HttpConnection을 사용한다.
+        """
+        # keep-alive가 아니면 매번 새로 생성
+        if not opts.keep_alive:
+            conn = HttpConnection(opts, self.gzip_cache, self.mmap_cache)
+            conn.connect()
+            return conn
+
+        # keep-alive 인 경우: 기존 연결이 살아있으면 재사용
+        if self.conn is not None and self.conn.sock is not None:
+            self.conn.opts = opts
+            return self.conn
+
+        # 기존 연결이 없으면 (풀에서 빌리거나) 새로 만들고 기억
+        self._drop_connection()
+        if self.pool is not None:
+            self.conn = self.pool.checkout(opts)
+        else:
+            self.conn = HttpConnection(opts, self.gzip_cache, self.mmap_cache)
+            self.conn.connect()
+        return self.conn
+
+    def _await_slot(self, est_bytes: int):
+        """
+        속도 제어 중이면 이 요청의 예정 송신 시각까지 기다렸다가 그 시각을 반환한다.
+        속도 제어를 안 하면 None, 기다리는 중에 정지 요청이 오면 False.
+        """
+        if self.scheduler is None:
+            return None
+        slot = self.scheduler.next_slot(est_bytes)
+        if not wait_until(slot, self.stop_flag):
+            return False
+        return slot
+
+    def _note_handshake(self, conn: HttpConnection):
+        hs = conn.take_handshake()
+        if hs is not None:
+            self.tls_stats.add(*hs)
+
+    @staticmethod
+    def _latency_start(slot, conn: HttpConnection) -> float:
+        """
+        요청 지연 측정 시작 시각.
+        닫힌 루프: 지금 (연결/핸드셰이크는 이미 끝남).
+        속도 제어(개방 루프): 예정 송신 시각 — 밀려서 기다린 시간은 포함(coordinated omission 보정)하되
+        이번 요청을 위해 새로 맺은 TCP 연결/TLS 핸드셰이크 시간은 뺀다 (핸드셰이크는 tls_stats 로 따로 보고).
+        풀에서 연결이 반납되기를 기다린 시간은 대기 시간이므로 그대로 포함한다.
+        """
+        span = conn.take_connect_span()
+        if slot is None:
+            return time.monotonic()
+        if span is not None and span[0] >= slot:
+            return slot + (span[1] - span[0])
+        return slot
+
+    def _release_connection(self):
+        """요청이 끝난 연결을 풀에 돌려준다 (풀을 쓰지 않으면 계속 가지고 있음)."""
+        if self.pool is not None and self.conn is not None:
+            self.pool.checkin(self.conn)
+            self.conn = None
+
+    def _drop_connection(self):
+        """재사용 중인 연결을 닫는다 (풀을 쓰면 풀에서도 뺌)."""
+        if self.conn is not None:
+            if self.pool is not None:
+                self.pool.discard(self.conn)
+            else:
+                self.conn.close()
+            self.conn = None
+
+    def run(self):
+        try:
+            if self.pipeline_depth > 1:
+                self._run_pipelined()
+            else:
+                self._run_sequential()
+        finally:
+            self.latency.flush()
+            if self.events is not None:
+                self.events.flush()
+
+    def drain_latency(self) -> List[Tuple[int, LatencyHistogram]]:
+        return self.latency.drain()
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        return self.counters.snapshot()
+
+    def _count(self, est_bytes: int, status_code: Optional[int], elapsed_ms: Optional[float]):
+        """요청 하나를 통계에 반영: 전송기 전용 카운터(잠금 없음) + stats_cb(있으면)"""
+        self.counters.add(est_bytes, status_code, elapsed_ms)
+        if self.stats_cb:
+            self.stats_cb(est_bytes, status_code, elapsed_ms)
+
+    def _run_sequential(self):
+        try:
+            cycle = 0
+            while not self.stop_flag.is_set() and (self.repeat == 0 or cycle < self.repeat):
+                cycle += 1
+                items = list(self.all_items)
+                if self.random_mode:
+                    random.shuffle(items)
+
+                for item in items:
+                    if self.stop_flag.is_set():
+                        break
+
+                    tpl = self.templates.get(item)
+                    desc = tpl.desc
+                    self.status_cb(self.idx, desc)
+
+                    # 이 요청에서 보낼(예상) 바이트 수
+                    est_bytes = self._estimate_bytes(item)
+                    slot = self._await_slot(est_bytes)
+                    if slot is False:
+                        break
+
+                    try:
+                        opts = tpl.opts
+
+                        # 연결 재사용 / 생성
+                        conn = self._get_or_create_connection(opts)
+                        self._note_handshake(conn)
+
+                        # 요청 시작 시각 (속도 제어 중이면 예정 송신 시각부터, 연결 시간은 빼고)
+                        t0 = self._latency_start(slot, conn)
+                        resp = None
+                        elapsed_ms = None
+
+                        try:
+                            resp = conn.perform(tpl)
+                            elapsed_ms = (time.monotonic() - t0) * 1000.0
+                        except (TimeoutError, socket.timeout):
+                            self._record_failure(
+                                f"[TIMEOUT] [스레드 {self.idx}] 전송 실패: Timeout — {desc} "
+                                f"(DUT/서버 응답 없음, 차단 가능성 높음)", est_bytes, item, "[TIMEOUT]")
+
+                            # keep-alive 연결이면 재연결 준비
+                            if opts.keep_alive:
+                                self._drop_connection()
+                            else:
+                                conn.close()
+                            continue
+                        except (ConnectionResetError, BrokenPipeError, OSError) as e:
+                            self._record_failure(
+                                f"[RESET] [스레드 {self.idx}] 전송 실패: Connection error({e}) — {desc} "
+                                f"(전송 중 DUT/서버가 연결을 끊었거나 네트워크 오류)", est_bytes, item, "[RESET]")
+
+                            if opts.keep_alive:
+                                self._drop_connection()
+                            else:
+                                conn.close()
+                            continue
+                        # 여기까지 왔으면 소켓 예외는 없음
+                        self._record_result(item, desc, est_bytes, resp, elapsed_ms, conn.last_send_path or "-", cycle)
+
+                        if self.scheduler is None and self.base_opts.delay_between > 0:
+                            time.sleep(self.base_opts.delay_between)
+
+                        # keep-alive가 꺼져 있는 경우, 이 요청 전용 conn은 여기서 정리
+                        if not opts.keep_alive:
+                            conn.close()
+                        else:
+                            self._release_connection()
+
+                    except Exception as e:
+                        self.log(f"[ERROR] [스레드 {self.idx}] 전송 중 예외: {e}\n{traceback.format_exc()}")
+
+            # 스레드 작업 종료 표시
+            self.status_cb(self.idx, "-")
+
+            # 스레드 종료 시, 재사용 중이던 연결이 있으면 정리
+            self._drop_connection()
+
+        except Exception as e:
+            self.log(f"[FATAL] [스레드 {self.idx}] 치명 오류: {e}\n{traceback.format_exc()}")
+
+    def _run_pipelined(self):
+        """
+        파이프라이닝 모드: 하나의 keep-alive 연결에 응답을 기다리지 않고 최대 pipeline_depth 개까지
+        요청을 연달아 보내고, 응답은 보낸 순서대로 맞춰 읽는다.
+        요청별 지연 = 그 요청을 보내기 시작한 때부터 그 응답을 다 읽은 때까지.
+        연결이 끊기면 아직 응답을 못 받은 요청은 모두 '응답 유실'로 집계한다.
+        """
+        # (item, desc, est_bytes, t0, send_path, cycle)
+        inflight: "deque[Tuple[object, str, int, float, str, int]]" = deque()
+        try:
+            cycle = 0
+            while not self.stop_flag.is_set() and (self.repeat == 0 or cycle < self.repeat):
+                cycle += 1
+                items = list(self.all_items)
+                if self.random_mode:
+                    random.shuffle(items)
+
+                for item in items:
+                    if self.stop_flag.is_set():
+                        break
+
+                    tpl = self.templates.get(item)
+                    desc = tpl.desc
+                    self.status_cb(self.idx, desc)
+                    est_bytes = self._estimate_bytes(item)
+                    slot = self._await_slot(est_bytes)
+                    if slot is False:
+                        break
+
+                    try:
+                        conn = self._get_or_create_connection(tpl.opts)
+                        self._note_handshake(conn)
+                        t0 = self._latency_start(slot, conn)
+                        conn.send(tpl)
+                    except (TimeoutError, socket.timeout, OSError) as e:
+                        self._record_failure(
+                            f"[RESET] [스레드 {self.idx}] 전송 실패: Connection error({e!r}) — {desc} "
+                            f"(파이프라인 {len(inflight)}개 대기 중)", est_bytes, item, "[RESET]")
+                        self._drop_pipeline(inflight, "전송 실패")
+                        continue
+
+                    inflight.append((item, desc, est_bytes, t0, conn.last_send_path or "-", cycle))
+                    if len(inflight) >= self.pipeline_depth:
+                        self._collect_pipelined(inflight)
+
+                    if self.scheduler is None and self.base_opts.delay_between > 0:
+                        time.sleep(self.base_opts.delay_between)
+
+            while inflight:
+                self._collect_pipelined(inflight)
+            self.status_cb(self.idx, "-")
+        except Exception as e:
+            self.log(f"[FATAL] [스레드 {self.idx}] 치명 오류: {e}\n{traceback.format_exc()}")
+        finally:
+            if self.pool is not None:
+                self._release_connection()
+            else:
+                self._drop_connection()
+
+    def _collect_pipelined(self, inflight: deque):
+        """가장 먼저 보낸 요청의 응답을 읽어 집계한다."""
+        item, desc, est_bytes, t0, send_path, cycle = inflight.popleft()
+        conn = self.conn
+        resp = conn.read_response() if conn is not None else None
+        elapsed_ms = (time.monotonic() - t0) * 1000.0 if resp is not None else None
+        self._record_result(item, desc, est_bytes, resp, elapsed_ms, send_path, cycle)
+        if conn is None or conn.sock is None:
+            # 서버가 닫았거나(Connection: close) 응답을 못 읽음 → 나머지 응답은 올 수 없음
+            self._drop_pipeline(inflight, "연결 종료")
+
+    def _drop_pipeline(self, inflight: deque, reason: str):
+        for item, desc, est_bytes, _, _, _ in inflight:
+            self._record_failure(
+                f"[RESET] [스레드 {self.idx}] 응답 유실: 파이프라인 {reason} — {desc}", est_bytes, item, "[RESET]")
+        inflight.clear()
+        self._drop_connection()
+
+    def _record_result(self, item, desc: str, est_bytes: int, resp, elapsed_ms: Optional[float],
+                       send_path: str, cycle: int):
+        self.sent_count += 1
+        self.send_path_counts[send_path] = self.send_path_counts.get(send_path, 0) + 1
+
+        status_code, status_str, verdict, tag = classify_response(resp)
+
+        # ---- 그래프/통계 반영 ----
+        if elapsed_ms is not None:
+            self.latency.record(elapsed_ms)
+        self._count(est_bytes, status_code, elapsed_ms)
+        if self.events is not None:
+            self.events.add(self.idx, item, est_bytes, status_code, elapsed_ms, tag)
+
+        # 성공 로그는 log_every 간격으로, 나머지는 항상
+        if self.text_log and (tag != "[SUCCESS]" or self.sent_count % self.log_every == 0):
+            msg = (
+                f"{tag} [스레드 {self.idx}] 전송 결과 "
+                f"(#{self.sent_count}, 반복={cycle if self.repeat>0 else '∞'}): "
+                f"{desc} — {verdict} (응답={status_str}, 경로={send_path})"
+            )
+            self.log(msg)
+
+    def _record_failure(self, msg: str, est_bytes: int, item, tag: str):
+        """전송 자체가 실패한 요청: 로그 + 통계(status_code = None, elapsed_ms=None)"""
+        self.sent_count += 1
+        if self.text_log:
+            self.log(msg)
+        self._count(est_bytes, None, None)
+        if self.events is not None:
+            self.events.add(self.idx, item, est_bytes, None, None, tag)
+
+    def _desc(self, item):
+        return item_desc(item)
+
+    def _estimate_bytes(self, item) -> int:
+        return estimate_item_bytes(item)
+
+
+class AsyncSenderEngine(threading.Thread):
+    """
+    asyncio 기반 전송 엔진 (SenderWorker 스레드 방식의 대안).
+    스레드 하나에서 이벤트 루프를 돌리며 concurrency 개의 연결(코루틴)을 동시에 운용한다.
+    uvloop 가 설치되어 있으면 uvloop 이벤트 루프를 사용한다.
+    log_cb / status_cb / stats_cb 호출 규약은 SenderWorker 와 동일하며,
+    status_cb 의 idx 는 코루틴 번호(1부터)이다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        all_items: List,
+        log_cb,
+        status_cb,
+        stats_cb,
+        base_opts: ClientOptions,
+        repeat: int,
+        stop_flag: threading.Event,
+        random_mode: bool,
+        log_every: int,
+        gzip_cache: Optional[GzipCache] = None,
+        mmap_cache: Optional[MmapBodyCache] = None,
+        scheduler: Optional[RateScheduler] = None,
+        events=None,
+        text_log: bool = True,
+    ):
+        super().__init__(daemon=True)
+        self.concurrency = max(1, concurrency)
+        self.all_items = all_items
+        self.log = log_cb
+        self.status_cb = status_cb
+        self.stats_cb = stats_cb
+        self.base_opts = base_opts
+        self.repeat = repeat          # 0이면 무한
+        self.stop_flag = stop_flag
+        self.random_mode = random_mode
+        self.log_every = max(1, log_every)
+        self.gzip_cache = gzip_cache
+        self.mmap_cache = mmap_cache
+        self.sent_count = 0
+        # 바디 전송 경로별 요청 수 (sendfile / loop / chunked)
+        self.send_path_counts: Dict[str, int] = {}
+        # 항목별 요청 헤더 템플릿 (모든 코루틴이 같은 이벤트 루프 스레드에서 공유)
+        self.templates = TemplateCache(base_opts)
+        self.scheduler = scheduler if scheduler is not None and scheduler.enabled else None
+        # TLS 핸드셰이크 시간 (asyncio 는 세션 재개 불가 → 항상 전체 핸드셰이크)
+        self.tls_stats = HandshakeStats()
+        # 누적 통계 / 초 단위 지연 히스토그램 (이벤트 루프 스레드 하나가 기록)
+        self.counters = StatsCounters()
+        self.latency = LatencyRecorder()
+        # 구조화 이벤트 로그 (스레드 번호 자리에 연결 번호) / 요청별 텍스트 로그 여부
+        self.events: Optional[EventBuffer] = events() if events is not None else None
+        self.text_log = text_log
+
+    def run(self):
+        loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._main())
+        except Exception as e:
+            self.log(f"[FATAL] [asyncio 엔진] 치명 오류: {e}\n{traceback.format_exc()}")
+        finally:
+            loop.close()
+            self.latency.flush()
+            if self.events is not None:
+                self.events.flush()
+
+    def drain_latency(self) -> List[Tuple[int, LatencyHistogram]]:
+        return self.latency.drain()
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        return self.counters.snapshot()
+
+    def _count(self, est_bytes: int, status_code: Optional[int], elapsed_ms: Optional[float]):
+        """요청 하나를 통계에 반영: 전송기 전용 카운터(잠금 없음) + stats_cb(있으면)"""
+        self.counters.add(est_bytes, status_code, elapsed_ms)
+        if self.stats_cb:
+            self.stats_cb(est_bytes, status_code, elapsed_ms)
+
+    def _event(self, idx: int, item, est_bytes: int, status_code: Optional[int],
+               elapsed_ms: Optional[float], tag: str):
+        if self.events is not None:
+            self.events.add(idx, item, est_bytes, status_code, elapsed_ms, tag)
+
+    async def _main(self):
+        engine = "uvloop" if uvloop is not None else "asyncio"
+        self.log(f"[안내] {engine} 엔진 시작: 동시 연결 {self.concurrency}개")
+        await asyncio.gather(*(self._conn_loop(i + 1) for i in range(self.concurrency)))
+
+    async def _conn_loop(self, idx: int):
+        reader: Optional[asyncio.StreamReader] = None
+        writer: Optional[asyncio.StreamWriter] = None
+        try:
+            cycle = 0
+            while not self.stop_flag.is_set() and (self.repeat == 0 or cycle < self.repeat):
+                cycle += 1
+                items = list(self.all_items)
+                if self.random_mode:
+                    random.shuffle(items)
+
+                for item in items:
+                    if self.stop_flag.is_set():
+                        break
+
+                    tpl = self.templates.get(item)
+                    desc = tpl.desc
+                    self.status_cb(idx, desc)
+                    est_bytes = estimate_item_bytes(item)
+                    slot = None
+                    if self.scheduler is not None:
+                        slot = self.scheduler.next_slot(est_bytes)
+                        await asyncio.sleep(max(0.0, slot - time.monotonic()))
+                        if self.stop_flag.is_set():
+                            break
+
+                    try:
+                        opts = tpl.opts
+
+                        connect_sec = 0.0
+                        if writer is None:
+                            c0 = time.monotonic()
+                            reader, writer = await self._open(opts)
+                            parser = ResponseParser()
+                            connect_sec = time.monotonic() - c0
+
+                        # 요청 시작 시각: 속도 제어 중이면 예정 송신 시각부터 (밀린 대기 포함, coordinated omission 보정)
+                        # 재되 새로 맺은 연결/TLS 핸드셰이크 시간은 뺀다 (핸드셰이크는 tls_stats 로 따로 보고)
+                        t0 = time.monotonic() if slot is None else slot + connect_sec
+                        try:
+                            resp, send_path, reusable = await self._perform(reader, writer, tpl, parser)
+                            elapsed_ms = (time.monotonic() - t0) * 1000.0
+                        except (TimeoutError, asyncio.TimeoutError, socket.timeout):
+                            self.sent_count += 1
+                            if self.text_log:
+                                self.log(
+                                    f"[TIMEOUT] [연결 {idx}] 전송 실패: Timeout — {desc} "
+                                    f"(DUT/서버 응답 없음, 차단 가능성 높음)"
+                                )
+                            self._count(est_bytes, None, None)
+                            self._event(idx, item, est_bytes, None, None, "[TIMEOUT]")
+                            writer = await self._close(writer)
+                            continue
+                        except (ConnectionResetError, BrokenPipeError, OSError) as e:
+                            self.sent_count += 1
+                            if self.text_log:
+                                self.log(
+                                    f"[RESET] [연결 {idx}] 전송 실패: Connection error({e}) — {desc} "
+                                    f"(전송 중 DUT/서버가 연결을 끊었거나 네트워크 오류)"
+                                )
+                            self._count(est_bytes, None, None)
+                            self._event(idx, item, est_bytes, None, None, "[RESET]")
+                            writer = await self._close(writer)
+                            continue
+
+                        self.sent_count += 1
+                        self.send_path_counts[send_path] = self.send_path_counts.get(send_path, 0) + 1
+                        status_code, status_str, verdict, tag = classify_response(resp)
+
+                        self.latency.record(elapsed_ms)
+                        self._count(est_bytes, status_code, elapsed_ms)
+                        self._event(idx, item, est_bytes, status_code, elapsed_ms, tag)
+
+                        if self.text_log and (tag != "[SUCCESS]" or self.sent_count % self.log_every == 0):
+                            self.log(
+                                f"{tag} [연결 {idx}] 전송 결과 "
+                                f"(#{self.sent_count}, 반복={cycle if self.repeat>0 else '∞'}): "
+                                f"{desc} — {verdict} (응답={status_str}, 경로={send_path})"
+                            )
+
+                        if self.scheduler is None and self.base_opts.delay_between > 0:
+                            await asyncio.sleep(self.base_opts.delay_between)
+
+                        if not opts.keep_alive or not reusable:
+                            writer = await self._close(writer)
+
+                    except (TimeoutError, asyncio.TimeoutError, OSError) as e:
+                        # 연결 수립 실패
+                        self.sent_count += 1
+                        if self.text_log:
+                            self.log(f"[RESET] [연결 {idx}] 연결 실패: {e!r} — {desc}")
+                        self._count(est_bytes, None, None)
+                        self._event(idx, item, est_bytes, None, None, "[RESET]")
+                        writer = await self._close(writer)
+                    except Exception as e:
+                        self.log(f"[ERROR] [연결 {idx}] 전송 중 예외: {e}\n{traceback.format_exc()}")
+                        writer = await self._close(writer)
+
+            self.status_cb(idx, "-")
+        finally:
+            await self._close(writer)
+
+    async def _open(self, opts: ClientOptions) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """
+        새 연결. TLS 면 TCP 연결 뒤 start_tls 로 핸드셰이크해 그 시간만 따로 집계한다.
+        (asyncio 의 TLS 는 세션을 넘겨받을 수 없어 재개 없이 매번 전체 핸드셰이크)
+        """
+        if opts.use_tls and not hasattr(asyncio.StreamWriter, "start_tls"):
+            # Python 3.10 이하: start_tls 가 없으므로 TCP 연결 시간까지 함께 측정
+            t0 = time.monotonic()
+            conn = await asyncio.wait_for(
+                asyncio.open_connection(opts.host, opts.port, ssl=TLS_SESSIONS.context(opts),
+                                        server_hostname=tls_server_name(opts)),
+                opts.connect_timeout)
+            self.tls_stats.add((time.monotonic() - t0) * 1000.0, False)
+            return conn
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(opts.host, opts.port),
+                                                opts.connect_timeout)
+        if opts.use_tls:
+            t0 = time.monotonic()
+            try:
+                await asyncio.wait_for(
+                    writer.start_tls(TLS_SESSIONS.context(opts), server_hostname=tls_server_name(opts)),
+                    opts.connect_timeout)
+            except BaseException:
+                await self._close(writer)
+                raise
+            self.tls_stats.add((time.monotonic() - t0) * 1000.0, False)
+        return reader, writer
+
+    async def _perform(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, tpl: RequestTemplate,
+                       parser: ResponseParser):
+        """
+        HttpConnection.perform 의 asyncio 버전. 같은 BodyPlan 을 사용하므로
+        chunked / Content-Length / multipart / gzip / 트레일러 동작이 동일하다.
+        반환: ((status, reason) 또는 None, 전송 경로, 연결 재사용 가능 여부)
+        """
+        opts = tpl.opts
+        loop = asyncio.get_running_loop()
+        if opts.use_gzip or opts.use_multipart:
+            # 압축/캐시 채우기, multipart 본문 모으기(파일 읽기)는 이벤트 루프 밖에서
+            plan = await loop.run_in_executor(None, build_body_plan, opts, self.gzip_cache, tpl.boundary,
+                                              self.mmap_cache)
+        else:
+            plan = build_body_plan(opts, self.gzip_cache, tpl.boundary, self.mmap_cache)
+
+        timeout = opts.read_timeout
+        try:
+            if plan.chunked:
+                send_path = "chunked"
+                framer = ChunkFramer(tpl.chunked_head, tpl.chunk_ext)
+                async for part in self._iter_parts(loop, plan):
+                    bufs = framer.frame(part)
+                    if bufs:
+                        writer.writelines(bufs)
+                        await asyncio.wait_for(writer.drain(), timeout)
+                writer.writelines(framer.finish(tpl.last_chunk))
+            else:
+                writer.write(tpl.content_length_head(plan.length))
+                if plan.file_path is not None:
+                    send_path = await self._send_file(writer, plan.file_path, plan.length, opts)
+                else:
+                    send_path = "loop"
+                    async for part in self._iter_parts(loop, plan):
+                        writer.write(part)
+                        await asyncio.wait_for(writer.drain(), timeout)
+            drain_error = None
+            try:
+                await asyncio.wait_for(writer.drain(), timeout)
+            except ConnectionResetError as e:
+                # 요청을 다 쓴 뒤 서버가 응답하고 바로 닫으면(Connection: close) 마지막 drain 이 실패할 수 있다
+                # (TLS 는 반쪽 닫기가 없어 특히 잦음) → 이미 받은 응답이 있으면 그것으로 판정
+                if not opts.fire_and_go:
+                    raise
+                drain_error = e
+        finally:
+            plan.close()
+
+        if opts.fire_and_go:
+            resp, reusable = await self._read_response(reader, parser)
+            if resp is None and drain_error is not None:
+                raise drain_error
+            return (resp.status_tuple() if resp is not None else None), send_path, reusable and drain_error is None
+        return None, send_path, True
+
+    @staticmethod
+    async def _iter_parts(loop: asyncio.AbstractEventLoop, plan: BodyPlan):
+        """본문 조각들. 디스크 읽기/압축이 있는 plan 은 조각마다 실행기 스레드에서 꺼낸다."""
+        if not plan.blocking:
+            for part in plan.parts:
+                yield part
+            return
+        it = iter(plan.parts)
+        while True:
+            part = await loop.run_in_executor(None, next, it, None)
+            if part is None:
+                return
+            yield part
+
+    async def _send_file(self, writer: asyncio.StreamWriter, path: str, count: int, opts: ClientOptions) -> str:
+        await asyncio.wait_for(writer.drain(), opts.read_timeout)
+        loop = asyncio.get_running_loop()
+        with open(path, "rb") as f:
+            if can_sendfile(opts) and count > 0:
+                try:
+                    await loop.sendfile(writer.transport, f, 0, count, fallback=False)
+                    return "sendfile"
+                except (asyncio.SendfileNotAvailableError, NotImplementedError):
+                    f.seek(0)
+            while True:
+                part = await loop.run_in_executor(None, f.read, FILE_READ_CHUNK)
+                if not part:
+                    break
+                writer.write(part)
+                await asyncio.wait_for(writer.drain(), opts.read_timeout)
+        return "loop"
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader,
+                             parser: ResponseParser) -> Tuple[Optional[HttpResponse], bool]:
+        """
+        HttpConnection._read_response 와 동일: 응답 하나를 바디까지 소비한다.
+        반환: (응답 또는 None — 헤더까지만 받았으면 그 응답, 연결 재사용 가능 여부)
+        """
+        resp = parser.next_response()
+        try:
+            while resp is None:
+                data = await asyncio.wait_for(reader.read(65536), RESPONSE_READ_TIMEOUT)
+                if not data:
+                    parser.feed_eof()
+                    resp = parser.next_response()
+                    break
+                parser.feed(data)
+                resp = parser.next_response()
+        except (asyncio.TimeoutError, OSError, ResponseError):
+            resp = None
+        if resp is None:
+            return parser.current, False
+        return resp, not resp.will_close
+
+    @staticmethod
+    async def _close(writer: Optional[asyncio.StreamWriter]) -> None:
+        if writer is not None:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except Exception:
+                pass
+        return None
+
+
+def _process_sender_main(
+    proc_idx: int,
+    items: List,
+    workers: int,
+    base_opts: ClientOptions,
+    repeat: int,
+    random_mode: bool,
+    log_every: int,
+    use_async: bool,
+    cache_cfg: Optional[Tuple[int, Optional[str]]],
+    mmap_max_bytes: int,
+    pipeline_depth: int,
+    pool_cfg: Optional[Tuple[int, int, float]],
+    rate_cfg: Optional[Tuple[float, float, bool]],
+    stop_evt,
+    out_q,
+    event_cfg: Optional[Tuple[int, List[int]]] = None,
+    text_log: bool = True,
+):
+    """
+    멀티프로세스 모드의 자식 프로세스 본체.
+    자체 전송 루프(SenderWorker 스레드 또는 asyncio 엔진)를 돌리고,
+    요청별 콜백 대신 PROC_FLUSH_INTERVAL 마다 집계 통계(구간 값)/로그 묶음을 큐로 보낸다.
+    event_cfg = (스레드 번호 오프셋, items 와 같은 순서의 전체 항목 번호) 이면
+    이벤트 레코드 묶음도 함께 보내 부모의 EventLogWriter 가 기록한다.
+    Ctrl+C(SIGINT)는 무시한다 — 콘솔의 Ctrl+C 는 자식에게도 가지만, 정지는 부모가 stop_evt 로 알리고
+    자식은 진행 중 요청을 마친 뒤 남은 통계와 함께 "done" 을 보낸다.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    log_lock = threading.Lock()
+    logs: List[str] = []
+    dropped = [0]
+    statuses: Dict[int, str] = {}
+
+    def log_cb(s: str):
+        with log_lock:
+            if len(logs) < PROC_MAX_LOGS_PER_FLUSH:
+                logs.append(s)
+            else:
+                dropped[0] += 1
+
+    def status_cb(idx: int, desc: str):
+        statuses[idx] = desc
+
+    gzip_cache = GzipCache(*cache_cfg) if cache_cfg else None
+    # mmap 은 프로세스 간에 넘길 수 없으므로 자식마다 매핑 (페이지 캐시는 공유됨)
+    mmap_cache = MmapBodyCache(mmap_max_bytes) if mmap_max_bytes > 0 else None
+    pool = None
+    if pool_cfg and not use_async:
+        pool = ConnectionPool(*pool_cfg, gzip_cache=gzip_cache, mmap_cache=mmap_cache)
+    local_stop = threading.Event()
+    event_batches: deque = deque()
+    events = None
+    if event_cfg:
+        thread_offset, ids = event_cfg
+        events = partial(EventBuffer, event_batches.append, dict(zip(items, ids)), thread_offset)
+    common = dict(
+        all_items=items, log_cb=log_cb, status_cb=status_cb, stats_cb=None, base_opts=base_opts,
+        repeat=repeat, stop_flag=local_stop, random_mode=random_mode, log_every=log_every,
+        gzip_cache=gzip_cache, mmap_cache=mmap_cache,
+        scheduler=RateScheduler(*rate_cfg) if rate_cfg else None,
+        events=events, text_log=text_log,
+    )
+    if use_async:
+        senders = [AsyncSenderEngine(concurrency=workers, **common)]
+    else:
+        senders = [SenderWorker(idx=i + 1, pipeline_depth=pipeline_depth, pool=pool, **common)
+                   for i in range(workers)]
+    for t in senders:
+        t.start()
+    sent_stats = dict.fromkeys(STATS_FIELDS, 0)
+
+    def flush():
+        nonlocal sent_stats
+        with log_lock:
+            batch_logs = logs[:]
+            logs.clear()
+            n_dropped, dropped[0] = dropped[0], 0
+        if n_dropped:
+            batch_logs.append(f"[안내] [프로세스 {proc_idx}] 로그 {n_dropped}줄 생략(초당 상한 초과)")
+        # 워커별 초 단위 히스토그램은 초별로 합쳐서 보낸다
+        lat: Dict[int, LatencyHistogram] = {}
+        for sec, hist in drain_latency(senders):
+            if sec in lat:
+                lat[sec].merge(hist)
+            else:
+                lat[sec] = hist
+        cur = sum_counters(senders)
+        stats, sent_stats = diff_counters(cur, sent_stats), cur
+        batches = []
+        while event_batches:
+            batches.append(event_batches.popleft())
+        out_q.put(("tick", proc_idx, stats, batch_logs, dict(statuses), list(lat.items()), batches))
+        statuses.clear()
+
+    while any(t.is_alive() for t in senders):
+        if stop_evt.is_set():
+            local_stop.set()
+        deadline = time.monotonic() + PROC_FLUSH_INTERVAL
+        for t in senders:
+            t.join(max(0.0, deadline - time.monotonic()))
+        flush()
+    flush()
+
+    path_counts: Dict[str, int] = {}
+    for t in senders:
+        for k, v in t.send_path_counts.items():
+            path_counts[k] = path_counts.get(k, 0) + v
+    out_q.put(("done", proc_idx, path_counts, gzip_cache.stats() if gzip_cache else None,
+               merge_handshake_stats(senders)))
+
+
+class ProcessSenderPool(threading.Thread):
+    """
+    멀티프로세스 전송 모드.
+    all_items 와 전체 스레드(동시 연결) 수를 processes 개의 자식 프로세스에 나눠 맡겨
+    GIL 제약 없이 모든 코어를 사용한다.
+    자식은 초 단위 집계만 보내므로 통계는 stats_batch_cb(STATS_FIELDS dict, 구간 값) 와
+    stats_snapshot() (누적) 으로 전달되고,
+    log_cb / status_cb 는 SenderWorker 와 동일한 규약으로 호출된다.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        workers: int,
+        all_items: List,
+        log_cb,
+        status_cb,
+        stats_batch_cb,
+        base_opts: ClientOptions,
+        repeat: int,
+        stop_flag: threading.Event,
+        random_mode: bool,
+        log_every: int,
+        use_async: bool = False,
+        gzip_cache_cfg: Optional[Tuple[int, Optional[str]]] = None,
+        mmap_max_bytes: int = 0,
+        pipeline_depth: int = 1,
+        pool_cfg: Optional[Tuple[int, int, float]] = None,
+        rate_cfg: Optional[Tuple[float, float, bool]] = None,
+        events: Optional[EventLogWriter] = None,
+        text_log: bool = True,
+    ):
+        super().__init__(daemon=True)
+        self.processes = max(1, min(processes, workers))
+        self.workers = max(1, workers)
+        self.all_items = all_items
+        self.log = log_cb
+        self.status_cb = status_cb
+        self.stats_batch_cb = stats_batch_cb
+        self.base_opts = base_opts
+        self.repeat = repeat
+        self.stop_flag = stop_flag
+        self.random_mode = random_mode
+        self.log_every = max(1, log_every)
+        self.use_async = use_async
+        self.gzip_cache_cfg = gzip_cache_cfg
+        self.mmap_max_bytes = mmap_max_bytes
+        self.pipeline_depth = pipeline_depth
+        self.pool_cfg = pool_cfg      # (max_size, min_size, idle_timeout) — 전체 기준, 프로세스별로 나눔
+        self.rate_cfg = rate_cfg      # (rps, mbps, poisson) — 전체 목표, 프로세스별 스레드 수 비율로 나눔
+        self.events = events          # 자식이 보낸 이벤트 묶음을 여기에 기록
+        self.text_log = text_log
+        self.send_path_counts: Dict[str, int] = {}
+        self.tls_stats = HandshakeStats()
+        # 자식들이 보낸 누적 통계 / 초 단위 지연 히스토그램 (stats_snapshot / drain_latency 로 가져감)
+        self.counters = StatsCounters()
+        self._latency: deque = deque()
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        return self.counters.snapshot()
+
+    def drain_latency(self) -> List[Tuple[int, LatencyHistogram]]:
+        out = []
+        while self._latency:
+            out.append(self._latency.popleft())
+        return out
+
+    def _shards(self) -> List[Tuple[List, int, int]]:
+        """(담당 항목, 담당 스레드 수, 스레드 번호 오프셋) 목록"""
+        n = self.processes
+        items = list(self.all_items)
+        shards = []
+        offset = 0
+        for k in range(n):
+            # 항목이 프로세스 수보다 적으면 모든 프로세스가 전체 목록을 사용
+            part = items[k::n] if len(items) >= n else items
+            w = self.workers // n + (1 if k < self.workers % n else 0)
+            shards.append((part, w, offset))
+            offset += w
+        return shards
+
+    def _cache_cfg_for(self, proc_idx: int) -> Optional[Tuple[int, Optional[str]]]:
+        if not self.gzip_cache_cfg:
+            return None
+        mem_bytes, spill_dir = self.gzip_cache_cfg
+        # 같은 스필 파일을 여러 프로세스가 동시에 쓰지 않도록 프로세스별 하위 폴더 사용
+        return mem_bytes // self.processes, (os.path.join(spill_dir, f"p{proc_idx}") if spill_dir else None)
+
+    def _pool_cfg_for(self) -> Optional[Tuple[int, int, float]]:
+        if not self.pool_cfg:
+            return None
+        max_size, min_size, idle_timeout = self.pool_cfg
+        n = self.processes
+        return max(1, max_size // n), min_size // n, idle_timeout
+
+    def _rate_cfg_for(self, workers: int) -> Optional[Tuple[float, float, bool]]:
+        if not self.rate_cfg:
+            return None
+        rps, mbps, poisson = self.rate_cfg
+        share = workers / self.workers
+        return rps * share, mbps * share, poisson
+
+    def _event_cfg_for(self, part: List, offset: int) -> Optional[Tuple[int, List[int]]]:
+        if self.events is None:
+            return None
+        ids = self.events.item_ids
+        return offset, [ids.get(item, EVENT_NO_ITEM) for item in part]
+
+    def run(self):
+        ctx = multiprocessing.get_context("spawn")
+        stop_evt = ctx.Event()
+        out_q = ctx.Queue()
+        shards = self._shards()
+        procs = []
+        try:
+            for k, (part, w, offset) in enumerate(shards):
+                p = ctx.Process(
+                    target=_process_sender_main,
+                    args=(k + 1, part, w, self.base_opts, self.repeat, self.random_mode, self.log_every,
+                          self.use_async, self._cache_cfg_for(k + 1), self.mmap_max_bytes, self.pipeline_depth,
+                          self._pool_cfg_for(), self._rate_cfg_for(w), stop_evt, out_q,
+                          self._event_cfg_for(part, offset), self.text_log),
+                    daemon=True,
+                )
+                p.start()
+                procs.append(p)
+            self.log(f"[안내] 멀티프로세스 모드: 프로세스 {len(procs)}개, 동시 전송 {self.workers}개")
+
+            done = 0
+            while done < len(procs):
+                if self.stop_flag.is_set():
+                    stop_evt.set()
+                try:
+                    msg = out_q.get(timeout=0.5)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in procs):
+                        self.log("[ERROR] 자식 프로세스가 결과 없이 종료되었습니다.")
+                        break
+                    continue
+
+                kind, proc_idx = msg[0], msg[1]
+                if kind == "tick":
+                    _, _, stats, lines, statuses, lat, batches = msg
+                    self._latency.extend(lat)
+                    for batch in batches:
+                        self.events.submit(batch)
+                    self.counters.add_batch(stats)
+                    if stats["sent"] and self.stats_batch_cb:
+                        self.stats_batch_cb(stats)
+                    for line in lines:
+                        self.log(line)
+                    offset = shards[proc_idx - 1][2]
+                    for idx, desc in statuses.items():
+                        self.status_cb(offset + idx, desc)
+                elif kind == "done":
+                    _, _, path_counts, cache_stats, tls_stats = msg
+                    done += 1
+                    self.tls_stats.merge(tls_stats)
+                    for k, v in path_counts.items():
+                        self.send_path_counts[k] = self.send_path_counts.get(k, 0) + v
+                    if cache_stats:
+                        self.log(f"[안내] [프로세스 {proc_idx}] gzip 캐시: 적중 {cache_stats['hits']}건 / "
+                                 f"압축 {cache_stats['misses']}건")
+        except Exception as e:
+            self.log(f"[FATAL] [멀티프로세스] 치명 오류: {e}\n{traceback.format_exc()}")
+        finally:
+            stop_evt.set()
+            for p in procs:
+                p.join(5)
+
+
+# ------------------ Load phases ------------------
+
+LOAD_STAGE_KINDS = ("ramp", "step", "soak")
+# 단계 진행 중 목표 동시 전송 수를 다시 계산하는 주기(초)
+LOAD_STAGE_TICK = 0.2
+
+
+@dataclass
+class LoadStage:
+    """
+    부하 단계 하나 (동시 전송 수 = 실행 중인 SenderWorker 수).
+    - ramp: duration 초 동안 start → end 로 선형 증가/감소
+    - step: every 초마다 step 개씩 start → end 까지 계단식 증가 (각 계단을 every 초 유지)
+    - soak: duration 초 동안 start 개 유지
+    """
+    kind: str
+    start: int
+    end: int = 0
+    duration: float = 0.0
+    step: int = 1
+    every: float = 0.0
+
+    def validate(self):
+        if self.kind not in LOAD_STAGE_KINDS:
+            raise ValueError(f"단계 종류는 {LOAD_STAGE_KINDS} 중 하나여야 합니다: {self.kind}")
+        if self.start < 0 or self.end < 0:
+            raise ValueError("동시 전송 수는 0 이상이어야 합니다.")
+        if self.kind == "step":
+            if self.step <= 0 or self.every <= 0:
+                raise ValueError("step 단계는 증가폭(step)과 간격(every)이 0보다 커야 합니다.")
+        elif self.duration <= 0:
+            raise ValueError(f"{self.kind} 단계는 시간(duration)이 0보다 커야 합니다.")
+
+    def _levels(self) -> int:
+        return -(-abs(self.end - self.start) // self.step) + 1
+
+    def seconds(self) -> float:
+        if self.kind == "step":
+            return self._levels() * self.every
+        return self.duration
+
+    def peak(self) -> int:
+        return self.start if self.kind == "soak" else max(self.start, self.end)
+
+    def workers_at(self, t: float) -> int:
+        """단계 시작 후 t 초의 목표 동시 전송 수"""
+        if self.kind == "soak":
+            return self.start
+        if self.kind == "ramp":
+            frac = min(1.0, max(0.0, t / self.duration))
+            return int(round(self.start + (self.end - self.start) * frac))
+        level = min(int(t // self.every), self._levels() - 1)
+        delta = min(level * self.step, abs(self.end - self.start))
+        return self.start + delta if self.end >= self.start else self.start - delta
+
+    def label(self) -> str:
+        if self.kind == "ramp":
+            return f"ramp {self.start}→{self.end} / {self.duration:g}s"
+        if self.kind == "step":
+            sign = "+" if self.end >= self.start else "-"
+            return f"step {self.start}→{self.end} ({sign}{self.step} / {self.every:g}s)"
+        return f"soak {self.start} / {self.duration:g}s"
+
+    def to_line(self) -> str:
+        if self.kind == "ramp":
+            return f"ramp {self.start} {self.end} {self.duration:g}"
+        if self.kind == "step":
+            return f"step {self.start} {self.end} {self.step} {self.every:g}"
+        return f"soak {self.start} {self.duration:g}"
+
+
+def parse_stage_lines(raw: str) -> List[LoadStage]:
+    """
+    한 줄에 한 단계 (# 주석, 빈 줄 무시):
+      ramp <시작> <끝> <초> / step <시작> <끝> <증가폭> <간격초> / soak <동시전송> <초>
+    """
+    stages: List[LoadStage] = []
+    for n, line in enumerate(raw.splitlines(), 1):
+        words = line.split("#", 1)[0].split()
+        if not words:
+            continue
+        kind, args = words[0].lower(), words[1:]
+        try:
+            if kind == "ramp" and len(args) == 3:
+                stage = LoadStage(kind, int(args[0]), int(args[1]), duration=float(args[2]))
+            elif kind == "step" and len(args) == 4:
+                stage = LoadStage(kind, int(args[0]), int(args[1]), step=int(args[2]), every=float(args[3]))
+            elif kind == "soak" and len(args) == 2:
+                stage = LoadStage(kind, int(args[0]), duration=float(args[1]))
+            else:
+                raise ValueError("형식: ramp 시작 끝 초 / step 시작 끝 증가폭 간격초 / soak 동시전송 초")
+            stage.validate()
+        except ValueError as e:
+            raise ValueError(f"부하 단계 {n}번째 줄 '{line.strip()}': {e}") from None
+        stages.append(stage)
+    return stages
+
+
+class StagedSenderPool(threading.Thread):
+    """
+    부하 단계(LoadStage 목록)에 따라 SenderWorker 를 실행 중에 늘리고 줄이는 전송기 (thread 엔진).
+    - LOAD_STAGE_TICK 마다 목표 동시 전송 수를 계산해 모자라면 워커를 새로 시작하고,
+      넘치면 가장 나중에 시작한 워커부터 멈춘다 (진행 중인 요청은 끝까지 보냄).
+    - 동시 전송 수나 단계가 바뀔 때마다 phase_cb(경과 초, 단계 번호(0부터), LoadStage, 동시 전송 수) 호출
+      → 초 단위 버킷에 단계 경계를 남겨 차단/유실이 시작된 동시 전송 수를 찾을 수 있게 한다.
+      모든 단계가 끝나면 phase_cb(경과 초, len(stages), None, 0) 으로 마감.
+    - 워커는 make_worker(idx, stop_event) 로 만든다 (단계가 시간을 정하므로 repeat 은 0 이어야 함).
+    """
+
+    def __init__(
+        self,
+        stages: List[LoadStage],
+        make_worker,
+        log_cb,
+        stop_flag: threading.Event,
+        phase_cb=None,
+    ):
+        super().__init__(daemon=True)
+        self.stages = stages
+        self.make_worker = make_worker
+        self.log = log_cb
+        self.stop_flag = stop_flag
+        self.phase_cb = phase_cb
+        self.send_path_counts: Dict[str, int] = {}
+        self.tls_stats = HandshakeStats()
+        self._active: List[Tuple[SenderWorker, threading.Event]] = []
+        self._all: List[SenderWorker] = []
+
+    def stats_snapshot(self) -> Dict[str, float]:
+        return sum_counters(list(self._all))
+
+    def drain_latency(self) -> List[Tuple[int, LatencyHistogram]]:
+        return drain_latency(list(self._all))
+
+    def _stage_at(self, t: float) -> Optional[Tuple[int, int]]:
+        """경과 t 초의 (단계 번호, 목표 동시 전송 수). 모든 단계가 끝났으면 None"""
+        for i, stage in enumerate(self.stages):
+            length = stage.seconds()
+            if t < length:
+                return i, stage.workers_at(t)
+            t -= length
+        return None
+
+    def _resize(self, n: int):
+        while len(self._active) < n:
+            stop_evt = threading.Event()
+            w = self.make_worker(len(self._active) + 1, stop_evt)
+            self._active.append((w, stop_evt))
+            self._all.append(w)
+            w.start()
+        while len(self._active) > n:
+            _, stop_evt = self._active.pop()
+            stop_evt.set()
+
+    def run(self):
+        t_start = time.monotonic()
+        cur_stage, cur_workers = -1, -1
+        try:
+            total = sum(s.seconds() for s in self.stages)
+            self.log(f"[안내] 부하 단계 {len(self.stages)}개, 총 {total:.0f}초: "
+                     + ", ".join(s.label() for s in self.stages))
+            while not self.stop_flag.is_set():
+                elapsed = time.monotonic() - t_start
+                pos = self._stage_at(elapsed)
+                if pos is None:
+                    break
+                i, n = pos
+                self._resize(n)
+                if i != cur_stage:
+                    self.log(f"[안내] [단계 {i + 1}/{len(self.stages)}] {self.stages[i].label()} 시작 "
+                             f"({elapsed:.1f}s, 동시 전송 {n})")
+                if (i, n) != (cur_stage, cur_workers) and self.phase_cb:
+                    self.phase_cb(elapsed, i, self.stages[i], n)
+                cur_stage, cur_workers = i, n
+                self.stop_flag.wait(LOAD_STAGE_TICK)
+        except Exception as e:
+            self.log(f"[FATAL] [부하 단계] 치명 오류: {e}\n{traceback.format_exc()}")
+        finally:
+            self._resize(0)
+            for w in self._all:
+                w.join()
+                for k, v in w.send_path_counts.items():
+                    self.send_path_counts[k] = self.send_path_counts.get(k, 0) + v
+                self.tls_stats.merge(w.tls_stats)
+            if self.phase_cb:
+                self.phase_cb(time.monotonic() - t_start, len(self.stages), None, 0)
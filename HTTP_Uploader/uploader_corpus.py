@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# DLP 패턴 탐지 부하 시험용 합성 개인정보 코퍼스 생성기
+# - 형식과 검증 숫자(체크섬)가 맞는 가짜 식별자(주민/외국인등록번호, 신용카드(Luhn), 사업자/법인등록번호, 전화, 여권 …)를
+#   본문에 섞어 txt / docx / xlsx / zip 파일로 미리 만들어 두고 manifest.json 에 목록과 식별자 수를 기록한다.
+# - 전송 시에는 파일을 그대로 보내므로(sendfile/mmap 경로) 전송 중 생성 비용이 없다.
+#   프로필/GUI 의 폴더에 코퍼스 폴더를 지정하면 manifest 순서대로 항목이 등록된다.
+# - TemplateBody: 파일 없이 템플릿에 식별자(또는 base/base_info.py 값)를 채운 메모리 바디 소스.
+# 사용: (HTTP_Uploader 폴더에서) python -m uploader_corpus 출력폴더 --files 1000 --size-kb 64 --density 4
+import io
+import gzip
+import os
+import re
+import sys
+import json
+import runpy
+import random
+import itertools
+import zipfile
+import argparse
+from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from uploader_core import BodySource, iter_view_chunks
+
+CORPUS_MANIFEST = "manifest.json"
+CORPUS_FORMATS = ("txt", "docx", "xlsx", "zip")
+
+# ------------------ Identifiers ------------------
+# 모두 random.Random 인스턴스를 받아 같은 seed 면 같은 코퍼스가 나온다.
+# invalid=True 면 형식은 같고 검증 숫자만 틀린 값 (오탐 시험용)
+
+
+def _digits(rng: random.Random, n: int) -> str:
+    return str(rng.randrange(10 ** n)).zfill(n)
+
+
+def _wrong(check: int) -> int:
+    return (check + 1 + (check * 7) % 9) % 10
+
+
+def _birth(rng: random.Random) -> date:
+    return date(1940, 1, 1) + timedelta(days=rng.randrange(365 * 65))
+
+
+def _rrn_like(rng: random.Random, invalid: bool, foreigner: bool) -> str:
+    b = _birth(rng)
+    century = 0 if b.year < 2000 else 2
+    g = (5 if foreigner else 1) + century + rng.randrange(2)
+    body = f"{b:%y%m%d}{g}{_digits(rng, 5)}"
+    s = sum(int(d) * w for d, w in zip(body, (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)))
+    check = ((13 if foreigner else 11) - s % 11) % 10
+    if invalid:
+        check = _wrong(check)
+    return f"{body[:6]}-{body[6:]}{check}"
+
+
+def gen_rrn(rng: random.Random, invalid: bool = False) -> str:
+    """주민등록번호 (YYMMDD-GNNNNNC, 가중치 2..9,2..5 / 11 검증)"""
+    return _rrn_like(rng, invalid, foreigner=False)
+
+
+def gen_frn(rng: random.Random, invalid: bool = False) -> str:
+    """외국인등록번호 (성별 자리 5~8, 13 기준 검증)"""
+    return _rrn_like(rng, invalid, foreigner=True)
+
+
+def luhn_check_digit(digits: str) -> int:
+    s = 0
+    for i, d in enumerate(reversed(digits)):
+        v = int(d)
+        if i % 2 == 0:  # 검증 숫자가 붙으면 짝수 번째가 됨
+            v *= 2
+            if v > 9:
+                v -= 9
+        s += v
+    return (10 - s % 10) % 10
+
+
+_CARD_PREFIXES = (("4", 16), ("51", 16), ("52", 16), ("53", 16), ("54", 16), ("55", 16),
+                  ("2221", 16), ("34", 15), ("37", 15), ("3528", 16), ("9410", 16))
+
+
+def gen_card(rng: random.Random, invalid: bool = False) -> str:
+    """신용카드 번호 (Luhn), 16자리는 4-4-4-4, 15자리는 4-6-5"""
+    prefix, n = rng.choice(_CARD_PREFIXES)
+    body = prefix + _digits(rng, n - len(prefix) - 1)
+    check = luhn_check_digit(body)
+    if invalid:
+        check = _wrong(check)
+    num = body + str(check)
+    if n == 15:
+        return f"{num[:4]}-{num[4:10]}-{num[10:]}"
+    return "-".join(num[i:i + 4] for i in range(0, 16, 4))
+
+
+def gen_brn(rng: random.Random, invalid: bool = False) -> str:
+    """사업자등록번호 (NNN-NN-NNNNC, 가중치 1,3,7,1,3,7,1,3,5)"""
+    body = f"{rng.randrange(101, 1000)}{rng.choice((81, 82, 85, 86, 87, 88, 13, 23, 24))}{_digits(rng, 4)}"
+    s = sum(int(d) * w for d, w in zip(body, (1, 3, 7, 1, 3, 7, 1, 3, 5)))
+    s += int(body[8]) * 5 // 10
+    check = (10 - s % 10) % 10
+    if invalid:
+        check = _wrong(check)
+    return f"{body[:3]}-{body[3:5]}-{body[5:]}{check}"
+
+
+def gen_crn(rng: random.Random, invalid: bool = False) -> str:
+    """법인등록번호 (NNNNNN-NNNNNNC, 가중치 1,2 반복)"""
+    body = f"{rng.choice((11, 13, 16, 17, 20, 25, 28))}01{rng.randrange(1, 10)}{_digits(rng, 7)}"
+    s = sum(int(d) * (1 if i % 2 == 0 else 2) for i, d in enumerate(body))
+    check = (10 - s % 10) % 10
+    if invalid:
+        check = _wrong(check)
+    return f"{body[:6]}-{body[6:]}{check}"
+
+
+def gen_phone(rng: random.Random, invalid: bool = False) -> str:
+    """휴대전화번호 (010-NNNN-NNNN)"""
+    return f"010-{rng.randrange(2000, 10000)}-{_digits(rng, 4)}"
+
+
+_AREA_CODES = ("02", "031", "032", "033", "041", "042", "043", "044", "051", "052", "053", "054", "055",
+               "061", "062", "063", "064", "070")
+
+
+def gen_tel(rng: random.Random, invalid: bool = False) -> str:
+    """유선 전화번호 (지역번호-NNN(N)-NNNN)"""
+    mid = rng.randrange(200, 10000)
+    return f"{rng.choice(_AREA_CODES)}-{mid}-{_digits(rng, 4)}"
+
+
+def gen_passport(rng: random.Random, invalid: bool = False) -> str:
+    """여권번호 (구형 M/S/R/G/D + 8자리, 신형 M + 3자리 + 영문 + 4자리)"""
+    if rng.random() < 0.5:
+        return f"{rng.choice('MSRGD')}{_digits(rng, 8)}"
+    return f"M{_digits(rng, 3)}{rng.choice('ABCDEFGHJKLMNPQRSTUVWXYZ')}{_digits(rng, 4)}"
+
+
+_EMAIL_USERS = ("kim", "lee", "park", "choi", "jung", "kang", "cho", "yoon", "jang", "lim", "test", "user")
+_EMAIL_DOMAINS = ("example.com", "example.co.kr", "example.net", "test.co.kr", "mail.example.org")
+
+
+def gen_email(rng: random.Random, invalid: bool = False) -> str:
+    return f"{rng.choice(_EMAIL_USERS)}{rng.randrange(10000)}@{rng.choice(_EMAIL_DOMAINS)}"
+
+
+def gen_ip(rng: random.Random, invalid: bool = False) -> str:
+    return f"{rng.randrange(1, 224)}.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(1, 255)}"
+
+
+_ACCOUNT_FORMATS = ((6, 2, 6), (3, 2, 6), (3, 6, 5), (4, 3, 6), (3, 4, 4, 2))
+
+
+def gen_account(rng: random.Random, invalid: bool = False) -> str:
+    """계좌번호 (은행별 자릿수 묶음)"""
+    return "-".join(_digits(rng, n) for n in rng.choice(_ACCOUNT_FORMATS))
+
+
+_LICENSE_REGIONS = ("서울", "부산", "경기", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주", "대구",
+                    "인천", "광주", "대전", "울산")
+
+
+def gen_driver(rng: random.Random, invalid: bool = False) -> str:
+    """운전면허번호 (지역명 또는 지역코드 NN-NN-NNNNNN-NN)"""
+    tail = f"{_digits(rng, 2)}-{_digits(rng, 6)}-{_digits(rng, 2)}"
+    if rng.random() < 0.5:
+        return f"{rng.choice(_LICENSE_REGIONS)}{tail}"
+    return f"{rng.randrange(11, 29)}-{tail}"
+
+
+def gen_hic(rng: random.Random, invalid: bool = False) -> str:
+    """건강보험증번호 (11자리)"""
+    return f"{rng.randrange(1, 10)}{_digits(rng, 10)}"
+
+
+# 종류 → (표시 이름, 생성 함수, 검증 숫자 여부). 표시 이름은 base/base_info.py 의 info_dict 와 같음
+IDENTIFIER_KINDS: Dict[str, Tuple[str, Callable[..., str], bool]] = {
+    "rrn": ("주민등록번호", gen_rrn, True),
+    "frn": ("외국인등록번호", gen_frn, True),
+    "card": ("신용카드", gen_card, True),
+    "brn": ("사업자등록번호", gen_brn, True),
+    "crn": ("법인등록번호", gen_crn, True),
+    "phone": ("휴대전화번호", gen_phone, False),
+    "tel": ("전화번호", gen_tel, False),
+    "passport": ("여권번호", gen_passport, False),
+    "email": ("이메일형식", gen_email, False),
+    "ip": ("IP", gen_ip, False),
+    "account": ("계좌번호", gen_account, False),
+    "driver": ("운전면허번호", gen_driver, False),
+    "hic": ("건강보험증번호", gen_hic, False),
+}
+
+# ------------------ Text ------------------
+
+# 한 행(문장 하나)에 붙이는 식별자 최대 수 (밀도가 매우 높을 때 행이 끝없이 길어지지 않게)
+_ROW_MAX_IDS = 64
+
+_FILLER = (
+    "고객 요청에 따라 아래 정보를 확인하였습니다.",
+    "본 문서는 내부 검토용이며 외부 반출을 금합니다.",
+    "담당자는 처리 결과를 회신해 주시기 바랍니다.",
+    "The following record was updated during the quarterly review.",
+    "Please verify the attached details before the end of the business day.",
+    "계약 조건은 별첨 문서를 참고하십시오.",
+    "해당 건은 다음 주 회의에서 다시 논의합니다.",
+    "No further action is required unless the status changes.",
+    "변경 이력은 시스템에 자동으로 기록됩니다.",
+    "정산 내역과 증빙 자료를 함께 제출해 주세요.",
+)
+
+
+@dataclass
+class CorpusSpec:
+    """코퍼스 생성 설정"""
+    files: int = 100
+    size_kb: int = 64                   # 파일당 본문(텍스트) 크기. docx/xlsx/zip 은 압축 후 더 작아짐
+    density: float = 4.0                # 본문 1KB 당 식별자 수
+    formats: Tuple[str, ...] = CORPUS_FORMATS  # 파일 번호 순서대로 번갈아 사용
+    kinds: Tuple[str, ...] = tuple(IDENTIFIER_KINDS)
+    invalid_ratio: float = 0.0          # 검증 숫자가 틀린 값의 비율 (검증 숫자가 있는 종류만)
+    labeled_ratio: float = 0.5          # "주민등록번호: ..." 처럼 이름을 붙이는 비율
+    zip_members: int = 4                # zip 하나에 넣을 txt 수
+    seed: int = 0
+
+    def validate(self):
+        bad = [f for f in self.formats if f not in CORPUS_FORMATS]
+        if bad:
+            raise ValueError(f"지원하지 않는 형식: {', '.join(bad)} (가능: {', '.join(CORPUS_FORMATS)})")
+        bad = [k for k in self.kinds if k not in IDENTIFIER_KINDS]
+        if bad:
+            raise ValueError(f"알 수 없는 식별자 종류: {', '.join(bad)} (가능: {', '.join(IDENTIFIER_KINDS)})")
+        if self.files < 1 or self.size_kb < 1 or self.density < 0:
+            raise ValueError("files/size_kb 는 1 이상, density 는 0 이상이어야 합니다.")
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def build_rows(rng: random.Random, spec: CorpusSpec, size: int, counts: Dict[str, int]) -> List[List[str]]:
+    """
+    size 바이트(UTF-8) 남짓의 본문을 행 목록으로 만든다.
+    행 = [채움 문장, 식별자, ...] (밀도에 맞춘 개수). counts 에 종류별(틀린 값은 '종류:invalid') 개수를 더한다.
+    """
+    rows: List[List[str]] = []
+    total = 0   # 지금까지 본문 바이트
+    placed = 0  # 지금까지 넣은 식별자 수
+    per_byte = spec.density / 1024.0
+    kinds = spec.kinds if spec.density > 0 else ()
+    while total < size:
+        parts = [rng.choice(_FILLER)]
+        row_bytes = len(parts[0].encode("utf-8")) + 1
+        # 식별자 길이까지 포함한 본문 크기 기준으로 밀도를 맞춤 (한 행 최대 ROW_MAX_IDS 개)
+        while kinds and placed < per_byte * (total + row_bytes) and len(parts) <= _ROW_MAX_IDS:
+            kind = rng.choice(kinds)
+            name, gen, has_check = IDENTIFIER_KINDS[kind]
+            invalid = has_check and spec.invalid_ratio > 0 and rng.random() < spec.invalid_ratio
+            value = gen(rng, invalid)
+            if rng.random() < spec.labeled_ratio:
+                value = f"{name}: {value}"
+            parts.append(value)
+            row_bytes += len(value.encode("utf-8")) + 1
+            placed += 1
+            key = f"{kind}:invalid" if invalid else kind
+            counts[key] = counts.get(key, 0) + 1
+        rows.append(parts)
+        total += row_bytes
+    return rows
+
+
+def rows_text(rows: List[List[str]]) -> str:
+    return "".join(" ".join(parts) + "\n" for parts in rows)
+
+
+# ------------------ Template bodies ------------------
+
+# 자리표시자: {주민등록번호} 처럼 표시 이름, 또는 {rrn} 처럼 종류 키
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+_KIND_BY_NAME = {name: kind for kind, (name, _, _) in IDENTIFIER_KINDS.items()}
+BASE_INFO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "base", "base_info.py")
+
+
+def load_base_info(path: str = BASE_INFO_PATH) -> Dict[str, str]:
+    """base/base_info.py 의 info_dict (표시 이름 → 값)"""
+    return dict(runpy.run_path(path)["info_dict"])
+
+
+class TemplateBody(BodySource):
+    """
+    템플릿의 자리표시자를 채운 본문 variants 개를 처음 쓸 때 한 번 만들어 두고 요청마다 돌려 쓴다.
+    values(표시 이름 → 값, 예: load_base_info()) 에 있는 자리는 그 값으로, 나머지는 seed 로 만든 합성 식별자로 채운다.
+    모든 변형은 가장 긴 것에 맞춰 끝을 공백으로 채우므로 길이가 같다 (size() 가 정확).
+    """
+    __slots__ = ("template", "variants", "seed", "values", "_bodies", "_gz", "_next")
+
+    def __init__(self, template: str, variants: int = 1, seed: int = 0, values: Optional[Dict[str, str]] = None,
+                 name: Optional[str] = None, filename: Optional[str] = None):
+        super().__init__(name or f"템플릿({len(template)}자 x {max(1, variants)})", filename)
+        self.template = template
+        self.variants = max(1, variants)
+        self.seed = seed
+        self.values = dict(values or {})
+        unknown = [k for k in _PLACEHOLDER.findall(template)
+                   if k not in self.values and k not in _KIND_BY_NAME and k not in IDENTIFIER_KINDS]
+        if unknown:
+            raise ValueError(f"알 수 없는 자리표시자: {', '.join(sorted(set(unknown)))}")
+        self._bodies: Optional[List[bytes]] = None
+        self._gz: Dict[int, List[bytes]] = {}
+        self._next = itertools.count()
+
+    def __getstate__(self):
+        return self.name, self.filename, self.template, self.variants, self.seed, self.values
+
+    def __setstate__(self, state):
+        self.name, self.filename, self.template, self.variants, self.seed, self.values = state
+        self._bodies = None
+        self._gz = {}
+        self._next = itertools.count()
+
+    def _render(self) -> List[bytes]:
+        bodies = self._bodies
+        if bodies is None:
+            rng = random.Random(self.seed)
+
+            def fill(m) -> str:
+                key = m.group(1)
+                if key in self.values:
+                    return str(self.values[key])
+                return IDENTIFIER_KINDS[_KIND_BY_NAME.get(key, key)][1](rng)
+
+            raw = [_PLACEHOLDER.sub(fill, self.template).encode("utf-8") for _ in range(self.variants)]
+            width = max(len(b) for b in raw)
+            bodies = self._bodies = [b.ljust(width) for b in raw]
+        return bodies
+
+    def size(self) -> int:
+        return len(self._render()[0])
+
+    def open(self, chunk_size: int) -> Iterable:
+        bodies = self._render()
+        body = bodies[next(self._next) % len(bodies)]
+        if len(body) <= chunk_size:
+            return [body]
+        return iter_view_chunks(memoryview(body), chunk_size)
+
+    def gzipped(self, level: int) -> bytes:
+        """다음 변형의 gzip 결과 (레벨별로 변형마다 한 번만 압축)"""
+        gz = self._gz.get(level)
+        if gz is None:
+            gz = self._gz[level] = [gzip.compress(b, level) for b in self._render()]
+        return gz[next(self._next) % len(gz)]
+
+
+# ------------------ Containers ------------------
+# docx / xlsx 는 최소 OOXML 패키지를 zipfile 로 직접 만든다 (추가 의존성 없음)
+
+_DOCX_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+_XLSX_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+_XLSX_RELS = _DOCX_RELS.replace("word/document.xml", "xl/workbook.xml")
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+    'worksheet" Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+
+def build_docx(rows: List[List[str]]) -> bytes:
+    body = "".join(f'<w:p><w:r><w:t xml:space="preserve">{escape(" ".join(parts))}</w:t></w:r></w:p>'
+                   for parts in rows)
+    doc = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           f'<w:body>{body}</w:body></w:document>')
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", _DOCX_TYPES)
+        z.writestr("_rels/.rels", _DOCX_RELS)
+        z.writestr("word/document.xml", doc)
+    return buf.getvalue()
+
+
+def _col_name(c: int) -> str:
+    name = ""
+    c += 1
+    while c:
+        c, rem = divmod(c - 1, 26)
+        name = chr(65 + rem) + name
+    return name
+
+
+def build_xlsx(rows: List[List[str]]) -> bytes:
+    """채움 문장은 A 열, 식별자는 B 열부터 (인라인 문자열 셀)"""
+    xml_rows = []
+    for r, parts in enumerate(rows, 1):
+        xml_rows.append(f'<row r="{r}">' + "".join(
+            f'<c r="{_col_name(c)}{r}" t="inlineStr"><is><t xml:space="preserve">{escape(v)}</t></is></c>'
+            for c, v in enumerate(parts)) + "</row>")
+    sheet = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             f'<sheetData>{"".join(xml_rows)}</sheetData></worksheet>')
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("[Content_Types].xml", _XLSX_TYPES)
+        z.writestr("_rels/.rels", _XLSX_RELS)
+        z.writestr("xl/workbook.xml", _XLSX_WORKBOOK)
+        z.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        z.writestr("xl/worksheets/sheet1.xml", sheet)
+    return buf.getvalue()
+
+
+def build_zip(members: List[List[List[str]]]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as z:
+        for i, rows in enumerate(members, 1):
+            z.writestr(f"doc_{i:02d}.txt", rows_text(rows))
+    return buf.getvalue()
+
+
+# ------------------ Corpus ------------------
+
+def _make_file(args: Tuple[str, CorpusSpec, int]) -> Dict:
+    """파일 하나 생성 (파일마다 seed + 번호로 난수를 시작하므로 병렬로 만들어도 결과가 같다)"""
+    out_dir, spec, idx = args
+    rng = random.Random(spec.seed * 1_000_003 + idx)
+    fmt = spec.formats[idx % len(spec.formats)]
+    size = spec.size_kb * 1024
+    counts: Dict[str, int] = {}
+    if fmt == "zip":
+        n = max(1, spec.zip_members)
+        data = build_zip([build_rows(rng, spec, size // n, counts) for _ in range(n)])
+    else:
+        rows = build_rows(rng, spec, size, counts)
+        if fmt == "docx":
+            data = build_docx(rows)
+        elif fmt == "xlsx":
+            data = build_xlsx(rows)
+        else:
+            data = rows_text(rows).encode("utf-8")
+    name = f"corpus_{idx:07d}.{fmt}"
+    with open(os.path.join(out_dir, name), "wb") as f:
+        f.write(data)
+    return {"name": name, "format": fmt, "bytes": len(data), "counts": counts}
+
+
+def generate_corpus(out_dir: str, spec: CorpusSpec, jobs: int = 1,
+                    progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """out_dir 에 코퍼스 파일과 manifest.json 을 만들고 manifest 를 돌려준다"""
+    spec.validate()
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(out_dir, spec, i) for i in range(spec.files)]
+    entries: List[Dict] = []
+    if jobs > 1:
+        with ProcessPoolExecutor(jobs) as ex:
+            for entry in ex.map(_make_file, tasks, chunksize=16):
+                entries.append(entry)
+                if progress:
+                    progress(len(entries), spec.files)
+    else:
+        for task in tasks:
+            entries.append(_make_file(task))
+            if progress:
+                progress(len(entries), spec.files)
+
+    totals: Dict[str, int] = {}
+    for e in entries:
+        for k, v in e["counts"].items():
+            totals[k] = totals.get(k, 0) + v
+    manifest = {
+        "version": 1,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "spec": spec.to_dict(),
+        "files": entries,
+        "bytes": sum(e["bytes"] for e in entries),
+        "identifiers": totals,
+    }
+    with open(os.path.join(out_dir, CORPUS_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    return manifest
+
+
+def load_corpus_items(folder: str) -> Optional[List[str]]:
+    """folder 가 코퍼스(manifest.json 있음)면 manifest 순서의 파일 경로 목록, 아니면 None"""
+    path = os.path.join(folder, CORPUS_MANIFEST)
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    items = [os.path.join(folder, e["name"]) for e in manifest.get("files", [])]
+    return [p for p in items if os.path.isfile(p)]
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="DLP 패턴 시험용 합성 개인정보 코퍼스 생성 (txt/docx/xlsx/zip + manifest)")
+    p.add_argument("out_dir", help="출력 폴더 (프로필/GUI 의 폴더로 지정해 전송)")
+    p.add_argument("--files", type=int, default=100, help="파일 수 (기본: 100)")
+    p.add_argument("--size-kb", type=int, default=64, help="파일당 본문 크기(KB) (기본: 64)")
+    p.add_argument("--density", type=float, default=4.0, help="본문 1KB 당 식별자 수 (기본: 4)")
+    p.add_argument("--formats", default=",".join(CORPUS_FORMATS),
+                   help=f"쉼표로 구분한 형식, 번갈아 생성 (기본: {','.join(CORPUS_FORMATS)})")
+    p.add_argument("--kinds", default=",".join(IDENTIFIER_KINDS), help="쉼표로 구분한 식별자 종류 (기본: 전부)")
+    p.add_argument("--invalid-ratio", type=float, default=0.0, help="검증 숫자가 틀린 값의 비율 0~1 (기본: 0)")
+    p.add_argument("--labeled-ratio", type=float, default=0.5, help="'이름: 값' 형태로 넣는 비율 0~1 (기본: 0.5)")
+    p.add_argument("--zip-members", type=int, default=4, help="zip 하나에 넣는 txt 수 (기본: 4)")
+    p.add_argument("--seed", type=int, default=0, help="난수 seed (같으면 같은 코퍼스)")
+    p.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="생성 프로세스 수 (기본: CPU 코어 수)")
+    args = p.parse_args(argv)
+
+    spec = CorpusSpec(
+        files=args.files, size_kb=args.size_kb, density=args.density,
+        formats=tuple(f.strip() for f in args.formats.split(",") if f.strip()),
+        kinds=tuple(k.strip() for k in args.kinds.split(",") if k.strip()),
+        invalid_ratio=args.invalid_ratio, labeled_ratio=args.labeled_ratio,
+        zip_members=args.zip_members, seed=args.seed,
+    )
+    step = max(1, spec.files // 20)
+
+    def progress(done: int, total: int):
+        if done % step == 0 or done == total:
+            print(f"[안내] {done}/{total} 파일 생성", flush=True)
+
+    try:
+        manifest = generate_corpus(args.out_dir, spec, jobs=max(1, args.jobs), progress=progress)
+    except (OSError, ValueError) as e:
+        print(f"[오류] {e}", file=sys.stderr, flush=True)
+        return 2
+    ids = manifest["identifiers"]
+    print(f"[완료] {len(manifest['files'])}개 파일, {manifest['bytes'] / 1024 / 1024:.1f}MB, "
+          f"식별자 {sum(ids.values())}개 → {os.path.join(args.out_dir, CORPUS_MANIFEST)}", flush=True)
+    print("       " + ", ".join(f"{k}={v}" for k, v in sorted(ids.items())), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# 구조화 이벤트 로그(.evlog) 읽기/변환
+# 사용: (HTTP_Uploader 폴더에서) python -m uploader_events events.evlog [--to jsonl|csv|text] [-o 출력] [--summary]
+import io
+import sys
+import csv
+import json
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+
+from uploader_core import (
+    EVENT_LOG_MAGIC, EVENT_FRAME, EVENT_FRAME_META, EVENT_FRAME_BATCH, EVENT_RECORD, EVENT_TAGS,
+    EVENT_NO_LATENCY, EVENT_NO_ITEM, LatencyHistogram,
+)
+
+EVENT_FORMATS = ("jsonl", "csv", "text")
+
+
+class Event(NamedTuple):
+    thread: int
+    mono_ns: int
+    bytes: int
+    status: Optional[int]       # None = 응답 없음
+    latency_ms: Optional[float]  # None = 응답 없음
+    tag: str
+    item: Optional[int]         # 전체 항목 목록에서의 번호 (meta["items"] 의 인덱스)
+
+
+def read_event_log(path: str) -> Tuple[Dict, Iterator[Event]]:
+    """
+    (메타, 이벤트 이터레이터). 기록 중이거나 비정상 종료로 잘린 마지막 프레임은 무시한다.
+    파일은 이터레이터를 끝까지 돌면 닫힌다.
+    """
+    f = open(path, "rb")
+    try:
+        if f.read(len(EVENT_LOG_MAGIC)) != EVENT_LOG_MAGIC:
+            raise ValueError(f"이벤트 로그 파일이 아닙니다: {path}")
+        head = f.read(EVENT_FRAME.size)
+        if len(head) < EVENT_FRAME.size:
+            raise ValueError(f"메타 정보가 없습니다: {path}")
+        size, kind = EVENT_FRAME.unpack(head)
+        if kind != EVENT_FRAME_META:
+            raise ValueError(f"메타 정보가 없습니다: {path}")
+        meta = json.loads(f.read(size).decode("utf-8"))
+    except Exception:
+        f.close()
+        raise
+    return meta, _iter_events(f)
+
+
+def _iter_events(f) -> Iterator[Event]:
+    with f:
+        while True:
+            head = f.read(EVENT_FRAME.size)
+            if len(head) < EVENT_FRAME.size:
+                return
+            size, kind = EVENT_FRAME.unpack(head)
+            payload = f.read(size)
+            if len(payload) < size:
+                return
+            if kind != EVENT_FRAME_BATCH:
+                continue
+            usable = len(payload) - len(payload) % EVENT_RECORD.size
+            for thread, mono_ns, nbytes, status, lat_us, tag, item in EVENT_RECORD.iter_unpack(payload[:usable]):
+                yield Event(
+                    thread, mono_ns, nbytes, status or None,
+                    None if lat_us == EVENT_NO_LATENCY else lat_us / 1000.0,
+                    EVENT_TAGS[tag] if tag < len(EVENT_TAGS) else "[INFO]",
+                    None if item == EVENT_NO_ITEM else item,
+                )
+
+
+def event_wall_time(meta: Dict, ev: Event) -> datetime:
+    """monotonic 완료 시각 → 기록 시작 시점 기준 벽시계 시각"""
+    return datetime.fromtimestamp((meta["wall_ns"] + ev.mono_ns - meta["mono_ns"]) / 1e9)
+
+
+def event_item_desc(meta: Dict, ev: Event) -> str:
+    items = meta.get("items") or []
+    return items[ev.item] if ev.item is not None and ev.item < len(items) else "-"
+
+
+def format_event_text(meta: Dict, ev: Event) -> str:
+    """텍스트 로그 한 줄 (요청별 텍스트 로그와 비슷한 형식)"""
+    ts = event_wall_time(meta, ev).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    status = str(ev.status) if ev.status is not None else "응답 없음"
+    lat = f"{ev.latency_ms:.1f}ms" if ev.latency_ms is not None else "-"
+    return (f"[{ts}] {ev.tag} [스레드 {ev.thread}] {event_item_desc(meta, ev)} "
+            f"(응답={status}, 응답시간={lat}, {ev.bytes}B)")
+
+
+def write_events(meta: Dict, events: Iterator[Event], out, fmt: str) -> int:
+    """이벤트를 fmt(jsonl/csv/text) 로 out 에 쓰고 건수를 돌려준다"""
+    n = 0
+    if fmt == "csv":
+        w = csv.writer(out)
+        w.writerow(("time", "thread", "mono_ns", "bytes", "status", "latency_ms", "tag", "item", "desc"))
+        for ev in events:
+            w.writerow((event_wall_time(meta, ev).isoformat(timespec="milliseconds"), ev.thread, ev.mono_ns,
+                        ev.bytes, "" if ev.status is None else ev.status,
+                        "" if ev.latency_ms is None else f"{ev.latency_ms:.3f}", ev.tag,
+                        "" if ev.item is None else ev.item, event_item_desc(meta, ev)))
+            n += 1
+    elif fmt == "jsonl":
+        for ev in events:
+            rec = ev._asdict()
+            rec["time"] = event_wall_time(meta, ev).isoformat(timespec="milliseconds")
+            rec["desc"] = event_item_desc(meta, ev)
+            out.write(json.dumps(rec, ensure_ascii=False))
+            out.write("\n")
+            n += 1
+    else:
+        for ev in events:
+            out.write(format_event_text(meta, ev))
+            out.write("\n")
+            n += 1
+    return n
+
+
+def summarize_events(events: Iterator[Event]) -> str:
+    """판정별 건수 + 응답시간 분포 요약"""
+    tags: Dict[str, int] = {}
+    total = nbytes = 0
+    first = last = None
+    hist = LatencyHistogram()
+    for ev in events:
+        total += 1
+        nbytes += ev.bytes
+        tags[ev.tag] = tags.get(ev.tag, 0) + 1
+        if ev.latency_ms is not None:
+            hist.record(ev.latency_ms)
+        first = ev.mono_ns if first is None else min(first, ev.mono_ns)
+        last = ev.mono_ns if last is None else max(last, ev.mono_ns)
+    span = (last - first) / 1e9 if total > 1 else 0.0
+    lines = [f"이벤트 {total}건, {nbytes} bytes, {span:.1f}초"
+             + (f" ({total / span:.1f} req/s)" if span > 0 else "")]
+    lines.append("판정: " + (", ".join(f"{t}={tags[t]}" for t in EVENT_TAGS if t in tags) or "-"))
+    lines.append(f"응답 시간 ({hist.total}건): {hist.summary()}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    p = argparse.ArgumentParser(description="구조화 이벤트 로그(.evlog)를 JSONL / CSV / 텍스트로 변환")
+    p.add_argument("path", help="이벤트 로그 파일 (.evlog)")
+    p.add_argument("--to", choices=EVENT_FORMATS, default="text", help="출력 형식 (기본: text)")
+    p.add_argument("-o", "--output", help="출력 파일 (기본: 표준 출력)")
+    p.add_argument("--summary", action="store_true", help="변환 대신 판정별 건수/응답시간 요약만 출력")
+    args = p.parse_args(argv)
+
+    try:
+        meta, events = read_event_log(args.path)
+    except (OSError, ValueError) as e:
+        print(f"[오류] {e}", file=sys.stderr, flush=True)
+        return 2
+
+    if args.summary:
+        try:
+            print(summarize_events(events), flush=True)
+        except BrokenPipeError:
+            pass
+        return 0
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            n = write_events(meta, events, out, args.to)
+        print(f"[안내] {n}건 → {args.output}", file=sys.stderr, flush=True)
+    else:
+        out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="", write_through=True)
+        try:
+            write_events(meta, events, out, args.to)
+        except BrokenPipeError:
+            pass  # head 등으로 앞부분만 볼 때
+        out.detach()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
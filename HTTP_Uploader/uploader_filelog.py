@@ -0,0 +1,234 @@
+# 파일 로그 기록기: 큐(조건 변수) 기반 기록 스레드 + 크기/날짜 기준 회전 + 백그라운드 gzip 압축
+# - 로그를 넣는 쪽은 잠금 한 번 + deque append 만 하고, 타임스탬프 문자열은 기록 스레드가 초 단위로 캐시해 만든다.
+# - 큐 메모리는 max_queue_bytes 로 제한하고, 넘치면 줄을 버리고 버린 수를 파일에 남긴다.
+# - 회전된 파일의 압축은 별도 스레드가 하므로 압축 중에도 기록은 멈추지 않는다.
+import os
+import sys
+import gzip
+import queue
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+
+# 파일 하나의 최대 크기 (문자 수 기준 대략, 넘으면 새 파일로 회전)
+FILE_LOG_MAX_BYTES = 256 * 1024 * 1024
+# 기록 대기 중인 로그의 최대 메모리 (대략 문자 수 기준)
+FILE_LOG_QUEUE_BYTES = 32 * 1024 * 1024
+# 회전된 파일 압축 레벨 (속도 우선)
+FILE_LOG_GZIP_LEVEL = 6
+
+
+def _next_midnight(now: float) -> float:
+    d = datetime.fromtimestamp(now).date() + timedelta(days=1)
+    return datetime(d.year, d.month, d.day).timestamp()
+
+
+def _report(msg: str):
+    try:
+        sys.stderr.write(msg + "\n")
+    except Exception:
+        pass
+
+
+class LogCompressor(threading.Thread):
+    """회전된 로그 파일을 하나씩 gzip 압축하고 원본을 지운다 (실패하면 원본 유지)"""
+
+    def __init__(self, level: int = FILE_LOG_GZIP_LEVEL):
+        super().__init__(daemon=True)
+        self.level = level
+        self._q: "queue.Queue[str]" = queue.Queue()
+
+    def submit(self, path: str):
+        self._q.put(path)
+
+    def close(self, timeout: float = 30.0):
+        """대기 중인 압축까지 끝내고 종료 (종료 시 압축 파일이 잘리지 않게)"""
+        self._q.put(None)
+        if self.is_alive():
+            self.join(timeout)
+
+    def run(self):
+        while True:
+            path = self._q.get()
+            if path is None:
+                return
+            try:
+                with open(path, "rb") as f_in, gzip.open(path + ".gz", "wb", compresslevel=self.level) as f_out:
+                    shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+                os.remove(path)
+            except Exception as e:
+                _report(f"[FILE_LOG_ROTATE_ERROR] {path}: {e}")
+
+
+class RotatingLogWriter(threading.Thread):
+    """
+    텍스트 로그 파일 기록 스레드.
+    write(line) 은 (시각, 줄) 을 큐에 넣기만 하고, 기록 스레드는 조건 변수로 깨어나 쌓인 줄을 한 번에 쓴다.
+    날짜가 바뀌거나 파일이 max_bytes 를 넘으면 새 파일(log_YYYYmmdd_HHMMSS.txt)로 바꾸고
+    이전 파일은 LogCompressor 가 압축한다. 종료 시 close() 로 남은 줄까지 기록.
+    새 파일을 열 수 없으면(쓰기 권한 없는 폴더 등) 이전 파일에 계속 쓰고 다음 묶음에서 다시 시도한다.
+    쓸 파일이 하나도 없는 동안의 줄은 버리고, 파일이 다시 열리면 버린 수를 남긴다.
+    """
+
+    def __init__(self, log_dir: str, max_bytes: int = FILE_LOG_MAX_BYTES,
+                 max_queue_bytes: int = FILE_LOG_QUEUE_BYTES):
+        super().__init__(daemon=True)
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.max_queue_bytes = max_queue_bytes
+        self.path: Optional[str] = None
+        self.dropped_total = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: deque = deque()
+        self._queued = 0
+        self._dropped = 0
+        self._rotate = False
+        self._closing = False
+        self._compressor = LogCompressor()
+        self._compressor.start()
+
+    # ---------- 넣는 쪽 (아무 스레드) ----------
+
+    def write(self, line: str):
+        with self._cond:
+            if self._queued >= self.max_queue_bytes:
+                self._dropped += 1
+                return
+            self._queued += len(line)
+            self._pending.append((time.time(), line))
+            if len(self._pending) == 1:
+                self._cond.notify()
+
+    def set_dir(self, log_dir: str):
+        """로그 폴더 변경 (다음 기록부터 새 폴더의 새 파일에)"""
+        with self._cond:
+            self.log_dir = log_dir
+            self._rotate = True
+            self._cond.notify()
+
+    def close(self, timeout: float = 5.0):
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        if self.is_alive():
+            self.join(timeout)
+        self._compressor.close()
+
+    # ---------- 기록 스레드 ----------
+
+    def _open(self, now: float):
+        os.makedirs(self.log_dir, exist_ok=True)
+        ts = datetime.fromtimestamp(now).strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.log_dir, f"log_{ts}.txt")
+        n = 1
+        while os.path.exists(path) or os.path.exists(path + ".gz"):
+            path = os.path.join(self.log_dir, f"log_{ts}_{n}.txt")
+            n += 1
+        fp = open(path, "a", encoding="utf-8", errors="replace", buffering=1024 * 1024)
+        fp.write(f"[SYSTEM] New log file started at {ts}\n")
+        return fp, path
+
+    def _switch(self, fp, now: float, failed: bool):
+        """
+        새 파일로 바꾼다: 새 파일이 열린 뒤에만 이전 파일을 닫고 압축에 넘긴다.
+        반환 (파일, 성공 여부) — 실패하면 이전 파일(없으면 None)을 그대로 돌려준다.
+        오류는 연속 실패의 첫 번째만 알린다.
+        """
+        try:
+            new_fp, path = self._open(now)
+        except OSError as e:
+            if not failed:
+                msg = f"[FILE_LOG_ERROR] 새 로그 파일을 열 수 없습니다 ({self.log_dir}): {e}"
+                _report(msg)
+                if fp is not None:
+                    try:
+                        fp.write(msg + "\n")
+                    except OSError:
+                        pass
+            return fp, False
+        if fp is not None:
+            try:
+                fp.close()
+            except OSError:
+                pass
+            if self.path:
+                self._compressor.submit(self.path)
+        self.path = path
+        return new_fp, True
+
+    def run(self):
+        now = time.time()
+        fp, ok = self._switch(None, now, False)
+        want_new, failed = not ok, not ok
+        lost = 0  # 쓸 파일이 없어 버린 줄 수 (파일이 다시 열리면 남김)
+        size = 0
+        next_day = _next_midnight(now)
+        last_sec, prefix = -1, ""
+        while True:
+            with self._cond:
+                while not (self._pending or self._rotate or self._closing):
+                    wait = next_day - time.time()
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+                batch, self._pending, self._queued = self._pending, deque(), 0
+                dropped, self._dropped = self._dropped, 0
+                rotate, self._rotate = self._rotate, False
+                closing = self._closing
+
+            now = time.time()
+            if rotate or now >= next_day:
+                want_new = True
+                next_day = _next_midnight(now)
+            if want_new:
+                fp, ok = self._switch(fp, now, failed)
+                if ok:
+                    size, want_new, failed = 0, False, False
+                else:
+                    failed = True
+
+            if fp is None:
+                self.dropped_total += dropped
+                lost += len(batch) + dropped
+            else:
+                lines = []
+                for t, line in batch:
+                    sec = int(t)
+                    if sec != last_sec:
+                        last_sec = sec
+                        prefix = time.strftime("[%Y-%m-%d %H:%M:%S] ", time.localtime(sec))
+                    lines.append(f"{prefix}{line}\n")
+                if dropped:
+                    self.dropped_total += dropped
+                    lines.append(f"[SYSTEM] 로그 대기열이 가득 차 {dropped}줄을 기록하지 못했습니다.\n")
+                if lost:
+                    lines.append(f"[SYSTEM] 로그 파일을 쓸 수 없어 {lost}줄을 기록하지 못했습니다.\n")
+                try:
+                    if lines:
+                        fp.writelines(lines)
+                        fp.flush()
+                        size += sum(map(len, lines))
+                    lost = 0
+                except OSError as e:
+                    # 쓰던 파일이 망가짐(디스크 가득/폴더 삭제 등) → 버리고 다음 묶음에서 새 파일
+                    _report(f"[FILE_LOG_ERROR] {self.path}: {e}")
+                    try:
+                        fp.close()
+                    except OSError:
+                        pass
+                    fp, want_new, failed = None, True, True
+                    lost += len(batch)
+                    time.sleep(1)
+                if size >= self.max_bytes:
+                    want_new = True
+
+            if closing:
+                if fp is not None:
+                    try:
+                        fp.close()
+                    except OSError:
+                        pass
+                return
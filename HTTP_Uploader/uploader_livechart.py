@@ -0,0 +1,209 @@
+# 실시간 그래프 창 (PySide6.QtCharts)
+# - 실행 지표 시계열(RunSeries)에서 지난번 이후 확정된 점만 1초마다 덧붙인다 (전체 다시 그리기 없음).
+# - QtCharts 는 PySide6 에 포함되어 있으므로 추가 의존성이 없고, '그래프 보기'를 처음 누를 때만 import 한다.
+import bisect
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor
+from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+from uploader_core import LAT_PERCENTILES
+
+# 새 점을 가져오는 주기(ms)
+LIVE_CHART_REFRESH_MS = 1000
+
+
+def _mark_pen(width: float = 0.8, style=Qt.DashLine) -> QPen:
+    pen = QPen(QColor("gray"))
+    pen.setWidthF(width)
+    pen.setStyle(style)
+    return pen
+
+
+class _LiveChart:
+    """
+    QChart 하나: 열별 QLineSeries + x/y 축 (y 축은 지금까지 그린 값의 최댓값 기준).
+    secondary=(열, 이름, 축 제목) 이면 오른쪽 보조 축에 그 열을 그린다 (처음엔 숨김).
+    부하 단계 경계는 점 두 개짜리 세로 점선 QLineSeries 로 그린다 (범례에는 안 보임).
+    """
+
+    def __init__(self, title: str, y_label: str, columns: List[Tuple[str, str]],
+                 secondary: Optional[Tuple[str, str, str]] = None):
+        self.chart = QChart()
+        self.chart.setTitle(title)
+        self.view = QChartView(self.chart)
+        self.view.setRenderHint(QPainter.Antialiasing)
+
+        self.ax_x = QValueAxis()
+        self.ax_x.setTitleText("가동 후 시간 (초)")
+        self.ax_x.setLabelFormat("%d")
+        self.ax_y = QValueAxis()
+        self.ax_y.setTitleText(y_label)
+        self.chart.addAxis(self.ax_x, Qt.AlignBottom)
+        self.chart.addAxis(self.ax_y, Qt.AlignLeft)
+
+        self.lines: Dict[str, QLineSeries] = {}
+        for col, name in columns:
+            line = QLineSeries()
+            line.setName(name)
+            self.chart.addSeries(line)
+            line.attachAxis(self.ax_x)
+            line.attachAxis(self.ax_y)
+            self.lines[col] = line
+        self.y_max = 0.0
+
+        self.col2 = self.ax_y2 = self.line2 = None
+        self.y2_max = 0.0
+        if secondary is not None:
+            self.col2, name, label = secondary
+            self.ax_y2 = QValueAxis()
+            self.ax_y2.setTitleText(label)
+            self.ax_y2.setLabelFormat("%d")
+            self.chart.addAxis(self.ax_y2, Qt.AlignRight)
+            self.line2 = QLineSeries()
+            self.line2.setName(name)
+            self.line2.setPen(_mark_pen(1.5, Qt.SolidLine))
+            self.chart.addSeries(self.line2)
+            self.line2.attachAxis(self.ax_x)
+            self.line2.attachAxis(self.ax_y2)
+            self.set_secondary_visible(False)
+        self.marks: List[QLineSeries] = []
+
+    def set_secondary_visible(self, visible: bool):
+        if self.line2 is not None:
+            self.line2.setVisible(visible)
+            self.ax_y2.setVisible(visible)
+
+    def clear(self):
+        for line in self.lines.values():
+            line.clear()
+        self.y_max = 0.0
+        if self.line2 is not None:
+            self.line2.clear()
+            self.y2_max = 0.0
+            self.set_secondary_visible(False)
+        for line in self.marks:
+            self.chart.removeSeries(line)
+        self.marks = []
+
+    def add_mark(self, x: float):
+        """부하 단계 경계 (x 초) 세로선"""
+        line = QLineSeries()
+        line.setPen(_mark_pen())
+        line.append([QPointF(x, 0.0), QPointF(x, self.ax_y.max())])
+        self.chart.addSeries(line)
+        line.attachAxis(self.ax_x)
+        line.attachAxis(self.ax_y)
+        for marker in self.chart.legend().markers(line):
+            marker.setVisible(False)
+        self.marks.append(line)
+
+    def append(self, x: Sequence[float], cols: Dict[str, Sequence[float]], keep: int):
+        """새 점을 덧붙이고, ring buffer 에서 밀려난 만큼 앞쪽 점을 지운다"""
+        for col, line in self.lines.items():
+            ys = cols[col]
+            line.append([QPointF(a, b) for a, b in zip(x, ys)])
+            extra = line.count() - keep
+            if extra > 0:
+                line.removePoints(0, extra)
+            self.y_max = max(self.y_max, max(ys))
+        top = self.y_max * 1.1 or 1.0
+        self.ax_y.setRange(0, top)
+        for line in self.marks:
+            line.replace(1, QPointF(line.at(1).x(), top))
+        if self.line2 is not None:
+            ys = cols[self.col2]
+            self.line2.append([QPointF(a, b) for a, b in zip(x, ys)])
+            extra = self.line2.count() - keep
+            if extra > 0:
+                self.line2.removePoints(0, extra)
+            self.y2_max = max(self.y2_max, max(ys))
+            self.ax_y2.setRange(0, self.y2_max * 1.1 or 1.0)
+
+    def set_x_range(self, x0: float, x1: float):
+        self.ax_x.setRange(x0, max(x1, x0 + 1))
+
+
+class LiveChartWindow(QWidget):
+    """
+    실시간 그래프 창 (비모달): 트래픽 / 차단율 / 응답시간 백분위.
+    부하 단계가 있으면 차단율 그래프 보조 축에 동시 전송 수, 모든 그래프에 단계 경계 점선을 그린다.
+    source() 는 (RunSeries, 부하 단계 경계 목록) 을 돌려주고 lock 아래에서만 읽는다.
+    새 실행이 시작되거나 해상도(1초/10초/1분)가 바뀌면 처음부터 다시 그린다.
+    """
+
+    def __init__(self, source: Callable, lock, parent=None):
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("실시간 그래프")
+        self.resize(900, 900)
+        self._source = source
+        self._lock = lock
+        self._series = None
+        self._res = 0
+        self._last_t = -1.0
+        self._marks = 0  # 이미 그린 단계 경계 수
+
+        self.lbl_info = QLabel("수집된 전송 기록이 없습니다.")
+        self.ch_traffic = _LiveChart("전송 트래픽", "Mbps", [("mbps", "트래픽")])
+        self.ch_block = _LiveChart("차단율 (응답 없음 포함)", "%", [("block_rate", "차단율")],
+                                   secondary=("workers", "동시 전송 수", "동시 전송 수"))
+        self.ch_latency = _LiveChart("응답 시간 백분위", "ms",
+                                     [(f"p{p:g}", f"p{p:g}") for p in LAT_PERCENTILES])
+        self._charts = (self.ch_traffic, self.ch_block, self.ch_latency)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.lbl_info)
+        for ch in self._charts:
+            layout.addWidget(ch.view)
+        self.setLayout(layout)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(LIVE_CHART_REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+    def refresh(self):
+        if not self.isVisible():
+            return
+        with self._lock:
+            series, phase_marks = self._source()
+            res, cols = series.view()
+            t = cols["t"]
+            if series is not self._series or res != self._res:
+                for ch in self._charts:
+                    ch.clear()
+                self._series, self._res, self._last_t, self._marks = series, res, -1.0, 0
+            new_marks = [m[0] for m in phase_marks[self._marks:]]
+            self._marks = len(phase_marks)
+            start = bisect.bisect_right(t, self._last_t)
+            new = None
+            if start < len(t):
+                # 새로 확정된 점만 복사 (ring buffer 는 memoryview 로 슬라이스)
+                new = {name: col[start:].tolist() for name, col in cols.items()}
+                keep, first_t = len(t), t[0]
+            has_workers = series.has_workers
+            workers = cols["workers"][-1] if has_workers and len(t) else None
+            stage = phase_marks[-1][1] if phase_marks else ""
+
+        for x0 in new_marks:
+            for ch in self._charts:
+                ch.add_mark(x0)
+        if new is None:
+            return
+        self.ch_block.set_secondary_visible(has_workers)
+
+        x = new["t"]
+        new["block_rate"] = [b * 100.0 / (s + b) if s + b else 0.0 for s, b in zip(new["success"], new["block"])]
+        for ch in self._charts:
+            ch.append(x, new, keep)
+            ch.set_x_range(first_t, x[-1])
+        self._last_t = x[-1]
+
+        info = f"해상도 {res}초 | 마지막 {x[-1] + res:.0f}초까지"
+        if workers is not None:
+            info += f" | 동시 전송 {workers:.0f}"
+        if stage:
+            info += f" | 단계: {stage}"
+        self.lbl_info.setText(info)
@@ -0,0 +1,201 @@
+# 화면 로그 보기: 고정 용량 ring buffer + 모델/뷰 (QAbstractListModel + QListView)
+# - 모든 줄을 보관(최근 LOG_VIEW_MAX_LINES 줄)하고, 화면에 보이는 줄만 그린다.
+# - 태그([SUCCESS], [BLOCK], ...)별 색인을 유지해 필터를 바꿔도 다시 훑지 않는다.
+from array import array
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget, QListView, QComboBox, QLabel, QHBoxLayout, QVBoxLayout
+
+# 화면에 보관하는 최대 줄 수 (넘으면 오래된 줄부터 지움, 파일 로그는 전부 남음)
+LOG_VIEW_MAX_LINES = 100_000
+# 태그 번호 = 인덱스. 0 은 태그 없는 안내/기타 줄
+LOG_TAGS = ("", "[SUCCESS]", "[BLOCK]", "[SERVER_ERR]", "[TIMEOUT]", "[RESET]", "[ERROR]", "[FATAL]")
+LOG_TAG_COLORS = (None, "#80ff80", "#ff8080", "#ff8080", "#ffcc66", "#ffcc66", "#ff5555", "#ff5555")
+_TAG_ID = {tag: i for i, tag in enumerate(LOG_TAGS) if tag}
+# 태그 색인 앞쪽의 지워진 칸이 이만큼 쌓이면 압축
+_INDEX_COMPACT = 4096
+
+
+def log_tag_id(line: str) -> int:
+    """줄 맨 앞 [TAG] 의 태그 번호 (모르는 태그/태그 없음은 0)"""
+    if line.startswith("["):
+        end = line.find("]")
+        if end > 0:
+            return _TAG_ID.get(line[:end + 1], 0)
+    return 0
+
+
+class LogRing:
+    """
+    로그 줄 ring buffer. 줄마다 일련번호(seq)를 매기고 seq % capacity 칸에 둔다.
+    태그별로 seq 색인(array)을 유지하므로 필터된 보기의 n 번째 줄을 O(1) 로 찾는다.
+    """
+    __slots__ = ("capacity", "_lines", "_tags", "_first", "_next", "_idx", "_idx_start")
+
+    def __init__(self, capacity: int = LOG_VIEW_MAX_LINES):
+        self.capacity = capacity
+        self._lines: List[Optional[str]] = [None] * capacity
+        self._tags = bytearray(capacity)
+        self._first = 0  # 가장 오래된 유효 seq
+        self._next = 0   # 다음에 쓸 seq
+        self._idx = [array("q") for _ in LOG_TAGS]
+        self._idx_start = [0] * len(LOG_TAGS)
+
+    @property
+    def next_seq(self) -> int:
+        return self._next
+
+    def count(self, tag: Optional[int] = None) -> int:
+        if tag is None:
+            return self._next - self._first
+        return len(self._idx[tag]) - self._idx_start[tag]
+
+    def count_before(self, tag: Optional[int], seq: int) -> int:
+        """보기(tag 필터)에서 seq 보다 앞선 줄 수"""
+        if tag is None:
+            return min(max(0, seq - self._first), self.count())
+        idx, start = self._idx[tag], self._idx_start[tag]
+        return bisect_left(idx, seq, start) - start
+
+    def seq_at(self, tag: Optional[int], row: int) -> int:
+        if tag is None:
+            return self._first + row
+        return self._idx[tag][self._idx_start[tag] + row]
+
+    def line(self, seq: int) -> str:
+        return self._lines[seq % self.capacity]
+
+    def tag(self, seq: int) -> int:
+        return self._tags[seq % self.capacity]
+
+    def drop_before(self, seq: int):
+        """seq 앞의 줄을 지운다 (칸은 다음 append 가 덮어씀)"""
+        if seq <= self._first:
+            return
+        self._first = min(seq, self._next)
+        for t, idx in enumerate(self._idx):
+            start = bisect_left(idx, self._first, self._idx_start[t])
+            if start > _INDEX_COMPACT and start * 2 > len(idx):
+                del idx[:start]
+                start = 0
+            self._idx_start[t] = start
+
+    def append(self, line: str, tag: int):
+        """줄 하나 추가 (호출하는 쪽이 먼저 drop_before 로 자리를 비워 둔다)"""
+        seq = self._next
+        slot = seq % self.capacity
+        self._lines[slot] = line
+        self._tags[slot] = tag
+        self._idx[tag].append(seq)
+        self._next = seq + 1
+
+    def clear(self):
+        self.drop_before(self._next)
+
+
+class LogListModel(QAbstractListModel):
+    """LogRing 위의 목록 모델. append_lines 는 GUI 스레드에서만 호출한다."""
+
+    def __init__(self, capacity: int = LOG_VIEW_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.ring = LogRing(capacity)
+        self._filter: Optional[int] = None
+        self._colors = [QColor(c) if c else None for c in LOG_TAG_COLORS]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.ring.count(self._filter)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.ring.line(self.ring.seq_at(self._filter, index.row()))
+        if role == Qt.ForegroundRole:
+            return self._colors[self.ring.tag(self.ring.seq_at(self._filter, index.row()))]
+        return None
+
+    def set_filter(self, tag: Optional[int]):
+        """tag=None 이면 전체, 아니면 해당 태그 줄만"""
+        self.beginResetModel()
+        self._filter = tag
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.ring.clear()
+        self.endResetModel()
+
+    def append_lines(self, lines: Sequence[str]):
+        """
+        줄 묶음 추가. 밀려나는 줄은 행 삭제, 새 줄은 (필터에 맞는 것만) 행 추가 신호로 알려
+        보기가 전체를 다시 그리지 않게 한다.
+        """
+        ring, flt = self.ring, self._filter
+        lines = lines[-ring.capacity:]  # 한 번에 용량보다 많이 오면 어차피 밀려날 앞부분은 버림
+        tags = [log_tag_id(line) for line in lines]
+
+        new_first = ring.next_seq + len(lines) - ring.capacity
+        removed = ring.count_before(flt, new_first)
+        if removed:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            ring.drop_before(new_first)
+            self.endRemoveRows()
+        else:
+            ring.drop_before(new_first)
+
+        added = len(lines) if flt is None else tags.count(flt)
+        if added:
+            rows = ring.count(flt)
+            self.beginInsertRows(QModelIndex(), rows, rows + added - 1)
+        for line, tag in zip(lines, tags):
+            ring.append(line, tag)
+        if added:
+            self.endInsertRows()
+
+
+class LogPanel(QWidget):
+    """태그 필터 + 가상화된 로그 목록 (보이는 행만 그림, 맨 아래에 있을 때만 자동 스크롤)"""
+
+    def __init__(self, capacity: int = LOG_VIEW_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.model = LogListModel(capacity, self)
+
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)  # 행 높이 계산을 한 번만 (수만 줄에서도 스크롤 O(1))
+        self.view.setEditTriggers(QListView.NoEditTriggers)
+        self.view.setSelectionMode(QListView.ExtendedSelection)
+
+        self.cb_filter = QComboBox()
+        self.cb_filter.addItem("전체", None)
+        for i, tag in enumerate(LOG_TAGS):
+            self.cb_filter.addItem(tag or "기타(안내)", i)
+        self.cb_filter.currentIndexChanged.connect(self._on_filter_changed)
+        self.lbl_count = QLabel("0줄")
+
+        top = QHBoxLayout()
+        top.addWidget(QLabel("로그 필터"))
+        top.addWidget(self.cb_filter)
+        top.addStretch(1)
+        top.addWidget(self.lbl_count)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(top)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+    def append_lines(self, lines: Sequence[str]):
+        sb = self.view.verticalScrollBar()
+        at_bottom = sb.value() >= sb.maximum() - 1
+        self.model.append_lines(lines)
+        if at_bottom:
+            self.view.scrollToBottom()
+        self.lbl_count.setText(f"{self.model.rowCount()}줄 / 전체 {self.model.ring.count()}줄")
+
+    def _on_filter_changed(self, _index: int):
+        self.model.set_filter(self.cb_filter.currentData())
+        self.view.scrollToBottom()
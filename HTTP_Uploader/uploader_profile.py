@@ -0,0 +1,390 @@
+# 실행 프로필: GUI 입력값 전체(ClientOptions + 실행 옵션 + 전송 항목)를 JSON/TOML 로 저장/불러오기
+# - GUI 없이 uploader_cli.py 에서 같은 설정으로 전송을 시작할 수 있게 한다.
+import os
+import json
+import threading
+from datetime import datetime
+from dataclasses import dataclass, field, fields, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    tomllib = None
+
+from uploader_core import (
+    ClientOptions, GzipCache, MmapBodyCache, ConnectionPool, RateScheduler, SenderWorker, AsyncSenderEngine,
+    ProcessSenderPool, StagedSenderPool, LoadStage, EventLogWriter, BodySource, BytesBody, RandomBody,
+    POOL_IDLE_TIMEOUT,
+)
+from uploader_corpus import TemplateBody, load_base_info, load_corpus_items
+
+ENGINES = ("thread", "asyncio", "process", "process-asyncio")
+BODY_MODES = ("text", "file", "multipart")
+BODY_SOURCE_KINDS = ("bytes", "random", "template")
+
+# 프로필 "client" 섹션에서 다루지 않는 ClientOptions 필드 (항목별로 채워짐)
+_CLIENT_SKIP = {"body_text", "file_path", "body_source"}
+
+
+def make_body_sources(spec: Dict) -> List[BodySource]:
+    """
+    body_sources 항목 하나 → 메모리 바디 소스 목록 (count 개, 소스마다 seed 를 하나씩 늘림).
+    - {"kind": "bytes", "text": "..."}
+    - {"kind": "random", "size_mb": 2048, "seed": 0}  (또는 "size": 바이트 수)
+    - {"kind": "template", "template": "주민번호 {주민등록번호}", "variants": 100, "values": "base_info" 또는 {...}}
+    공통: "count", "seed", "name", "filename"
+    """
+    spec = dict(spec)
+    kind = spec.pop("kind", None)
+    if kind not in BODY_SOURCE_KINDS:
+        raise ValueError(f"kind 는 {BODY_SOURCE_KINDS} 중 하나여야 합니다: {kind}")
+    count = max(1, int(spec.pop("count", 1)))
+    seed = int(spec.pop("seed", 0))
+    name = spec.pop("name", None)
+    filename = spec.pop("filename", None)
+    data = str(spec.pop("text", "")).encode("utf-8") if kind == "bytes" else b""
+    size = int(spec.pop("size", 0)) or int(float(spec.pop("size_mb", 0)) * 1024 * 1024)
+    spec.pop("size_mb", None)
+    template = str(spec.pop("template", ""))
+    variants = int(spec.pop("variants", 1))
+    values = spec.pop("values", None)
+    if values == "base_info":
+        values = load_base_info()
+    if spec:
+        raise ValueError(f"알 수 없는 항목: {', '.join(sorted(spec))}")
+
+    sources: List[BodySource] = []
+    for i in range(count):
+        label = f"{name} #{i + 1}" if name and count > 1 else name
+        if kind == "bytes":
+            sources.append(BytesBody(data, label, filename))
+        elif kind == "random":
+            sources.append(RandomBody(size, seed + i, label, filename))
+        else:
+            sources.append(TemplateBody(template, variants, seed + i, values, label, filename))
+    return sources
+
+
+@dataclass
+class RunProfile:
+    """
+    한 번의 전송 실행 설정.
+    - client: ClientOptions 필드 그대로 (body_text/file_path 는 body_* 로 지정)
+    - threads/repeat/random_mode/log_every: 실행 옵션 (delay 는 client.delay_between)
+    - rate_rps/rate_mbps/rate_poisson: 목표 속도 (개방 루프, 설정하면 delay_between 대신 사용)
+    - stages: 부하 단계 (ramp/step/soak, thread 엔진). 있으면 threads/repeat 대신 단계가 동시 전송 수와 시간을 정함
+    - body_mode/body_text/body_file/files/folder: 전송 항목 구성 (GUI 의 본문/파일 목록과 동일)
+    - event_log/text_log: 구조화 이벤트 로그 경로, 요청별 텍스트 로그 여부
+    - body_sources: 디스크 파일 없이 메모리에서 만드는 본문 (make_body_sources 참고). 있으면 파일 목록 다음 순위
+    """
+    client: ClientOptions
+    threads: int = 4
+    repeat: int = 1               # 0이면 무한
+    random_mode: bool = False
+    log_every: int = 1
+    engine: str = "thread"        # thread / asyncio / process / process-asyncio
+    processes: int = 0            # 0이면 CPU 코어 수
+    pipeline_depth: int = 1       # 1이면 파이프라이닝 안 함 (thread / process 엔진)
+    pool_size: int = 0            # 스레드 공유 연결 풀 최대 연결 수, 0이면 스레드마다 연결 하나 (thread / process 엔진)
+    pool_min: int = 0             # 풀에 미리 맺어 두고 유지할 연결 수
+    pool_idle_sec: float = POOL_IDLE_TIMEOUT
+    rate_rps: float = 0.0         # 목표 요청 속도(req/s), 0이면 제한 없음
+    rate_mbps: float = 0.0        # 목표 바디 전송 속도(Mbps), 0이면 제한 없음
+    rate_poisson: bool = False    # 요청 간격을 포아송 도착(지수 분포)으로
+    stages: List[LoadStage] = field(default_factory=list)
+    gzip_cache_mb: int = 256
+    gzip_spill_dir: Optional[str] = None
+    mmap_cache_mb: int = 0        # 파일 본문 mmap 공유 한도, 0이면 사용 안 함
+    event_log: str = ""           # 이벤트 로그 파일(.evlog) 또는 폴더(실행마다 새 파일), 빈 값이면 기록 안 함
+    text_log: bool = True         # False 면 요청별 텍스트 로그 생략 (이벤트 로그를 uploader_events 로 변환해 봄)
+    body_mode: str = "text"       # text / file / multipart
+    body_text: str = ""
+    body_file: Optional[str] = None
+    files: List[str] = field(default_factory=list)
+    folder: str = ""
+    body_sources: List[Dict] = field(default_factory=list)
+
+    # ---------- 저장 / 불러오기 ----------
+
+    def to_dict(self) -> Dict:
+        d = asdict(self)
+        d["client"] = {k: v for k, v in d["client"].items() if k not in _CLIENT_SKIP}
+        return d
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RunProfile":
+        data = dict(data)
+        client_raw = dict(data.pop("client", {}))
+        known_client = {f.name for f in fields(ClientOptions)} - _CLIENT_SKIP
+        unknown = set(client_raw) - known_client
+        if unknown:
+            raise ValueError(f"client 섹션에 알 수 없는 항목: {', '.join(sorted(unknown))}")
+        for key in ("host", "port", "path"):
+            if key not in client_raw:
+                raise ValueError(f"client.{key} 값이 필요합니다.")
+        client_raw.setdefault("method", "POST")
+        client_raw.setdefault("keep_alive", True)
+        client_raw.setdefault("use_chunked", False)
+        client_raw.setdefault("chunk_size", 65536)
+        client_raw.setdefault("chunk_ext", "")
+        client_raw.setdefault("use_gzip", False)
+        client_raw.setdefault("use_multipart", False)
+        client_raw.setdefault("extra_headers", {})
+        client_raw.setdefault("trailing_headers", {})
+        client_raw["method"] = str(client_raw["method"]).upper()
+
+        known = {f.name for f in fields(cls)} - {"client"}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"알 수 없는 프로필 항목: {', '.join(sorted(unknown))}")
+        stages = []
+        for i, raw in enumerate(data.pop("stages", None) or [], 1):
+            try:
+                stage = LoadStage(**raw)
+                stage.validate()
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"stages {i}번째 단계가 올바르지 않습니다: {e}") from None
+            stages.append(stage)
+        for i, raw in enumerate(data.get("body_sources") or [], 1):
+            try:
+                make_body_sources(raw)
+            except (TypeError, ValueError, OSError, KeyError) as e:
+                raise ValueError(f"body_sources {i}번째 항목이 올바르지 않습니다: {e}") from None
+        prof = cls(client=ClientOptions(**client_raw), stages=stages, **data)
+        if prof.engine not in ENGINES:
+            raise ValueError(f"engine 은 {ENGINES} 중 하나여야 합니다: {prof.engine}")
+        if prof.body_mode not in BODY_MODES:
+            raise ValueError(f"body_mode 는 {BODY_MODES} 중 하나여야 합니다: {prof.body_mode}")
+        prof.client.use_multipart = prof.body_mode == "multipart"
+        return prof
+
+    @classmethod
+    def load(cls, path: str) -> "RunProfile":
+        """확장자가 .toml 이면 TOML, 그 외는 JSON 으로 읽는다."""
+        if path.lower().endswith(".toml"):
+            if tomllib is None:
+                raise RuntimeError("TOML 프로필은 Python 3.11 이상에서 지원됩니다. JSON 을 사용하세요.")
+            with open(path, "rb") as f:
+                return cls.from_dict(tomllib.load(f))
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str):
+        """JSON 으로 저장 (TOML 쓰기는 표준 라이브러리에 없음)."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    # ---------- 실행 준비 ----------
+
+    def build_base_options(self) -> ClientOptions:
+        base = ClientOptions(**{f.name: getattr(self.client, f.name) for f in fields(ClientOptions)})
+        base.extra_headers = dict(base.extra_headers)
+        base.trailing_headers = dict(base.trailing_headers)
+        base.multipart_text_fields = dict(base.multipart_text_fields)
+        base.use_multipart = self.body_mode == "multipart"
+        if self.body_mode == "text":
+            base.body_text = self.body_text.encode("utf-8")
+            base.file_path = None
+        else:
+            base.body_text = None
+            base.file_path = self.body_file
+        return base
+
+    def build_items(self, log_cb: Optional[Callable[[str], None]] = None) -> List:
+        """
+        전송 항목 목록 구성 (GUI 와 동일한 우선순위).
+        파일 목록 → 메모리 바디 소스 → 폴더(코퍼스 폴더면 manifest 순서) → 텍스트/단일 파일/빈 바디
+        텍스트는 한 번만 인코딩해 BytesBody 로 넣는다.
+        """
+        all_items: List = [p for p in self.files if os.path.isfile(p)]
+        if not all_items and self.body_sources:
+            for spec in self.body_sources:
+                all_items.extend(make_body_sources(spec))
+            if log_cb:
+                log_cb(f"[안내] 메모리 바디 소스 {len(all_items)}개를 큐에 등록.")
+
+        corpus = load_corpus_items(self.folder) if not all_items and self.folder else None
+        if corpus:
+            all_items = corpus
+            if log_cb:
+                log_cb(f"[안내] 코퍼스(manifest)에서 {len(all_items)}개 파일을 큐에 등록.")
+        elif not all_items and self.folder and os.path.isdir(self.folder):
+            for name in os.listdir(self.folder):
+                p = os.path.join(self.folder, name)
+                if os.path.isfile(p):
+                    all_items.append(p)
+            if all_items and log_cb:
+                log_cb(f"[안내] 폴더에서 {len(all_items)}개 파일을 큐에 등록.")
+
+        if not all_items:
+            if self.body_mode == "text":
+                all_items.append(BytesBody(self.body_text.encode("utf-8"), f"텍스트({len(self.body_text)}자)"))
+            elif self.body_file:
+                all_items.append(self.body_file)
+            else:
+                all_items.append(None)
+        return all_items
+
+    @property
+    def rate_enabled(self) -> bool:
+        return self.rate_rps > 0 or self.rate_mbps > 0
+
+    def rate_target_str(self) -> str:
+        parts = []
+        if self.rate_rps > 0:
+            parts.append(f"{self.rate_rps:g} req/s")
+        if self.rate_mbps > 0:
+            parts.append(f"{self.rate_mbps:g} Mbps")
+        return " / ".join(parts) + (" (포아송)" if self.rate_poisson else "")
+
+    def peak_workers(self) -> int:
+        """최대 동시 전송 수 (부하 단계가 있으면 단계 중 최댓값)"""
+        if self.stages:
+            return max(1, max(s.peak() for s in self.stages))
+        return self.threads
+
+    def event_log_path(self) -> Optional[str]:
+        """이번 실행의 이벤트 로그 파일 경로 (폴더면 그 안에 events_YYYYmmdd_HHMMSS.evlog)"""
+        if not self.event_log:
+            return None
+        if os.path.isdir(self.event_log) or self.event_log.endswith(("/", os.sep)):
+            return os.path.join(self.event_log, f"events_{datetime.now():%Y%m%d_%H%M%S}.evlog")
+        return self.event_log
+
+    def summary(self, n_items: int) -> str:
+        c = self.client
+        return (
+            f"항목 {n_items}개. 스레드={self.threads}, 반복={self.repeat if self.repeat > 0 else '무한'}, "
+            f"메서드={c.method}, {'https' if c.use_tls else 'http'}, "
+            f"{'chunked' if c.use_chunked else 'content-length'}, "
+            f"{'gzip' if c.use_gzip else 'no-gzip'}, keep-alive={c.keep_alive}, "
+            + (f"목표속도={self.rate_target_str()}, " if self.rate_enabled else
+               f"지연={int(c.delay_between * 1000)}ms, ")
+            + f"선택방식={'랜덤' if self.random_mode else '순차'}, "
+            f"로그간격={self.log_every}, 엔진={self.engine}"
+            + (f", mmap={self.mmap_cache_mb}MB" if self.mmap_cache_mb > 0 else "")
+            + (f", 파이프라인={self.pipeline_depth}" if self.pipeline_depth > 1 else "")
+            + (f", 연결풀={self.pool_min}~{self.pool_size}" if self.pool_size > 0 else "")
+            + (f", 프로세스={self.processes or os.cpu_count()}" if self.engine.startswith("process") else "")
+            + (f", 부하단계=[{'; '.join(s.label() for s in self.stages)}]" if self.stages else "")
+            + (", 이벤트로그" if self.event_log else "")
+            + ("" if self.text_log else ", 텍스트로그=끔")
+        )
+
+
+def launch_senders(
+    profile: RunProfile,
+    base: ClientOptions,
+    all_items: List,
+    log_cb,
+    status_cb,
+    stats_cb,
+    stats_batch_cb,
+    stop_event: threading.Event,
+    phase_cb=None,
+) -> Tuple[List[threading.Thread], Optional[GzipCache], Optional[EventLogWriter]]:
+    """
+    프로필의 engine 에 맞는 전송기(SenderWorker / AsyncSenderEngine / ProcessSenderPool)를 만들어 시작한다.
+    부하 단계가 있으면 thread 엔진 워커를 StagedSenderPool 이 늘리고 줄인다 (phase_cb 로 단계 변화 통지).
+    event_log 가 설정되어 있으면 EventLogWriter 를 만들어 전송기들이 끝날 때까지 기록한다
+    (호출 측은 종료 전에 close() 로 마지막 묶음까지 기록).
+    통계는 전송기별 stats_snapshot() / drain_latency() 를 주기적으로 합산해 읽는다
+    (stats_cb / stats_batch_cb 는 요청별·구간별 콜백이 따로 필요할 때만, 아니면 None).
+    반환: (시작된 스레드 목록, 공유 gzip 캐시 또는 None, 이벤트 로그 기록기 또는 None)
+    """
+    cache_cfg = None
+    if base.use_gzip and (profile.gzip_cache_mb > 0 or profile.gzip_spill_dir):
+        cache_cfg = (profile.gzip_cache_mb * 1024 * 1024, profile.gzip_spill_dir)
+
+    mmap_bytes = max(0, profile.mmap_cache_mb) * 1024 * 1024
+    use_async = profile.engine in ("asyncio", "process-asyncio")
+    if profile.pipeline_depth > 1:
+        if use_async:
+            log_cb("[안내] 파이프라이닝은 thread / process 엔진에서만 지원됩니다. 이번 실행에서는 사용하지 않습니다.")
+        elif not (base.keep_alive and base.fire_and_go):
+            log_cb("[안내] 파이프라이닝은 keep-alive 와 응답 읽기(Fire-and-go)가 켜져 있어야 합니다. 사용하지 않습니다.")
+    if base.use_tls and base.tls_session_reuse and use_async:
+        log_cb("[안내] asyncio 엔진은 TLS 세션 재개를 지원하지 않아 연결마다 전체 핸드셰이크를 합니다.")
+    pool_cfg = None
+    if profile.pool_size > 0:
+        if use_async:
+            log_cb("[안내] 연결 풀은 thread / process 엔진에서만 지원됩니다. 이번 실행에서는 사용하지 않습니다.")
+        elif base.keep_alive:
+            pool_cfg = (profile.pool_size, profile.pool_min, profile.pool_idle_sec)
+    stages = profile.stages
+    if stages and profile.engine != "thread":
+        log_cb("[안내] 부하 단계(ramp/step/soak)는 thread 엔진에서만 지원됩니다. 이번 실행에서는 사용하지 않습니다.")
+        stages = []
+    rate_cfg = None
+    if profile.rate_enabled:
+        rate_cfg = (profile.rate_rps, profile.rate_mbps, profile.rate_poisson)
+        if base.delay_between > 0:
+            log_cb("[안내] 목표 속도가 설정되어 요청 간 대기(delay)는 사용하지 않습니다.")
+    events = None
+    event_path = profile.event_log_path()
+    if event_path:
+        try:
+            meta = {"engine": profile.engine, "target": f"{base.host}:{base.port}{base.path}"}
+            events = EventLogWriter(event_path, all_items, meta=meta)
+        except OSError as e:
+            log_cb(f"[안내] 이벤트 로그 파일을 열 수 없어 기록하지 않습니다: {e}")
+    if not profile.text_log and events is None:
+        log_cb("[안내] 이벤트 로그 없이 텍스트 로그를 끌 수 없습니다. 요청별 텍스트 로그를 남깁니다.")
+    common = dict(
+        all_items=all_items, log_cb=log_cb, status_cb=status_cb, base_opts=base,
+        repeat=profile.repeat, stop_flag=stop_event, random_mode=profile.random_mode,
+        log_every=profile.log_every, text_log=profile.text_log or events is None,
+    )
+
+    gzip_cache = None
+    if profile.engine.startswith("process"):
+        # 자식 프로세스는 각자 캐시를 만든다 → 설정값만 전달
+        senders = [ProcessSenderPool(
+            processes=profile.processes or os.cpu_count() or 1, workers=profile.threads,
+            stats_batch_cb=stats_batch_cb, use_async=use_async, gzip_cache_cfg=cache_cfg,
+            mmap_max_bytes=mmap_bytes, pipeline_depth=profile.pipeline_depth, pool_cfg=pool_cfg,
+            rate_cfg=rate_cfg, events=events, **common,
+        )]
+    else:
+        gzip_cache = GzipCache(*cache_cfg) if cache_cfg else None
+        common["mmap_cache"] = MmapBodyCache(mmap_bytes) if mmap_bytes else None
+        common["scheduler"] = RateScheduler(*rate_cfg) if rate_cfg else None
+        common["events"] = events.buffer if events is not None else None
+        if use_async:
+            senders = [AsyncSenderEngine(concurrency=profile.threads, stats_cb=stats_cb, gzip_cache=gzip_cache,
+                                         **common)]
+        else:
+            pool = None
+            if pool_cfg:
+                pool = ConnectionPool(*pool_cfg, gzip_cache=gzip_cache, mmap_cache=common["mmap_cache"])
+                if pool.min_size:
+                    threading.Thread(target=_prewarm_pool, args=(pool, base, log_cb), daemon=True).start()
+            worker_args = dict(common, stats_cb=stats_cb, gzip_cache=gzip_cache,
+                               pipeline_depth=profile.pipeline_depth, pool=pool)
+            if stages:
+                # 단계가 실행 시간을 정하므로 워커는 멈추라고 할 때까지 반복
+                worker_args.update(repeat=0)
+                del worker_args["stop_flag"]
+                senders = [StagedSenderPool(
+                    stages, lambda idx, stop_evt: SenderWorker(idx=idx, stop_flag=stop_evt, **worker_args),
+                    log_cb=log_cb, stop_flag=stop_event, phase_cb=phase_cb,
+                )]
+            else:
+                senders = [SenderWorker(idx=i + 1, **worker_args) for i in range(profile.threads)]
+
+    for t in senders:
+        t.start()
+    if events is not None:
+        events.watch(senders)
+        log_cb(f"[안내] 이벤트 로그: {event_path}")
+    return senders, gzip_cache, events
+
+
+def _prewarm_pool(pool: ConnectionPool, base: ClientOptions, log_cb):
+    # 연결 풀 예열은 GUI 를 막지 않도록 별도 스레드에서
+    try:
+        n = pool.prewarm(base)
+        log_cb(f"[안내] 연결 풀 예열: {n}개 연결 준비")
+    except OSError as e:
+        log_cb(f"[안내] 연결 풀 예열 실패: {e!r}")
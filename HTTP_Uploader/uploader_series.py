@@ -0,0 +1,186 @@
+# 실행 지표 시계열: 고정 용량 ring buffer + 다중 해상도 롤업
+# - 초 단위 값을 1초(최근 1시간) / 10초(최근 하루) / 1분(최근 7일) 해상도로 동시에 쌓는다.
+# - 메모리는 실행 시간과 상관없이 일정하고, 그래프는 memoryview 슬라이스(복사 없음)로 그린다.
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from uploader_core import LatencyHistogram, LAT_PERCENTILES
+
+# (해상도 초, 보관 개수)
+SERIES_TIERS = ((1, 3600), (10, 8640), (60, 10080))
+# 늦게 도착하는 값(지연 히스토그램, 멀티프로세스 집계)을 기다리는 시간(초).
+# 이보다 오래된 초는 확정해 ring buffer 에 넣고, 그 뒤에 온 값은 버린다.
+SERIES_LATE_SEC = 5
+# 열: 구간 시작(가동 후 초), 트래픽(Mbps), 초당 성공/차단 건수, 동시 전송 수, 응답시간 백분위(ms)
+SERIES_COLUMNS = ("t", "mbps", "success", "block", "workers") + tuple(f"p{p:g}" for p in LAT_PERCENTILES)
+
+
+class RingBuffer:
+    """
+    고정 용량 float ring buffer.
+    값을 i 와 i + capacity 두 곳에 써서(이중 기록) 최근 n 개가 항상 연속 구간이 되므로
+    view() 가 복사 없는 memoryview 를 돌려준다.
+    """
+    __slots__ = ("capacity", "_buf", "_pos", "_len")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buf = array("d", bytes(16 * capacity))
+        self._pos = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, v: float):
+        pos = self._pos
+        self._buf[pos] = v
+        self._buf[pos + self.capacity] = v
+        self._pos = pos + 1 if pos + 1 < self.capacity else 0
+        if self._len < self.capacity:
+            self._len += 1
+
+    def view(self, n: Optional[int] = None) -> memoryview:
+        """오래된 값 → 최근 값 순으로 마지막 n 개 (기본: 전부)"""
+        n = self._len if n is None else min(n, self._len)
+        end = self._pos + self.capacity
+        return memoryview(self._buf)[end - n:end]
+
+
+class _Tier:
+    """한 해상도의 열별 ring buffer + 아직 닫히지 않은 구간의 누적값"""
+    __slots__ = ("res", "cols", "_start", "_n", "_sum", "_workers", "_lat")
+
+    def __init__(self, res: int, capacity: int):
+        self.res = res
+        self.cols = {name: RingBuffer(capacity) for name in SERIES_COLUMNS}
+        self._start = 0  # 현재 구간 시작 초
+        self._reset()
+
+    def _reset(self):
+        self._n = 0
+        self._sum = [0.0, 0.0, 0.0]  # bytes, success, block
+        self._workers = 0
+        self._lat = LatencyHistogram()
+
+    def push(self, nbytes: float, success: float, block: float, workers: int, lat: Optional[LatencyHistogram]):
+        """확정된 1초 값을 더하고, 구간이 다 차면 닫는다"""
+        s = self._sum
+        s[0] += nbytes
+        s[1] += success
+        s[2] += block
+        self._workers = workers
+        if lat is not None:
+            self._lat.merge(lat)
+        self._n += 1
+        if self._n >= self.res:
+            self.close()
+
+    def close(self):
+        """현재 구간을 초당 평균 / 구간 전체 백분위로 닫아 ring buffer 에 넣는다 (빈 구간은 무시)"""
+        n = self._n
+        if not n:
+            return
+        cols, s = self.cols, self._sum
+        cols["t"].append(self._start)
+        cols["mbps"].append(s[0] * 8.0 / 1_000_000 / n)
+        cols["success"].append(s[1] / n)
+        cols["block"].append(s[2] / n)
+        cols["workers"].append(self._workers)
+        for p in LAT_PERCENTILES:
+            cols[f"p{p:g}"].append(self._lat.percentile(p))
+        self._start += n
+        self._reset()
+
+    def covers(self, seconds: int) -> bool:
+        return seconds <= self.res * self.cols["t"].capacity
+
+
+class RunSeries:
+    """
+    실행 하나의 초 단위 지표 시계열 (호출하는 쪽에서 잠금).
+    add / set_workers / add_latency 로 아직 열린 최근 초에 값을 모으고,
+    advance(now) 가 late_sec 보다 오래된 초를 순서대로 확정해 모든 해상도에 넣는다.
+    값이 없던 초는 0 (동시 전송 수는 직전 값 유지).
+    """
+
+    def __init__(self, tiers: Tuple[Tuple[int, int], ...] = SERIES_TIERS, late_sec: int = SERIES_LATE_SEC):
+        self.tiers = [_Tier(res, cap) for res, cap in tiers]
+        self.late_sec = late_sec
+        self.has_workers = False
+        self.finished = False
+        self._next = 0  # 다음에 확정할 초
+        self._open: Dict[int, List] = {}  # sec -> [bytes, success, block, workers 또는 None, 히스토그램 또는 None]
+        self._workers = 0
+
+    def _slot(self, sec: int) -> Optional[List]:
+        if sec < self._next:
+            return None  # 이미 확정된 초
+        slot = self._open.get(sec)
+        if slot is None:
+            slot = self._open[sec] = [0, 0, 0, None, None]
+        return slot
+
+    def add(self, sec: int, nbytes: float, success: float, block: float):
+        slot = self._slot(sec)
+        if slot is not None:
+            slot[0] += nbytes
+            slot[1] += success
+            slot[2] += block
+
+    def set_workers(self, sec: int, workers: int):
+        self.has_workers = True
+        slot = self._slot(sec)
+        if slot is not None:
+            slot[3] = workers
+
+    def add_latency(self, sec: int, hist: LatencyHistogram):
+        slot = self._slot(sec)
+        if slot is None:
+            return
+        if slot[4] is None:
+            slot[4] = LatencyHistogram()
+        slot[4].merge(hist)
+
+    def advance(self, now_sec: int):
+        """now_sec - late_sec 이전의 초를 확정 (finish 뒤에는 무시)"""
+        if not self.finished:
+            self._commit_until(now_sec - self.late_sec)
+
+    def finish(self):
+        """열린 초를 모두 확정하고 덜 찬 구간도 닫는다 (실행 종료 후 한 번)"""
+        if self.finished:
+            return
+        self.finished = True
+        if self._open:
+            self._commit_until(max(self._open) + 1)
+        for tier in self.tiers:
+            tier.close()
+
+    def _commit_until(self, end_sec: int):
+        sec = self._next
+        while sec < end_sec:
+            slot = self._open.pop(sec, None)
+            if slot is None:
+                nbytes = success = block = 0
+                lat = None
+            else:
+                nbytes, success, block, workers, lat = slot
+                if workers is not None:
+                    self._workers = workers
+            for tier in self.tiers:
+                tier.push(nbytes, success, block, self._workers, lat)
+            sec += 1
+        self._next = max(self._next, sec)
+
+    def seconds(self) -> int:
+        """확정된 초 수"""
+        return self._next
+
+    def view(self) -> Tuple[int, Dict[str, memoryview]]:
+        """
+        (해상도 초, 열별 memoryview). 실행 전체를 담는 가장 세밀한 해상도를 고르고,
+        어느 것도 못 담으면 가장 거친 해상도의 최근 구간.
+        """
+        tier = next((t for t in self.tiers if t.covers(self._next)), self.tiers[-1])
+        return tier.res, {name: ring.view() for name, ring in tier.cols.items()}